@@ -2,24 +2,42 @@
 """Create DynamoDB tables for local development."""
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Table creation is dominated by DescribeTable polling, so overlap the waits.
+MAX_WORKERS = 8
+
+# Size the connection pool above MAX_WORKERS so concurrent workers reuse
+# keep-alive connections instead of re-handshaking on pool overflow.
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+
+# DynamoDB Local activates tables almost immediately; poll every second rather
+# than the waiter's default 20s
+WAITER_CONFIG = {"Delay": 1, "MaxAttempts": 60}
 
 
 def create_table(
-    dynamodb_resource: boto3.resource,
+    dynamodb_client: boto3.client,
     table_name: str,
     has_sort_key: bool = True,
 ) -> None:
     """Create a DynamoDB table if it doesn't exist.
 
     Args:
-        dynamodb_resource: The boto3 DynamoDB resource.
+        dynamodb_client: The boto3 DynamoDB client (thread-safe, shared by workers).
         table_name: The name of the table to create.
         has_sort_key: Whether the table uses a composite key (pk + sk).
             If False, the table uses pk only.
@@ -32,13 +50,15 @@ def create_table(
         attribute_definitions.append({"AttributeName": "sk", "AttributeType": "S"})
 
     try:
-        table = dynamodb_resource.create_table(
+        dynamodb_client.create_table(
             TableName=table_name,
             KeySchema=key_schema,
             AttributeDefinitions=attribute_definitions,
             BillingMode="PAY_PER_REQUEST",
         )
-        table.wait_until_exists()
+        dynamodb_client.get_waiter("table_exists").wait(
+            TableName=table_name, WaiterConfig=WAITER_CONFIG
+        )
         print(f"Created table: {table_name}")
     except ClientError as e:
         if e.response["Error"]["Code"] == "ResourceInUseException":
@@ -48,7 +68,7 @@ def create_table(
 
 
 def create_table_with_gsi(
-    dynamodb_resource: boto3.resource,
+    dynamodb_client: boto3.client,
     table_name: str,
     gsi_name: str,
     gsi_pk_attr: str,
@@ -58,7 +78,7 @@ def create_table_with_gsi(
     """Create a DynamoDB table with a composite key (pk + sk) and a GSI.
 
     Args:
-        dynamodb_resource: The boto3 DynamoDB resource.
+        dynamodb_client: The boto3 DynamoDB client (thread-safe, shared by workers).
         table_name: The name of the table to create.
         gsi_name: Name of the Global Secondary Index.
         gsi_pk_attr: Partition key attribute name for the GSI.
@@ -76,35 +96,162 @@ def create_table_with_gsi(
     if gsi_pk_attr not in gsi_pk_names:
         attribute_definitions.append({"AttributeName": gsi_pk_attr, "AttributeType": "S"})
 
+    gsi = {
+        "IndexName": gsi_name,
+        "KeySchema": [
+            {"AttributeName": gsi_pk_attr, "KeyType": "HASH"},
+            {"AttributeName": gsi_sk_attr, "KeyType": "RANGE"},
+        ],
+        "Projection": {"ProjectionType": "ALL"},
+    }
+
     try:
-        table = dynamodb_resource.create_table(
+        dynamodb_client.create_table(
             TableName=table_name,
             KeySchema=[
                 {"AttributeName": "pk", "KeyType": "HASH"},
                 {"AttributeName": "sk", "KeyType": "RANGE"},
             ],
             AttributeDefinitions=attribute_definitions,
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": gsi_name,
-                    "KeySchema": [
-                        {"AttributeName": gsi_pk_attr, "KeyType": "HASH"},
-                        {"AttributeName": gsi_sk_attr, "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                },
-            ],
+            GlobalSecondaryIndexes=[gsi],
             BillingMode="PAY_PER_REQUEST",
         )
-        table.wait_until_exists()
+        dynamodb_client.get_waiter("table_exists").wait(
+            TableName=table_name, WaiterConfig=WAITER_CONFIG
+        )
         print(f"Created table: {table_name} (with GSI: {gsi_name})")
     except ClientError as e:
         if e.response["Error"]["Code"] == "ResourceInUseException":
             print(f"Table already exists: {table_name}")
+            add_missing_gsi(dynamodb_client, table_name, gsi, attribute_definitions)
         else:
             raise
 
 
+def add_missing_gsi(
+    dynamodb_client: boto3.client,
+    table_name: str,
+    gsi: dict[str, Any],
+    attribute_definitions: list[dict[str, str]],
+) -> None:
+    """Add a GSI to an existing table that was created before the index existed.
+
+    Args:
+        dynamodb_client: The boto3 DynamoDB client.
+        table_name: The name of the existing table.
+        gsi: The GSI definition, as passed to create_table.
+        attribute_definitions: Attribute definitions covering the GSI keys.
+    """
+    table = dynamodb_client.describe_table(TableName=table_name)["Table"]
+    existing = {index["IndexName"] for index in table.get("GlobalSecondaryIndexes", [])}
+    if gsi["IndexName"] in existing:
+        return
+
+    dynamodb_client.update_table(
+        TableName=table_name,
+        AttributeDefinitions=attribute_definitions,
+        GlobalSecondaryIndexUpdates=[{"Create": gsi}],
+    )
+    wait_for_gsi(dynamodb_client, table_name, gsi["IndexName"])
+    print(f"Added GSI to existing table: {table_name} ({gsi['IndexName']})")
+
+
+def wait_for_gsi(dynamodb_client: boto3.client, table_name: str, index_name: str) -> None:
+    """Block until a newly added GSI has finished backfilling.
+
+    The table_exists waiter returns while the index is still CREATING, and
+    queries against it fail until its IndexStatus reaches ACTIVE.
+
+    Args:
+        dynamodb_client: The boto3 DynamoDB client.
+        table_name: The name of the table the index was added to.
+        index_name: The name of the index to wait for.
+
+    Raises:
+        TimeoutError: If the index is not ACTIVE after the waiter's max attempts.
+    """
+    for _ in range(WAITER_CONFIG["MaxAttempts"]):
+        table = dynamodb_client.describe_table(TableName=table_name)["Table"]
+        statuses = {
+            index["IndexName"]: index["IndexStatus"]
+            for index in table.get("GlobalSecondaryIndexes", [])
+        }
+        if statuses.get(index_name) == "ACTIVE":
+            return
+        time.sleep(WAITER_CONFIG["Delay"])
+    raise TimeoutError(f"GSI {index_name} on {table_name} did not become ACTIVE")
+
+
+def backfill_todo_counters(dynamodb_client: boto3.client, table_name: str) -> None:
+    """Set item_count and completed_count on todo lists from their ITEM# rows.
+
+    Lists created before the counters existed have neither attribute, and
+    the first ADD on such a list starts counting from zero. This recounts
+    every list and corrects any stored value that disagrees. Each write is
+    conditional on the values read during the scan, so a list changed by the
+    app in the meantime is skipped rather than overwritten.
+
+    Args:
+        dynamodb_client: The boto3 DynamoDB client.
+        table_name: The name of the todos table.
+    """
+    counters = ("item_count", "completed_count")
+    stored: dict[tuple[str, str], dict[str, int | None]] = {}
+    actual: dict[tuple[str, str], dict[str, int]] = {}
+
+    paginator = dynamodb_client.get_paginator("scan")
+    for page in paginator.paginate(
+        TableName=table_name,
+        ProjectionExpression="pk, sk, item_count, completed_count, #completed",
+        ExpressionAttributeNames={"#completed": "completed"},
+    ):
+        for item in page["Items"]:
+            pk = item["pk"]["S"]
+            kind, list_id = item["sk"]["S"].split("#")[:2]
+            if kind == "LIST":
+                stored[(pk, list_id)] = {
+                    field: int(item[field]["N"]) if field in item else None
+                    for field in counters
+                }
+            elif kind == "ITEM":
+                counts = actual.setdefault((pk, list_id), dict.fromkeys(counters, 0))
+                counts["item_count"] += 1
+                if item.get("completed", {}).get("BOOL"):
+                    counts["completed_count"] += 1
+
+    updated = 0
+    for key, current in stored.items():
+        counts = actual.get(key, dict.fromkeys(counters, 0))
+        if current == counts:
+            continue
+        conditions: list[str] = []
+        values: dict[str, dict[str, str]] = {}
+        for field in counters:
+            values[f":{field}"] = {"N": str(counts[field])}
+            if current[field] is None:
+                conditions.append(f"attribute_not_exists({field})")
+            else:
+                conditions.append(f"{field} = :old_{field}")
+                values[f":old_{field}"] = {"N": str(current[field])}
+        pk, list_id = key
+        try:
+            dynamodb_client.update_item(
+                TableName=table_name,
+                Key={"pk": {"S": pk}, "sk": {"S": f"LIST#{list_id}"}},
+                UpdateExpression=(
+                    "SET item_count = :item_count, completed_count = :completed_count"
+                ),
+                ConditionExpression=" AND ".join(conditions),
+                ExpressionAttributeValues=values,
+            )
+            updated += 1
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+    if updated:
+        print(f"Backfilled counters on {updated} todo lists in: {table_name}")
+
+
 def main() -> None:
     """Main entry point."""
     endpoint_url = os.environ["DYNAMODB_ENDPOINT_URL"]
@@ -112,38 +259,76 @@ def main() -> None:
     access_key = os.environ["AWS_ACCESS_KEY_ID"]
     secret_key = os.environ["AWS_SECRET_ACCESS_KEY"]
 
-    dynamodb = boto3.resource(
+    dynamodb = boto3.client(
         "dynamodb",
         endpoint_url=endpoint_url,
         region_name=region,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
+        config=CLIENT_CONFIG,
     )
 
     print(f"Connecting to local DynamoDB at {endpoint_url}")
 
     # Create tables with composite keys (pk + sk)
     composite_key_tables = [
-        os.environ["DYNAMODB_PAIRS_TABLE"],
         os.environ["DYNAMODB_LOGS_TABLE"],
-        os.environ["DYNAMODB_CALENDAR_TABLE"],
         os.environ["DYNAMODB_CONVERSATIONS_TABLE"],
         os.environ["DYNAMODB_MESSAGES_TABLE"],
     ]
-    for table_name in composite_key_tables:
-        create_table(dynamodb, table_name, has_sort_key=True)
-
-    # Create users table with pk only (email is the partition key)
-    create_table(dynamodb, os.environ["DYNAMODB_USERS_TABLE"], has_sort_key=False)
-
-    # Create todos table with GSI for completed_at stats queries
-    create_table_with_gsi(
-        dynamodb,
-        os.environ["DYNAMODB_TODOS_TABLE"],
-        gsi_name="pk_completed_at_index",
-        gsi_pk_attr="pk",
-        gsi_sk_attr="completed_at",
-    )
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [
+            executor.submit(create_table, dynamodb, table_name, True)
+            for table_name in composite_key_tables
+        ]
+
+        # Create users table with pk only (email is the partition key)
+        futures.append(
+            executor.submit(create_table, dynamodb, os.environ["DYNAMODB_USERS_TABLE"], False)
+        )
+
+        # Create pairs table with GSI for created_at stats queries
+        futures.append(
+            executor.submit(
+                create_table_with_gsi,
+                dynamodb,
+                os.environ["DYNAMODB_PAIRS_TABLE"],
+                gsi_name="pk_created_at_index",
+                gsi_pk_attr="pk",
+                gsi_sk_attr="created_at",
+            )
+        )
+
+        # Create todos table with GSI for completed_at stats queries
+        futures.append(
+            executor.submit(
+                create_table_with_gsi,
+                dynamodb,
+                os.environ["DYNAMODB_TODOS_TABLE"],
+                gsi_name="pk_completed_at_index",
+                gsi_pk_attr="pk",
+                gsi_sk_attr="completed_at",
+            )
+        )
+
+        # Create calendar table with GSI for single-event lookups by event_id
+        futures.append(
+            executor.submit(
+                create_table_with_gsi,
+                dynamodb,
+                os.environ["DYNAMODB_CALENDAR_TABLE"],
+                gsi_name="pk_event_id_index",
+                gsi_pk_attr="pk",
+                gsi_sk_attr="event_id",
+            )
+        )
+
+        # Surface the first failure, if any
+        for future in as_completed(futures):
+            future.result()
+
+    # Lists created before the todo counters existed need them filled in
+    backfill_todo_counters(dynamodb, os.environ["DYNAMODB_TODOS_TABLE"])
 
     print("Done!")
 
@@ -5,6 +5,7 @@ import os
 
 from dotenv import load_dotenv
 from pinecone import Pinecone, ServerlessSpec
+from pinecone.exceptions import NotFoundException
 
 load_dotenv()
 
@@ -20,10 +21,13 @@ def main() -> None:
 
     pc = Pinecone(api_key=api_key)
 
-    existing = [i.name for i in pc.list_indexes()]
-    if index_name in existing:
+    # A single describe call avoids enumerating every index in the project
+    try:
+        pc.describe_index(index_name)
         print(f"Index already exists: {index_name}")
         return
+    except NotFoundException:
+        pass
 
     pc.create_index(
         name=index_name,
@@ -5,6 +5,13 @@ from typing import Literal
 from deepthought.agents.state import AgentState
 from deepthought.models.agents import VerificationStatus
 
+# Verification outcome -> next node; only failures go back to execution
+_VERIFICATION_ROUTES: dict[VerificationStatus, Literal["response", "retry_execution"]] = {
+    VerificationStatus.PASSED: "response",
+    VerificationStatus.SKIPPED: "response",
+    VerificationStatus.FAILED: "retry_execution",
+}
+
 
 def route_after_orchestrator(state: AgentState) -> Literal["execution", "error"]:
     """
@@ -20,9 +27,9 @@ def route_after_orchestrator(state: AgentState) -> Literal["execution", "error"]
     Returns:
         The next node to route to.
     """
-    if state.get("error") or state.get("plan") is None:
-        return "error"
-    return "execution"
+    error = state.get("error")
+    plan = state.get("plan")
+    return "error" if error or plan is None else "execution"
 
 
 def route_after_execution(
@@ -47,13 +54,10 @@ def route_after_execution(
     if execution_result is None:
         return "error"
 
-    if not execution_result.success:
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 3:
-            return "retry"
-        return "error"
+    if execution_result.success:
+        return "verification"
 
-    return "verification"
+    return "retry" if state.get("retry_count", 0) < 3 else "error"
 
 
 def route_after_verification(
@@ -78,10 +82,8 @@ def route_after_verification(
     if verification_result is None:
         return "error"
 
-    if verification_result.overall_status == VerificationStatus.FAILED:
-        retry_count = state.get("retry_count", 0)
-        if retry_count < 2:
-            return "retry_execution"
-        return "error"
+    route = _VERIFICATION_ROUTES[verification_result.overall_status]
+    if route == "response":
+        return route
 
-    return "response"
+    return route if state.get("retry_count", 0) < 2 else "error"
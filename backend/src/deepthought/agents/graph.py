@@ -1,5 +1,7 @@
 """LangGraph StateGraph definition for the multi-agent system."""
 
+from functools import lru_cache
+
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
@@ -101,12 +103,15 @@ def create_agent_graph() -> StateGraph[AgentState]:
     return builder
 
 
+@lru_cache(maxsize=1)
 def compile_graph() -> CompiledStateGraph:
     """
     Compile the graph for execution.
 
+    The graph is compiled once per process; compiled graphs hold no
+    per-invocation state, so every caller shares the same instance.
+
     Returns:
         The compiled graph ready for invocation.
     """
-    builder = create_agent_graph()
-    return builder.compile()
+    return create_agent_graph().compile()
@@ -85,6 +85,26 @@ async def execution_node(state: AgentState) -> dict[str, Any]:
                 continue
 
             executed_steps.append(step.step_number)
+
+            # Reuse the item the orchestrator fetched while planning
+            prefetched_item = state.get("prefetched_item")
+            if (
+                prefetched_item is not None
+                and step.parameters.get("pk") == input_params.get("partition_key")
+                and step.parameters.get("sk") == input_params.get("sort_key")
+            ):
+                db_item = prefetched_item
+                tool_results.append(
+                    ToolCallResult(
+                        tool_name="query_dynamodb",
+                        input_params=step.parameters,
+                        output=prefetched_item,
+                        success=True,
+                        execution_time_ms=0.0,
+                    )
+                )
+                continue
+
             # Execute DynamoDB query
             start_time = time.perf_counter()
             try:
@@ -188,9 +208,17 @@ async def execution_node(state: AgentState) -> dict[str, Any]:
         "execution_result": execution_result,
         "current_step": "execution_complete",
         "node_timings": {"execution": duration_ms},
-        "messages": [AIMessage(content=f"Executed {len(tool_results)} tools, operation: {operation}, result: {final_value}")],
     }
 
+    # Nothing downstream reads the message history; only carry it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        result["messages"] = [
+            AIMessage(
+                content=f"Executed {len(tool_results)} tools, operation: {operation}, "
+                f"result: {final_value}"
+            )
+        ]
+
     if not success:
         new_retry = state.get("retry_count", 0) + 1
         result["retry_count"] = new_retry
@@ -1,17 +1,20 @@
 """Orchestrator agent node - creates comprehensive plans for task execution using LLM reasoning."""
 
-import json
+import asyncio
 import logging
+import re
 import time
 from datetime import datetime, timezone
 from typing import Any
 
-from langchain_core.messages import AIMessage, HumanMessage
+import orjson
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
 from deepthought.agents.prompts import ORCHESTRATOR_SYSTEM_PROMPT
 from deepthought.agents.state import AgentState
 from deepthought.llm import get_llm
 from deepthought.models.agents import Plan, PlanStep, PlanStepType
+from deepthought.tools import query_dynamodb
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,23 @@ OPERATION_TO_FUNCTION = {
     "divide": "divide_values",
 }
 
+# Fenced ```json / ``` block holding an object, or failing that the outermost braces
+_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_BRACE_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Per-request user message; the system prompt is sent separately so providers
+# can cache it as a stable prefix
+_USER_TPL = (
+    "Task: {task}\n"
+    "\n"
+    "Input Parameters:\n"
+    "- Partition Key: {pk}\n"
+    "- Sort Key: {sk}\n"
+    "- Requested Operation: {operation}\n"
+    "\n"
+    "Please create an execution plan for this calculation task.\n"
+)
+
 
 def _parse_llm_plan(response_text: str, state: AgentState) -> Plan:
     """Parse the LLM response into a Plan object.
@@ -47,53 +67,45 @@ def _parse_llm_plan(response_text: str, state: AgentState) -> Plan:
     """
     # Try to extract JSON from the response
     try:
-        # Look for JSON block in response
-        if "```json" in response_text:
-            json_start = response_text.find("```json") + 7
-            json_end = response_text.find("```", json_start)
-            json_str = response_text[json_start:json_end].strip()
-        elif "```" in response_text:
-            json_start = response_text.find("```") + 3
-            json_end = response_text.find("```", json_start)
-            json_str = response_text[json_start:json_end].strip()
-        elif "{" in response_text:
-            # Try to find JSON object directly
-            json_start = response_text.find("{")
-            json_end = response_text.rfind("}") + 1
-            json_str = response_text[json_start:json_end]
+        match = _JSON_RE.search(response_text)
+        if match:
+            json_str = match.group(1)
         else:
-            raise ValueError("No JSON found in response")
+            match = _BRACE_RE.search(response_text)
+            if match is None:
+                raise ValueError("No JSON found in response")
+            json_str = match.group(0)
 
-        plan_data = json.loads(json_str)
-    except json.JSONDecodeError as e:
+        plan_data = orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
         logger.warning(f"Failed to parse LLM response as JSON: {e}")
         raise ValueError(f"Invalid JSON in LLM response: {e}")
 
     # Extract operation
     operation = plan_data.get("operation", "add")
 
-    # Build PlanStep objects
-    steps = []
-    for step_data in plan_data.get("steps", []):
-        action = step_data.get("action", "")
-        step_type = ACTION_TO_STEP_TYPE.get(action, PlanStepType.EXECUTE_FUNCTION)
-
-        # Build parameters
-        parameters = step_data.get("parameters", {})
-        if action == "execute_operation":
-            # Add the function name based on operation
-            parameters["function"] = OPERATION_TO_FUNCTION.get(operation, "add_values")
-            parameters["operation"] = operation
-
-        steps.append(
-            PlanStep(
-                step_number=step_data.get("step_number", len(steps) + 1),
-                step_type=step_type,
-                description=step_data.get("description", ""),
-                parameters=parameters,
-                depends_on=step_data.get("depends_on", []),
-            )
+    # The function name depends only on the operation, so resolve it once
+    operation_params = {
+        "function": OPERATION_TO_FUNCTION.get(operation, "add_values"),
+        "operation": operation,
+    }
+    step_type_for = ACTION_TO_STEP_TYPE.get
+
+    # Build PlanStep objects; execute steps get the function/operation merged in
+    steps = [
+        PlanStep(
+            step_number=step_data.get("step_number", i),
+            step_type=step_type_for(step_data.get("action", ""), PlanStepType.EXECUTE_FUNCTION),
+            description=step_data.get("description", ""),
+            parameters=(
+                {**step_data.get("parameters", {}), **operation_params}
+                if step_data.get("action") == "execute_operation"
+                else step_data.get("parameters", {})
+            ),
+            depends_on=step_data.get("depends_on", ()),
         )
+        for i, step_data in enumerate(plan_data.get("steps", ()), start=1)
+    ]
 
     return Plan(
         plan_id=state["request_id"],
@@ -104,6 +116,48 @@ def _parse_llm_plan(response_text: str, state: AgentState) -> Plan:
     )
 
 
+def _build_fallback_steps(operation: str) -> tuple[PlanStep, ...]:
+    """Build the operation-dependent steps of the fallback plan.
+
+    Args:
+        operation: The operation to perform.
+
+    Returns:
+        The execute, verify and format steps (steps 2-4).
+    """
+    function_name = OPERATION_TO_FUNCTION.get(operation, "add_values")
+
+    return (
+        PlanStep(
+            step_number=2,
+            step_type=PlanStepType.EXECUTE_FUNCTION,
+            description=f"Perform {operation} operation on val1 and val2",
+            parameters={"function": function_name, "operation": operation},
+            depends_on=[1],
+        ),
+        PlanStep(
+            step_number=3,
+            step_type=PlanStepType.VERIFY_RESULT,
+            description=f"Verify the {operation} result is correct",
+            parameters={"operation": operation},
+            depends_on=[1, 2],
+        ),
+        PlanStep(
+            step_number=4,
+            step_type=PlanStepType.FORMAT_RESPONSE,
+            description="Format verified result into JSON response",
+            parameters={"operation": operation},
+            depends_on=[3],
+        ),
+    )
+
+
+# Fallback steps only vary by operation, so build them once per known operation
+_FALLBACK_STEPS = {
+    operation: _build_fallback_steps(operation) for operation in OPERATION_TO_FUNCTION
+}
+
+
 def _create_fallback_plan(state: AgentState) -> Plan:
     """Create a fallback plan when LLM fails.
 
@@ -117,7 +171,7 @@ def _create_fallback_plan(state: AgentState) -> Plan:
     """
     input_params = state["input_params"]
     operation = input_params.get("operation", "add")
-    function_name = OPERATION_TO_FUNCTION.get(operation, "add_values")
+    templates = _FALLBACK_STEPS.get(operation) or _build_fallback_steps(operation)
 
     return Plan(
         plan_id=state["request_id"],
@@ -134,32 +188,39 @@ def _create_fallback_plan(state: AgentState) -> Plan:
                 },
                 depends_on=[],
             ),
-            PlanStep(
-                step_number=2,
-                step_type=PlanStepType.EXECUTE_FUNCTION,
-                description=f"Perform {operation} operation on val1 and val2",
-                parameters={"function": function_name, "operation": operation},
-                depends_on=[1],
-            ),
-            PlanStep(
-                step_number=3,
-                step_type=PlanStepType.VERIFY_RESULT,
-                description=f"Verify the {operation} result is correct",
-                parameters={"operation": operation},
-                depends_on=[1, 2],
-            ),
-            PlanStep(
-                step_number=4,
-                step_type=PlanStepType.FORMAT_RESPONSE,
-                description="Format verified result into JSON response",
-                parameters={"operation": operation},
-                depends_on=[3],
-            ),
+            *(step.model_copy(deep=True) for step in templates),
         ],
-        expected_outcome=f"Structured JSON with val1, val2, {operation} result, and verification status",
+        expected_outcome=(
+            f"Structured JSON with val1, val2, {operation} result, and verification status"
+        ),
     )
 
 
+async def _prefetch_item(input_params: dict[str, Any]) -> dict[str, Any] | None:
+    """Speculatively fetch the calculation item named by the input params.
+
+    Skipped when the values were passed in directly. Failures are swallowed
+    so execution can fall back to querying DynamoDB itself.
+
+    Args:
+        input_params: The request input parameters.
+
+    Returns:
+        The item if it was found, None otherwise.
+    """
+    if "val1" in input_params and "val2" in input_params:
+        return None
+
+    try:
+        item: dict[str, Any] | None = await query_dynamodb.ainvoke(
+            {"pk": input_params["partition_key"], "sk": input_params["sort_key"]}
+        )
+        return item
+    except Exception as e:
+        logger.debug(f"Item prefetch failed, execution will query directly: {e}")
+        return None
+
+
 async def orchestrator_node(state: AgentState) -> dict[str, Any]:
     """
     Orchestrator agent: Uses LLM to create a comprehensive step-by-step plan.
@@ -173,58 +234,65 @@ async def orchestrator_node(state: AgentState) -> dict[str, Any]:
         state: Current agent state with request context.
 
     Returns:
-        Updated state with the generated plan.
+        Updated state with the generated plan and any prefetched item.
     """
-    start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     input_params = state["input_params"]
 
     # Build the user message with task details
-    user_message = f"""
-Task: {state["task_description"]}
+    user_message = _USER_TPL.format(
+        task=state["task_description"],
+        pk=input_params["partition_key"],
+        sk=input_params["sort_key"],
+        operation=input_params.get("operation", "add"),
+    )
 
-Input Parameters:
-- Partition Key: {input_params["partition_key"]}
-- Sort Key: {input_params["sort_key"]}
-- Requested Operation: {input_params.get("operation", "add")}
+    async with asyncio.TaskGroup() as tg:
+        # Fetch the item execution will need while the LLM is planning
+        prefetch_task = tg.create_task(_prefetch_item(input_params))
+
+        try:
+            # Get the LLM and invoke it
+            llm = get_llm()
+            messages = [
+                SystemMessage(content=ORCHESTRATOR_SYSTEM_PROMPT),
+                HumanMessage(content=user_message),
+            ]
+
+            response = await llm.ainvoke(messages)
+            response_text = response.content if hasattr(response, "content") else str(response)
+
+            logger.debug(f"Orchestrator LLM response: {response_text}")
+
+            # Parse the LLM response into a Plan
+            logger.info(f"Orchestrator LLM raw response: {response_text[:500]}")
+            plan = _parse_llm_plan(response_text, state)
+            logger.info(
+                f"Parsed plan: {len(plan.steps)} steps, "
+                f"types={[s.step_type.value for s in plan.steps]}"
+            )
+            summary = (
+                f"Created plan with {len(plan.steps)} steps for "
+                f"{input_params.get('operation', 'add')} operation"
+            )
 
-Please create an execution plan for this calculation task.
-"""
+        except Exception as e:
+            logger.warning(f"LLM planning failed, using fallback: {e}")
 
-    try:
-        # Get the LLM and invoke it
-        llm = get_llm()
-        messages = [
-            HumanMessage(content=ORCHESTRATOR_SYSTEM_PROMPT + user_message)
-        ]
-
-        response = await llm.ainvoke(messages)
-        response_text = response.content if hasattr(response, "content") else str(response)
-
-        logger.debug(f"Orchestrator LLM response: {response_text}")
-
-        # Parse the LLM response into a Plan
-        logger.info(f"Orchestrator LLM raw response: {response_text[:500]}")
-        plan = _parse_llm_plan(response_text, state)
-        logger.info(f"Parsed plan: {len(plan.steps)} steps, types={[s.step_type.value for s in plan.steps]}")
-
-        duration_ms = (time.perf_counter() - start_time) * 1000
-        return {
-            "plan": plan,
-            "current_step": "orchestrator_complete",
-            "node_timings": {"orchestrator": duration_ms},
-            "messages": [AIMessage(content=f"Created plan with {len(plan.steps)} steps for {input_params.get('operation', 'add')} operation")],
-        }
+            # Use fallback plan if LLM fails
+            plan = _create_fallback_plan(state)
+            summary = f"Created fallback plan with {len(plan.steps)} steps (LLM unavailable)"
 
-    except Exception as e:
-        logger.warning(f"LLM planning failed, using fallback: {e}")
-
-        # Use fallback plan if LLM fails
-        plan = _create_fallback_plan(state)
-
-        duration_ms = (time.perf_counter() - start_time) * 1000
-        return {
-            "plan": plan,
-            "current_step": "orchestrator_complete",
-            "node_timings": {"orchestrator": duration_ms},
-            "messages": [AIMessage(content=f"Created fallback plan with {len(plan.steps)} steps (LLM unavailable)")],
-        }
+    duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+    result: dict[str, Any] = {
+        "plan": plan,
+        "prefetched_item": prefetch_task.result(),
+        "current_step": "orchestrator_complete",
+        "node_timings": {"orchestrator": duration_ms},
+    }
+
+    # Nothing downstream reads the message history; only carry it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        result["messages"] = [AIMessage(content=summary)]
+
+    return result
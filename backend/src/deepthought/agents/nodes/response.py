@@ -8,10 +8,57 @@ from langchain_core.messages import AIMessage
 
 from deepthought.agents.state import AgentState
 from deepthought.models.agents import FormattedResponse, VerificationStatus
-from deepthought.tools import format_json
+from deepthought.tools import TOOL_TO_OP, format_json
 
 logger = logging.getLogger(__name__)
 
+_QUERY_TOOL = "query_dynamodb"
+_CALC_TOOLS = frozenset(TOOL_TO_OP)
+
+
+def _node_output(formatted: FormattedResponse, start_ns: int, summary: str) -> dict[str, Any]:
+    """Build the state update returned by the response node.
+
+    Args:
+        formatted: The formatted response.
+        start_ns: perf_counter_ns() reading taken when the node was entered.
+        summary: Message recorded in the history when debug logging is on.
+
+    Returns:
+        The state update.
+    """
+    result: dict[str, Any] = {
+        "formatted_response": formatted,
+        "current_step": "complete",
+        "node_timings": {"response": (time.perf_counter_ns() - start_ns) / 1e6},
+    }
+
+    # Nothing downstream reads the message history; only carry it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        result["messages"] = [AIMessage(content=summary)]
+
+    return result
+
+
+def _error_response(state: AgentState, message: str, start_ns: int) -> dict[str, Any]:
+    """Build the state update for a request that cannot be formatted.
+
+    Args:
+        state: Current agent state.
+        message: Client-facing error message.
+        start_ns: perf_counter_ns() reading taken when the node was entered.
+
+    Returns:
+        The state update carrying an unsuccessful FormattedResponse.
+    """
+    formatted = FormattedResponse(
+        success=False,
+        data={},
+        metadata={"request_id": state["request_id"]},
+        message=message,
+    )
+    return _node_output(formatted, start_ns, f"Response formatted with error: {message}")
+
 
 async def response_node(state: AgentState) -> dict[str, Any]:
     """
@@ -30,7 +77,7 @@ async def response_node(state: AgentState) -> dict[str, Any]:
         Updated state with formatted response.
     """
     logger.info(f"Response node entered. current_step={state.get('current_step')}, error={state.get('error')}")
-    node_start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
 
     execution_result = state.get("execution_result")
     verification_result = state.get("verification_result")
@@ -39,61 +86,29 @@ async def response_node(state: AgentState) -> dict[str, Any]:
 
     # Handle error case
     if error:
-        formatted = FormattedResponse(
-            success=False,
-            data={},
-            metadata={"request_id": state["request_id"]},
-            message=f"Error: {error}",
-        )
-        duration_ms = (time.perf_counter() - node_start_time) * 1000
-        return {
-            "formatted_response": formatted,
-            "current_step": "complete",
-            "node_timings": {"response": duration_ms},
-            "messages": [AIMessage(content="Response formatted with error")],
-        }
+        return _error_response(state, f"Error: {error}", start_ns)
 
     # Handle missing data
     if execution_result is None or verification_result is None or plan is None:
-        formatted = FormattedResponse(
-            success=False,
-            data={},
-            metadata={"request_id": state["request_id"]},
-            message="Incomplete execution - missing required data",
-        )
-        duration_ms = (time.perf_counter() - node_start_time) * 1000
-        return {
-            "formatted_response": formatted,
-            "current_step": "complete",
-            "node_timings": {"response": duration_ms},
-            "messages": [AIMessage(content="Response formatted with missing data error")],
-        }
+        return _error_response(state, "Incomplete execution - missing required data", start_ns)
 
     # Extract values from execution result
     db_result: dict[str, Any] | None = None
     calc_result: int | float | None = None
-    operation: str = "add"
+    operation_from_tool: str | None = None
 
     for tr in execution_result.tool_results:
-        if tr.tool_name == "query_dynamodb" and tr.success:
+        if tr.tool_name == _QUERY_TOOL and tr.success:
             db_result = tr.output
-        elif tr.tool_name in ("add_values", "subtract_values", "multiply_values", "divide_values") and tr.success:
+        elif tr.tool_name in _CALC_TOOLS and tr.success:
             calc_result = tr.output
-            # Extract operation from tool name
-            if tr.tool_name == "add_values":
-                operation = "add"
-            elif tr.tool_name == "subtract_values":
-                operation = "subtract"
-            elif tr.tool_name == "multiply_values":
-                operation = "multiply"
-            elif tr.tool_name == "divide_values":
-                operation = "divide"
-
-    # Also check plan for operation
-    for step in plan.steps:
-        if step.parameters.get("operation"):
-            operation = step.parameters["operation"]
-            break
+            operation_from_tool = TOOL_TO_OP[tr.tool_name]
+
+    # Only scan the plan when no calculation tool recorded the operation
+    operation: str = operation_from_tool or next(
+        (s.parameters["operation"] for s in plan.steps if s.parameters.get("operation")),
+        "add",
+    )
 
     # Build success response
     is_success = verification_result.overall_status == VerificationStatus.PASSED
@@ -109,14 +124,16 @@ async def response_node(state: AgentState) -> dict[str, Any]:
         val2 = db_result.get("val2") if db_result else None
 
         if val1 is not None and val2 is not None and calc_result is not None:
-            tool_result = format_json.invoke({
-                "val1": val1,
-                "val2": val2,
-                "result": calc_result,
-                "operation": operation,
-                "verification_passed": is_success,
-                "verification_message": verification_message,
-            })
+            tool_result = format_json.invoke(
+                {
+                    "val1": val1,
+                    "val2": val2,
+                    "result": calc_result,
+                    "operation": operation,
+                    "verification_passed": is_success,
+                    "verification_message": verification_message,
+                }
+            )
 
             # Merge tool result with our data format
             data = {
@@ -158,10 +175,4 @@ async def response_node(state: AgentState) -> dict[str, Any]:
         message=f"{operation.capitalize()} completed successfully" if is_success else f"{operation.capitalize()} completed with verification failures",
     )
 
-    duration_ms = (time.perf_counter() - node_start_time) * 1000
-    return {
-        "formatted_response": formatted,
-        "current_step": "complete",
-        "node_timings": {"response": duration_ms},
-        "messages": [AIMessage(content=f"Response formatted for {operation}")],
-    }
+    return _node_output(formatted, start_ns, f"Response formatted for {operation}")
@@ -2,9 +2,12 @@
 
 import logging
 import time
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.messages import AIMessage
+from langchain_core.tools import BaseTool
 
 from deepthought.agents.state import AgentState
 from deepthought.models.agents import (
@@ -13,6 +16,7 @@ from deepthought.models.agents import (
     VerificationStatus,
 )
 from deepthought.tools import (
+    TOOL_TO_OP,
     verify_addition,
     verify_division,
     verify_multiplication,
@@ -33,6 +37,168 @@ OPERATION_TO_VERIFY_TOOL = {
     "divide_values": verify_division,
 }
 
+# Tolerance passed to verify_division for floating point comparison
+DIVISION_TOLERANCE = 1e-9
+
+
+def _make_verify_caller(
+    verify_tool: BaseTool, **extra_args: Any
+) -> Callable[[Any, Any, Any], dict[str, Any]]:
+    """Bind a verification tool and its fixed arguments into a caller.
+
+    Args:
+        verify_tool: The verification tool to invoke.
+        **extra_args: Arguments passed on every call (e.g. tolerance).
+
+    Returns:
+        A function taking (val1, val2, result) and returning the tool output.
+    """
+
+    def call(val1: Any, val2: Any, result: Any) -> dict[str, Any]:
+        verification: dict[str, Any] = verify_tool.invoke(
+            {"val1": val1, "val2": val2, "result": result, **extra_args}
+        )
+        return verification
+
+    return call
+
+
+# Per-operation callers, specialised once so verification doesn't re-derive
+# the tool and payload shape on every call
+_VERIFY_CALLERS = {
+    operation: _make_verify_caller(
+        verify_tool,
+        **({"tolerance": DIVISION_TOLERANCE} if verify_tool is verify_division else {}),
+    )
+    for operation, verify_tool in OPERATION_TO_VERIFY_TOOL.items()
+}
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _cached_verify(
+    operation: str, val1: int | float, val2: int | float, result: int | float
+) -> tuple[bool, Any, str]:
+    """Run the verification tool for an operation, memoizing the outcome.
+
+    Verification is a pure function of its inputs, so retries and repeated
+    requests over the same pair reuse the earlier result. typed=True keeps
+    int and float inputs apart since the tools echo them back.
+
+    Args:
+        operation: The operation that produced the result.
+        val1: First operand.
+        val2: Second operand.
+        result: The result to verify.
+
+    Returns:
+        (is_valid, expected, message) as reported by the verification tool.
+    """
+    verify = _VERIFY_CALLERS.get(operation) or _VERIFY_CALLERS["add"]
+    verify_result = verify(val1, val2, result)
+    return (
+        verify_result.get("is_valid", False),
+        verify_result.get("expected"),
+        verify_result.get("message", ""),
+    )
+
+
+def _fail(reason: str, start_ns: int) -> dict[str, Any]:
+    """Build the state update for a verification that could not run.
+
+    Args:
+        reason: Error message recorded in the state.
+        start_ns: perf_counter_ns() reading taken when the node was entered.
+
+    Returns:
+        The state update.
+    """
+    return {
+        "verification_result": None,
+        "error": reason,
+        "current_step": "verification_failed",
+        "node_timings": {"verification": (time.perf_counter_ns() - start_ns) / 1e6},
+    }
+
+
+def _check_calculation(
+    operation: str, val1: int | float, val2: int | float, calc_result: int | float
+) -> VerificationCheck:
+    """Check the calculation result with the operation's verification tool.
+
+    Args:
+        operation: The operation that produced the result.
+        val1: First operand.
+        val2: Second operand.
+        calc_result: The result to verify.
+
+    Returns:
+        The correctness check; FAILED if the tool itself errors.
+    """
+    # Verification is memoized and cheap, so it runs inline on the event loop
+    try:
+        is_correct, expected, message = _cached_verify(operation, val1, val2, calc_result)
+    except Exception as e:
+        logger.error(f"Verification tool failed: {e}")
+        return VerificationCheck(
+            check_name=f"{operation}_correctness",
+            expected_value="verification",
+            actual_value="error",
+            status=VerificationStatus.FAILED,
+            message=f"Verification failed: {e}",
+        )
+
+    return VerificationCheck(
+        check_name=f"{operation}_correctness",
+        expected_value=expected,
+        actual_value=calc_result,
+        status=VerificationStatus.PASSED if is_correct else VerificationStatus.FAILED,
+        message=message,
+    )
+
+
+def _type_check(result_type: type) -> VerificationCheck:
+    """Build the (always passing) type consistency check for a result type."""
+    return VerificationCheck(
+        check_name="type_consistency",
+        expected_value="number",
+        actual_value=result_type.__name__,
+        status=VerificationStatus.PASSED,
+        message="Result type is valid",
+    )
+
+
+# Type checks only depend on the result type, so the common ones are built
+# once and shared; they are never mutated after construction
+_TYPE_CHECKS = {result_type: _type_check(result_type) for result_type in (int, float)}
+
+
+def _check_type_consistency(calc_result: int | float) -> VerificationCheck:
+    """Record the type of the calculation result.
+
+    Args:
+        calc_result: The result to check.
+
+    Returns:
+        The type consistency check.
+    """
+    result_type = type(calc_result)
+    return _TYPE_CHECKS.get(result_type) or _type_check(result_type)
+
+
+def _check_data_availability() -> VerificationCheck:
+    """Report that the operands or result needed for verification are missing.
+
+    Returns:
+        A failed data availability check.
+    """
+    return VerificationCheck(
+        check_name="data_availability",
+        expected_value="complete data",
+        actual_value="missing data",
+        status=VerificationStatus.FAILED,
+        message="Required data not available for verification",
+    )
+
 
 async def verification_node(state: AgentState) -> dict[str, Any]:
     """
@@ -49,42 +215,31 @@ async def verification_node(state: AgentState) -> dict[str, Any]:
     Returns:
         Updated state with verification results.
     """
-    node_start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     logger.info(f"Verification node entered. retry_count={state.get('retry_count', 0)}")
 
     execution_result = state.get("execution_result")
     plan = state.get("plan")
 
     if execution_result is None or plan is None:
-        duration_ms = (time.perf_counter() - node_start_time) * 1000
-        return {
-            "verification_result": None,
-            "error": "Missing execution result or plan for verification",
-            "current_step": "verification_failed",
-            "node_timings": {"verification": duration_ms},
-        }
-
-    checks: list[VerificationCheck] = []
+        return _fail("Missing execution result or plan for verification", start_ns)
 
     # Find the DB query result and calculation result
     db_result: dict[str, Any] | None = None
     calc_result: int | float | None = None
-    operation: str = "add"
+    operation: str | None = None
 
     for tr in execution_result.tool_results:
-        if tr.tool_name == "query_dynamodb" and tr.success:
-            db_result = tr.output
-        elif tr.tool_name in ("add_values", "subtract_values", "multiply_values", "divide_values") and tr.success:
+        if not tr.success:
+            continue
+        tool_operation = TOOL_TO_OP.get(tr.tool_name)
+        if tool_operation is not None:
             calc_result = tr.output
-            # Extract operation from tool name
-            if tr.tool_name == "add_values":
-                operation = "add"
-            elif tr.tool_name == "subtract_values":
-                operation = "subtract"
-            elif tr.tool_name == "multiply_values":
-                operation = "multiply"
-            elif tr.tool_name == "divide_values":
-                operation = "divide"
+            operation = tool_operation
+        elif tr.tool_name == "query_dynamodb":
+            db_result = tr.output
+        if db_result is not None and calc_result is not None:
+            break
 
     # Fall back to input_params for val1/val2 when DB query was skipped
     # (the /operate endpoint passes values directly from the pairs table)
@@ -93,83 +248,22 @@ async def verification_node(state: AgentState) -> dict[str, Any]:
         if "val1" in input_params and "val2" in input_params:
             db_result = {"val1": input_params["val1"], "val2": input_params["val2"]}
 
-    # Also check plan for operation if not found in tool results
-    for step in plan.steps:
-        if step.parameters.get("operation"):
-            operation = step.parameters["operation"]
-            break
+    # Check plan for operation if not found in tool results
+    if operation is None:
+        operation = next(
+            (op for step in plan.steps if (op := step.parameters.get("operation"))), "add"
+        )
 
-    # Verification check: calculation correctness
+    checks: list[VerificationCheck] = []
     if db_result and calc_result is not None:
         val1 = db_result.get("val1")
         val2 = db_result.get("val2")
 
         if val1 is not None and val2 is not None:
-            # Get the appropriate verification tool
-            verify_tool = OPERATION_TO_VERIFY_TOOL.get(operation, verify_addition)
-
-            # Call the verification tool
-            try:
-                if operation == "divide":
-                    verify_result = verify_tool.invoke({
-                        "val1": val1,
-                        "val2": val2,
-                        "result": calc_result,
-                        "tolerance": 1e-9,
-                    })
-                else:
-                    verify_result = verify_tool.invoke({
-                        "val1": val1,
-                        "val2": val2,
-                        "result": calc_result,
-                    })
-
-                is_correct = verify_result.get("is_valid", False)
-                expected = verify_result.get("expected")
-                message = verify_result.get("message", "")
-
-                checks.append(
-                    VerificationCheck(
-                        check_name=f"{operation}_correctness",
-                        expected_value=expected,
-                        actual_value=calc_result,
-                        status=VerificationStatus.PASSED if is_correct else VerificationStatus.FAILED,
-                        message=message,
-                    )
-                )
-
-            except Exception as e:
-                logger.error(f"Verification tool failed: {e}")
-                checks.append(
-                    VerificationCheck(
-                        check_name=f"{operation}_correctness",
-                        expected_value="verification",
-                        actual_value="error",
-                        status=VerificationStatus.FAILED,
-                        message=f"Verification failed: {e}",
-                    )
-                )
-
-            # Type consistency check
-            checks.append(
-                VerificationCheck(
-                    check_name="type_consistency",
-                    expected_value="number",
-                    actual_value=type(calc_result).__name__,
-                    status=VerificationStatus.PASSED,
-                    message="Result type is valid",
-                )
-            )
+            checks.append(_check_calculation(operation, val1, val2, calc_result))
+            checks.append(_check_type_consistency(calc_result))
     else:
-        checks.append(
-            VerificationCheck(
-                check_name="data_availability",
-                expected_value="complete data",
-                actual_value="missing data",
-                status=VerificationStatus.FAILED,
-                message="Required data not available for verification",
-            )
-        )
+        checks.append(_check_data_availability())
 
     # Determine overall status
     all_passed = all(c.status == VerificationStatus.PASSED for c in checks)
@@ -183,10 +277,16 @@ async def verification_node(state: AgentState) -> dict[str, Any]:
         reasoning=f"All {operation} checks passed" if all_passed else "One or more checks failed",
     )
 
-    duration_ms = (time.perf_counter() - node_start_time) * 1000
-    return {
+    result: dict[str, Any] = {
         "verification_result": verification_result,
         "current_step": "verification_complete",
-        "node_timings": {"verification": duration_ms},
-        "messages": [AIMessage(content=f"Verification {overall_status.value} for {operation}")],
+        "node_timings": {"verification": (time.perf_counter_ns() - start_ns) / 1e6},
     }
+
+    # Nothing downstream reads the message history; only carry it when debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        result["messages"] = [
+            AIMessage(content=f"Verification {overall_status.value} for {operation}")
+        ]
+
+    return result
@@ -28,6 +28,7 @@ class AgentState(TypedDict):
 
     # Agent outputs (populated as graph executes)
     plan: Plan | None
+    prefetched_item: dict[str, Any] | None
     execution_result: ExecutionResult | None
     verification_result: VerificationResult | None
     formatted_response: FormattedResponse | None
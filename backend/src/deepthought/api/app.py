@@ -9,6 +9,8 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from deepthought import __version__
 from deepthought.config import get_settings
+from deepthought.db import close_table_clients, get_session
+from deepthought.llm import get_llm
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +24,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     logger.info(f"Starting {settings.app_name} v{__version__}")
     logger.info(f"Debug mode: {settings.debug}")
 
+    # Build the shared LLM client up front so the first planning request doesn't
+    # pay for the provider import and client construction
+    try:
+        get_llm()
+    except ValueError as e:
+        logger.warning(f"LLM client not initialised: {e}")
+
+    # Likewise build the shared aioboto3 session, whose setup is synchronous
+    get_session()
+
     yield
 
     # Shutdown
     logger.info("Shutting down DeepThought")
+    # Table clients hold one DynamoDB connection pool each, opened on first use
+    await close_table_clients()
 
 
 def create_app() -> FastAPI:
@@ -99,7 +99,9 @@ async def get_current_user(
 
     Extracts the JWT from the Authorization header, decodes it to get the
     user email from the "sub" claim, then queries the users table to return
-    the full user record.
+    the full user record. FastAPI caches dependency results per request, so
+    the user is resolved once per request however many dependents use it;
+    nothing is cached across requests, so a deleted user is rejected at once.
 
     Args:
         token: JWT extracted from the Authorization: Bearer header.
@@ -1,13 +1,13 @@
 """Dependency injection for FastAPI routes."""
 
 from functools import lru_cache
-from typing import Generator
+from typing import AsyncGenerator, Callable
 
 from langgraph.graph.state import CompiledStateGraph
 
 from deepthought.agents import compile_graph
 from deepthought.config import get_settings
-from deepthought.db import DynamoDBClient
+from deepthought.db import DynamoDBClient, get_table_client
 
 
 @lru_cache
@@ -16,78 +16,43 @@ def get_agent_graph() -> CompiledStateGraph:
     return compile_graph()
 
 
-def get_users_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the users table."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_users_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
+def _make_db_dep(
+    table_attr: str, description: str
+) -> Callable[[], AsyncGenerator[DynamoDBClient, None]]:
+    """Build a dependency yielding the shared client for a settings table attribute.
 
+    The table's client is looked up once, on first resolution, and reused by
+    later requests without going back through settings. It opens its
+    DynamoDB client on first use and keeps it until close_table_clients()
+    runs at shutdown.
 
-def get_pairs_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the pairs table."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_pairs_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
+    Args:
+        table_attr: Name of the Settings attribute holding the table name.
+        description: Table description used in the dependency's docstring.
 
+    Returns:
+        A FastAPI dependency function.
+    """
 
-def get_logs_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the logs table."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_logs_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
+    client: DynamoDBClient | None = None
 
+    async def dependency() -> AsyncGenerator[DynamoDBClient, None]:
+        nonlocal client
+        if client is None:
+            client = get_table_client(getattr(get_settings(), table_attr))
+        await client.connect()
+        yield client
 
-def get_todos_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the todos table (lists + items)."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_todos_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
+    table = table_attr.removeprefix("dynamodb_").removesuffix("_table")
+    dependency.__name__ = dependency.__qualname__ = f"get_{table}_db_client"
+    dependency.__doc__ = f"Dependency to get DynamoDB client for the {description}."
+    return dependency
 
 
-def get_calendar_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the calendar table."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_calendar_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
-
-
-def get_messages_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the messages table."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_messages_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
-
-
-def get_conversations_db_client() -> Generator[DynamoDBClient, None, None]:
-    """Dependency to get DynamoDB client for the conversations table."""
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_conversations_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-    yield client
+get_users_db_client = _make_db_dep("dynamodb_users_table", "users table")
+get_pairs_db_client = _make_db_dep("dynamodb_pairs_table", "pairs table")
+get_logs_db_client = _make_db_dep("dynamodb_logs_table", "logs table")
+get_todos_db_client = _make_db_dep("dynamodb_todos_table", "todos table (lists + items)")
+get_calendar_db_client = _make_db_dep("dynamodb_calendar_table", "calendar table")
+get_messages_db_client = _make_db_dep("dynamodb_messages_table", "messages table")
+get_conversations_db_client = _make_db_dep("dynamodb_conversations_table", "conversations table")
@@ -1,14 +1,20 @@
 """Calendar event management endpoints."""
 
+import heapq
 import uuid
-from datetime import datetime, timezone
-from typing import Any
-
-from dateutil.rrule import rrulestr
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import Annotated, Any
+
+from dateutil.rrule import rrule, rruleset, rrulestr
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from deepthought.api.auth import get_current_user
 from deepthought.api.dependencies import get_calendar_db_client
+from deepthought.core import NotFoundError, parse_iso_datetime
 from deepthought.db import DynamoDBClient
 from deepthought.models.calendar import (
     CalendarEventCreate,
@@ -18,40 +24,324 @@ from deepthought.models.calendar import (
 
 router = APIRouter()
 
+# GSI keyed on (pk, event_id) so single-event lookups don't scan the partition
+EVENT_ID_INDEX = "pk_event_id_index"
+
+# RRULE frequencies that advance by a fixed amount of wall-clock time.
+# MONTHLY/YEARLY vary in length and are always expanded by dateutil.
+_FIXED_FREQ_STEPS = {
+    "WEEKLY": timedelta(weeks=1),
+    "DAILY": timedelta(days=1),
+    "HOURLY": timedelta(hours=1),
+    "MINUTELY": timedelta(minutes=1),
+    "SECONDLY": timedelta(seconds=1),
+}
+_SIMPLE_RRULE_PARTS = frozenset({"FREQ", "INTERVAL", "COUNT", "UNTIL"})
+
+_by_start_time = attrgetter("start_time")
+
+# Largest UTC offset in use; stored start times carry their own offset, so a
+# local wall-clock sk can sort up to this far after the same instant in UTC
+_MAX_UTC_OFFSET = timedelta(hours=14)
+
 
 def _item_to_response(item: dict[str, Any]) -> CalendarEventResponse:
     """Map a raw DynamoDB item to a CalendarEventResponse."""
-    return CalendarEventResponse(
+    return _item_to_response_parsed(
+        item,
+        start_time=parse_iso_datetime(item["start_time"]),
+        end_time=parse_iso_datetime(item["end_time"]),
+        created_at=parse_iso_datetime(item["created_at"]),
+        updated_at=parse_iso_datetime(item["updated_at"]),
+    )
+
+
+def _item_to_response_parsed(
+    item: dict[str, Any],
+    start_time: datetime,
+    end_time: datetime,
+    created_at: datetime,
+    updated_at: datetime,
+) -> CalendarEventResponse:
+    """Map a raw DynamoDB item to a CalendarEventResponse using pre-parsed times.
+
+    Lets callers that already parsed the item's timestamps, or that emit
+    several instances of one recurring event, avoid re-parsing them. Items
+    were validated when written, so the model is built without revalidating.
+    """
+    return CalendarEventResponse.model_construct(
         event_id=item["event_id"],
         title=item["title"],
         description=item.get("description"),
-        start_time=datetime.fromisoformat(item["start_time"]),
-        end_time=datetime.fromisoformat(item["end_time"]),
+        start_time=start_time,
+        end_time=end_time,
         rrule=item.get("rrule"),
-        created_at=datetime.fromisoformat(item["created_at"]),
-        updated_at=datetime.fromisoformat(item["updated_at"]),
+        created_at=created_at,
+        updated_at=updated_at,
     )
 
 
+@lru_cache(maxsize=4096)
+def _compile_rrule(rrule_str: str, dtstart_iso: str) -> rrule | rruleset:
+    """Parse an RRULE string anchored at dtstart, memoized across requests.
+
+    The same recurring event is listed over and over for different windows,
+    so the parsed rule is cached by its stored (rrule, start_time) strings.
+    Rules are built without dateutil's occurrence cache and are safe to share.
+    """
+    return rrulestr(rrule_str, dtstart=parse_iso_datetime(dtstart_iso))
+
+
+def _rrule_parts(rrule_str: str) -> dict[str, str] | None:
+    """Split a single-line RRULE into its NAME=value parts.
+
+    Returns:
+        The upper-cased parts keyed by name, or None if the text is not a
+        single RRULE line (e.g. a rule set) or repeats or malforms a part.
+    """
+    text = rrule_str.strip().upper()
+    if "\n" in text:
+        return None
+    parts: dict[str, str] = {}
+    for part in text.removeprefix("RRULE:").split(";"):
+        key, sep, value = part.partition("=")
+        if not sep or key in parts:
+            return None
+        parts[key] = value
+    return parts
+
+
+def _parse_utc_until(value: str) -> datetime | None:
+    """Parse an RRULE UNTIL value in its UTC form, or return None."""
+    try:
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_simple_rrule(
+    rrule_str: str,
+) -> tuple[timedelta, int | None, datetime | None] | None:
+    """Parse an RRULE that only uses FREQ, INTERVAL, COUNT and UNTIL.
+
+    Such rules recur at a fixed wall-clock step, so their occurrences can be
+    computed arithmetically instead of iterating dateutil's rule machinery.
+
+    Returns:
+        (step, count, until) for a fixed-step rule, or None if the rule needs
+        dateutil's full expansion (BYxxx parts, MONTHLY/YEARLY, non-UTC UNTIL).
+    """
+    parts = _rrule_parts(rrule_str)
+    if parts is None or not parts.keys() <= _SIMPLE_RRULE_PARTS:
+        return None
+
+    step = _FIXED_FREQ_STEPS.get(parts.get("FREQ", ""))
+    if step is None:
+        return None
+
+    until = None
+    if "UNTIL" in parts:
+        until = _parse_utc_until(parts["UNTIL"])
+        if until is None:
+            return None
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        return None
+
+    if interval < 1 or (count is not None and count < 0):
+        return None
+    return step * interval, count, until
+
+
+@lru_cache(maxsize=4096)
+def _rrule_period(rrule_str: str) -> timedelta | None:
+    """Return the whole-period step a rule's dtstart can be moved by, if any.
+
+    Read from the rule text: INTERVAL times a fixed-length FREQ. Rules with
+    COUNT or BYSETPOS, MONTHLY and YEARLY rules, and rule sets have no such
+    period, since moving their dtstart would change which instances occur.
+    """
+    parts = _rrule_parts(rrule_str)
+    if parts is None or "COUNT" in parts or "BYSETPOS" in parts:
+        return None
+    step = _FIXED_FREQ_STEPS.get(parts.get("FREQ", ""))
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+    except ValueError:
+        return None
+    if step is None or interval < 1:
+        return None
+    return step * interval
+
+
+@lru_cache(maxsize=4096)
+def _rrule_text_until(rrule_str: str) -> datetime | None:
+    """Return a single-line rule's UTC UNTIL bound from its text, if it has one."""
+    parts = _rrule_parts(rrule_str)
+    if parts is None or "UNTIL" not in parts:
+        return None
+    return _parse_utc_until(parts["UNTIL"])
+
+
+def _advance_rrule(rule: rrule, rrule_str: str, dtstart: datetime, start: datetime) -> rrule:
+    """Move a rule's dtstart forward to shortly before start, when that is safe.
+
+    dateutil iterates every occurrence from dtstart, so a long-running event
+    listed for a recent window walks years of instances first. Shifting
+    dtstart by whole periods (interval x fixed-length frequency) keeps the
+    occurrence pattern identical. Rules without such a period (see
+    _rrule_period) and naive starts are returned unchanged.
+
+    Args:
+        rule: The rule compiled from rrule_str and dtstart.
+        rrule_str: The stored rule text the period is read from.
+        dtstart: The event's start time the rule is anchored to.
+        start: Range start.
+    """
+    period = _rrule_period(rrule_str)
+    if period is None or dtstart.tzinfo is None:
+        return rule
+
+    tz = dtstart.tzinfo
+    # dateutil drops microseconds from dtstart
+    base = dtstart.replace(microsecond=0, tzinfo=None)
+    # One period of slack absorbs any UTC-offset change between dtstart and start
+    periods = (start.astimezone(tz).replace(tzinfo=None) - base) // period - 1
+    if periods <= 0:
+        return rule
+    return rule.replace(dtstart=(base + periods * period).replace(tzinfo=tz))
+
+
+def _expand_rrule(
+    rrule_str: str, dtstart_iso: str, event_start: datetime, start: datetime, end: datetime
+) -> list[datetime]:
+    """Return the occurrences of a recurring event that start within [start, end].
+
+    Fixed-step rules jump straight to the first occurrence at or after start;
+    everything else is expanded by dateutil, starting near the range where
+    the rule allows it.
+    """
+    simple = _parse_simple_rrule(rrule_str) if event_start.tzinfo is not None else None
+    if simple is None:
+        rule = _compile_rrule(rrule_str, dtstart_iso)
+        if isinstance(rule, rrule):
+            until = _rrule_text_until(rrule_str) if event_start.tzinfo is not None else None
+            if until is not None and until < start:
+                return []
+            rule = _advance_rrule(rule, rrule_str, event_start, start)
+        expanded: list[datetime] = rule.between(start, end, inc=True)
+        return expanded
+
+    step, count, until = simple
+    tz = event_start.tzinfo
+    # Like dateutil, step in naive wall-clock time and drop microseconds
+    base = event_start.replace(microsecond=0, tzinfo=None)
+
+    # Index of the first step at or after start (ceil division), corrected for
+    # any UTC-offset change between dtstart and start
+    k = max(0, -((base - start.astimezone(tz).replace(tzinfo=None)) // step))
+    while k > 0 and (base + (k - 1) * step).replace(tzinfo=tz) >= start:
+        k -= 1
+
+    occurrences: list[datetime] = []
+    while count is None or k < count:
+        occurrence = (base + k * step).replace(tzinfo=tz)
+        if occurrence > end or (until is not None and occurrence > until):
+            break
+        if occurrence >= start:
+            occurrences.append(occurrence)
+        k += 1
+    return occurrences
+
+
+def _rrule_until(rrule_str: str, dtstart_iso: str) -> str | None:
+    """Validate a recurrence rule at write time and extract its UNTIL bound.
+
+    The bound is stored alongside the rule as rrule_until so listing can drop
+    expired series without parsing them.
+
+    Args:
+        rrule_str: RFC 5545 recurrence rule from the request.
+        dtstart_iso: The event's stored start_time.
+
+    Returns:
+        The rule's UNTIL as a UTC ISO 8601 string, or None if the rule has no
+        UNTIL, is a rule set or spans several lines, or the start time is naive.
+
+    Raises:
+        HTTPException: 400 if the rule cannot be parsed.
+    """
+    try:
+        rule = _compile_rrule(rrule_str, dtstart_iso)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid rrule: {e}",
+        ) from e
+    if not isinstance(rule, rrule) or parse_iso_datetime(dtstart_iso).tzinfo is None:
+        return None
+
+    # With an aware start dateutil only accepts the UTC UNTIL form, which is
+    # read from the rule text the same way listing reads it
+    until = _rrule_text_until(rrule_str)
+    return until.isoformat() if until is not None else None
+
+
 async def _find_event(
     calendar_db: DynamoDBClient, user_email: str, event_id: str
 ) -> dict[str, Any]:
-    """Query all events for the user and return the one matching event_id.
+    """Look up a single event by event_id via the event_id GSI.
 
-    The calendar sk is {start_time}#{event_id}, so a full pk query is required
-    to locate an event by event_id alone.
+    The calendar sk is {start_time}#{event_id}, so the base table cannot be
+    addressed by event_id alone; the GSI returns the full item including its sk.
 
     Raises:
         HTTPException 404: If no event with the given event_id is found.
     """
-    items = await calendar_db.query(pk=user_email)
-    item = next((i for i in items if i.get("event_id") == event_id), None)
-    if item is None:
+    items = await calendar_db.query_gsi(
+        EVENT_ID_INDEX,
+        pk_attr="pk",
+        pk_value=user_email,
+        sk_attr="event_id",
+        sk_value=event_id,
+    )
+    if not items:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Event not found",
         )
-    return item
+    return items[0]
+
+
+def _sk_upper_bound(end: datetime) -> str:
+    """Return an sk bound that sorts after every event starting at or before end.
+
+    sk is "{start_time}#{event_id}" with start_time in the event's own offset,
+    so the bound uses the latest wall-clock time any offset can show for end.
+    "~" sorts after the offset/"#" suffix of any sk sharing that prefix.
+
+    Args:
+        end: Range end.
+
+    Returns:
+        Inclusive upper bound for the sort key.
+    """
+    latest_local = end.astimezone(timezone.utc).replace(tzinfo=None) + _MAX_UTC_OFFSET
+    return f"{latest_local.isoformat()}~"
+
+
+def _instance_responses(
+    template: CalendarEventResponse, instances: list[datetime], duration: timedelta
+) -> Iterator[CalendarEventResponse]:
+    """Yield the template followed by copies for each later instance."""
+    yield template
+    for instance in instances[1:]:
+        yield template.model_copy(
+            update={"start_time": instance, "end_time": instance + duration}
+        )
 
 
 @router.post(
@@ -68,29 +358,35 @@ async def create_event(
 ) -> CalendarEventResponse:
     """Create a new calendar event.
 
-    1. Generate a unique event_id
-    2. Store in DynamoDB with pk=user_email, sk={start_time}#{event_id}
-    3. Return the created event
+    1. Validate the rrule, if any, and extract its UNTIL bound
+    2. Generate a unique event_id
+    3. Store in DynamoDB with pk=user_email, sk={start_time}#{event_id}
+    4. Return the created event
     """
+    start_iso = request.start_time.isoformat()
+    rrule_until = _rrule_until(request.rrule, start_iso) if request.rrule is not None else None
     user_email = current_user["pk"]
     event_id = str(uuid.uuid4())
     now = datetime.now(timezone.utc)
-    sk = f"{request.start_time.isoformat()}#{event_id}"
+    now_iso = now.isoformat()
+    sk = f"{start_iso}#{event_id}"
 
     item: dict[str, Any] = {
         "pk": user_email,
         "sk": sk,
         "event_id": event_id,
         "title": request.title,
-        "start_time": request.start_time.isoformat(),
+        "start_time": start_iso,
         "end_time": request.end_time.isoformat(),
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
+        "created_at": now_iso,
+        "updated_at": now_iso,
     }
     if request.description is not None:
         item["description"] = request.description
     if request.rrule is not None:
         item["rrule"] = request.rrule
+    if rrule_until is not None:
+        item["rrule_until"] = rrule_until
 
     await calendar_db.put_item(item)
 
@@ -114,54 +410,76 @@ async def create_event(
     description=(
         "Returns events within [start, end]. Recurring events are expanded into "
         "individual instances using RRULE. One-off events are included if they overlap "
-        "with the range. Results are sorted by start time."
+        "with the range. Results are sorted by start time and capped at limit if given."
     ),
 )
 async def list_events(
     start: datetime = Query(..., description="Range start (ISO 8601 with offset)"),
     end: datetime = Query(..., description="Range end (ISO 8601 with offset)"),
+    limit: Annotated[
+        int | None, Query(ge=1, description="Maximum number of events to return")
+    ] = None,
     current_user: dict[str, Any] = Depends(get_current_user),
     calendar_db: DynamoDBClient = Depends(get_calendar_db_client),
 ) -> list[CalendarEventResponse]:
     """List calendar events within a date range, expanding recurring events.
 
-    1. Fetch all events for the user from DynamoDB
+    1. Fetch the user's events starting no later than end from DynamoDB
     2. For one-off events: include if they overlap with [start, end]
     3. For recurring events: expand RRULE instances within [start, end]
-    4. Return all results sorted by start time
+    4. Return the first limit results (all if unset) sorted by start time
+
+    Each recurring series yields its instances already in order, so the series
+    are heap-merged with the sorted one-off events and only the first limit
+    responses are ever built.
     """
-    user_email = current_user["pk"]
-    items = await calendar_db.query(pk=user_email)
+    # Events starting after the range can't overlap it, and recurring events
+    # never occur before their start, so only the upper bound is pushed down
+    items = await calendar_db.query(pk=current_user["pk"], sk_end=_sk_upper_bound(end))
 
-    results: list[CalendarEventResponse] = []
+    series: list[Iterable[CalendarEventResponse]] = []
+    one_offs: list[CalendarEventResponse] = []
 
     for item in items:
-        event_start = datetime.fromisoformat(item["start_time"])
-        event_end = datetime.fromisoformat(item["end_time"])
         rrule_str = item.get("rrule")
+        # Series whose UNTIL passed before the range have no instances in it
+        rrule_until = item.get("rrule_until") if rrule_str else None
+        if rrule_until and parse_iso_datetime(rrule_until) < start:
+            continue
+
+        event_start = parse_iso_datetime(item["start_time"])
+        event_end = parse_iso_datetime(item["end_time"])
 
         if rrule_str:
-            rule = rrulestr(rrule_str, dtstart=event_start)
+            instances = _expand_rrule(rrule_str, item["start_time"], event_start, start, end)
+            if not instances:
+                continue
             duration = event_end - event_start
-            for instance in rule.between(start, end, inc=True):
-                results.append(
-                    CalendarEventResponse(
-                        event_id=item["event_id"],
-                        title=item["title"],
-                        description=item.get("description"),
-                        start_time=instance,
-                        end_time=instance + duration,
-                        rrule=rrule_str,
-                        created_at=datetime.fromisoformat(item["created_at"]),
-                        updated_at=datetime.fromisoformat(item["updated_at"]),
-                    )
+            first = instances[0]
+            # Build the item once; the remaining instances only differ in
+            # their internally computed start/end, so copy the first
+            template = _item_to_response_parsed(
+                item,
+                first,
+                first + duration,
+                parse_iso_datetime(item["created_at"]),
+                parse_iso_datetime(item["updated_at"]),
+            )
+            series.append(_instance_responses(template, instances, duration))
+        elif event_start <= end and event_end >= start:
+            one_offs.append(
+                _item_to_response_parsed(
+                    item,
+                    event_start,
+                    event_end,
+                    parse_iso_datetime(item["created_at"]),
+                    parse_iso_datetime(item["updated_at"]),
                 )
-        else:
-            if event_start <= end and event_end >= start:
-                results.append(_item_to_response(item))
+            )
 
-    results.sort(key=lambda e: e.start_time)
-    return results
+    one_offs.sort(key=_by_start_time)
+    merged = heapq.merge(one_offs, *series, key=_by_start_time)
+    return list(islice(merged, limit))
 
 
 @router.get(
@@ -178,9 +496,8 @@ async def get_event(
 ) -> CalendarEventResponse:
     """Fetch a single calendar event by event_id.
 
-    Queries all events for the user and returns the one matching event_id.
-    The sk is {start_time}#{event_id}, so a full pk query is required to locate
-    an event by event_id alone.
+    Looks the event up through the event_id GSI, since the base table sk is
+    {start_time}#{event_id}.
     """
     user_email = current_user["pk"]
     item = await _find_event(calendar_db, user_email, event_id)
@@ -206,7 +523,8 @@ async def update_event(
     """Partially update a calendar event.
 
     1. Find the event by event_id
-    2. If start_time changes: delete old item, insert new one (sk is time-based)
+    2. If start_time changes: replace the item under a new sk in one
+       transaction (sk is time-based)
     3. Otherwise: update_item with only the changed fields
     """
     user_email = current_user["pk"]
@@ -214,56 +532,87 @@ async def update_event(
 
     old_sk: str = item["sk"]
     now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
 
     new_title = request.title if request.title is not None else item["title"]
     new_description = request.description if request.description is not None else item.get("description")
-    new_start = request.start_time if request.start_time is not None else datetime.fromisoformat(item["start_time"])
-    new_end = request.end_time if request.end_time is not None else datetime.fromisoformat(item["end_time"])
-    new_rrule = request.rrule if request.rrule is not None else item.get("rrule")
+    new_rrule: str | None = request.rrule if request.rrule is not None else item.get("rrule")
 
-    start_time_changed = (
-        request.start_time is not None
-        and request.start_time.isoformat() != item["start_time"]
+    # Unchanged times are kept as stored and only parsed for the response
+    new_start_iso = (
+        request.start_time.isoformat() if request.start_time is not None else item["start_time"]
+    )
+    new_end_iso = request.end_time.isoformat() if request.end_time is not None else item["end_time"]
+    start_time_changed = new_start_iso != item["start_time"]
+    new_start = (
+        request.start_time
+        if request.start_time is not None
+        else parse_iso_datetime(item["start_time"])
     )
+    # The UNTIL bound depends on both the rule and the start it is anchored to
+    rrule_until = None
+    if new_rrule is not None and (start_time_changed or request.rrule is not None):
+        rrule_until = _rrule_until(new_rrule, new_start_iso)
 
     if start_time_changed:
-        new_sk = f"{new_start.isoformat()}#{event_id}"
+        new_sk = f"{new_start_iso}#{event_id}"
         new_item: dict[str, Any] = {
             "pk": user_email,
             "sk": new_sk,
             "event_id": event_id,
             "title": new_title,
-            "start_time": new_start.isoformat(),
-            "end_time": new_end.isoformat(),
+            "start_time": new_start_iso,
+            "end_time": new_end_iso,
             "created_at": item["created_at"],
-            "updated_at": now.isoformat(),
+            "updated_at": now_iso,
         }
         if new_description is not None:
             new_item["description"] = new_description
         if new_rrule is not None:
             new_item["rrule"] = new_rrule
-        await calendar_db.delete_item(pk=user_email, sk=old_sk)
-        await calendar_db.put_item(new_item)
+        if rrule_until is not None:
+            new_item["rrule_until"] = rrule_until
+        await calendar_db.replace_item(pk=user_email, old_sk=old_sk, item=new_item)
     else:
-        updates: dict[str, Any] = {"updated_at": now.isoformat()}
+        updates: dict[str, Any] = {"updated_at": now_iso}
+        remove: list[str] | None = None
         if request.title is not None:
             updates["title"] = new_title
         if request.description is not None:
             updates["description"] = new_description
         if request.end_time is not None:
-            updates["end_time"] = new_end.isoformat()
+            updates["end_time"] = new_end_iso
         if request.rrule is not None:
             updates["rrule"] = new_rrule
-        await calendar_db.update_item(pk=user_email, sk=old_sk, updates=updates)
+            # An unbounded rule must drop the old bound, not store a NULL one
+            if rrule_until is not None:
+                updates["rrule_until"] = rrule_until
+            else:
+                remove = ["rrule_until"]
+        # The GSI read is eventually consistent, so old_sk may already be stale;
+        # never let the update create a partial item under it
+        try:
+            await calendar_db.update_item(
+                pk=user_email, sk=old_sk, updates=updates, remove=remove, must_exist=True
+            )
+        except NotFoundError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Event not found",
+            ) from e
 
     return CalendarEventResponse(
         event_id=event_id,
         title=new_title,
         description=new_description,
         start_time=new_start,
-        end_time=new_end,
+        end_time=(
+            request.end_time
+            if request.end_time is not None
+            else parse_iso_datetime(new_end_iso)
+        ),
         rrule=new_rrule,
-        created_at=datetime.fromisoformat(item["created_at"]),
+        created_at=parse_iso_datetime(item["created_at"]),
         updated_at=now,
     )
 
@@ -282,8 +631,15 @@ async def delete_event(
     """Delete a calendar event.
 
     1. Find the event by event_id (returns 404 if not found)
-    2. Delete using the composite key (pk=user_email, sk={start_time}#{event_id})
+    2. Delete using the composite key (pk=user_email, sk={start_time}#{event_id}),
+       conditioned on the item existing since the GSI may return a stale sk
     """
     user_email = current_user["pk"]
     item = await _find_event(calendar_db, user_email, event_id)
-    await calendar_db.delete_item(pk=user_email, sk=item["sk"])
+    try:
+        await calendar_db.delete_item(pk=user_email, sk=item["sk"], must_exist=True)
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event not found",
+        ) from e
@@ -18,7 +18,7 @@ router = APIRouter()
 )
 async def health_check() -> HealthResponse:
     """Check service health."""
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
         version=__version__,
         timestamp=datetime.now(timezone.utc).isoformat(),
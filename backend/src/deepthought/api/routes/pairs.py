@@ -150,6 +150,7 @@ async def operate_on_pair(
             "sort_key": "DIRECT",
         },
         "plan": None,
+        "prefetched_item": None,
         "execution_result": None,
         "verification_result": None,
         "formatted_response": None,
@@ -222,10 +223,11 @@ async def operate_on_pair(
     # Store the log
     log_id = str(uuid.uuid4())
     now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
 
     log_item: dict[str, Any] = {
         "pk": pair_id,
-        "sk": f"OP#{now.isoformat()}#{log_id}",
+        "sk": f"OP#{now_iso}#{log_id}",
         "log_id": log_id,
         "pair_id": pair_id,
         "operation": request.operation,
@@ -233,7 +235,7 @@ async def operate_on_pair(
         "result": result_value,
         "success": success,
         "total_duration_ms": total_duration_ms,
-        "created_at": now.isoformat(),
+        "created_at": now_iso,
     }
     await logs_db.put_item(_floats_to_decimals(log_item))
 
@@ -1,37 +1,53 @@
 """Gamification stats endpoints for pairs and todos."""
 
-from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+import asyncio
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from fastapi import APIRouter, Depends, status
 
 from deepthought.api.auth import get_current_user
 from deepthought.api.dependencies import get_pairs_db_client, get_todos_db_client
+from deepthought.core import parse_iso_datetime
 from deepthought.db import DynamoDBClient
 from deepthought.models.stats import DailyCount, StatsResponse
 
 router = APIRouter()
 
+# GSIs keyed on (pk, timestamp) so stats only read the rolling window
+PAIRS_CREATED_AT_INDEX = "pk_created_at_index"
+TODOS_COMPLETED_AT_INDEX = "pk_completed_at_index"
 
-def _build_daily_counts(dates: list[str], last_n_days: int = 10) -> list[DailyCount]:
+STATS_WINDOW_DAYS = 10
+
+
+def _window_bounds(today: date, last_n_days: int = STATS_WINDOW_DAYS) -> tuple[str, str]:
+    """Return inclusive ISO timestamp bounds covering the last N UTC days.
+
+    The end bound carries microseconds so timestamps stored with fractional
+    seconds late on the current day still sort inside the range.
+    """
+    start_date = today - timedelta(days=last_n_days - 1)
+    return (
+        f"{start_date.isoformat()}T00:00:00+00:00",
+        f"{today.isoformat()}T23:59:59.999999+00:00",
+    )
+
+
+def _build_daily_counts(
+    dates: list[str], today: date, last_n_days: int = STATS_WINDOW_DAYS
+) -> list[DailyCount]:
     """Aggregate a list of YYYY-MM-DD date strings into rolling daily counts.
 
     Returns one DailyCount per day for the last N days (including today),
-    with zero-filled days that have no entries.
+    with zero-filled days that have no entries. Callers pass the UTC date
+    they already used for the query window so both agree on "today".
     """
-    today = datetime.now(timezone.utc).date()
-    counts: dict[str, int] = defaultdict(int)
-    for d in dates:
-        counts[d] += 1
-
-    return [
-        DailyCount(
-            date=str(today - timedelta(days=i)),
-            count=counts.get(str(today - timedelta(days=i)), 0),
-        )
-        for i in range(last_n_days - 1, -1, -1)
-    ]
+    counts = Counter(dates)
+
+    day_strs = [(today - timedelta(days=i)).isoformat() for i in range(last_n_days - 1, -1, -1)]
+    return [DailyCount(date=day, count=counts.get(day, 0)) for day in day_strs]
 
 
 @router.get(
@@ -47,18 +63,34 @@ async def pairs_stats(
 ) -> StatsResponse:
     """Get pairs stats: total count + 10-day rolling daily insertions.
 
-    1. Query all pairs for the user
-    2. Extract created_at dates
-    3. Aggregate into daily counts for the last 10 days
+    1. Concurrently count total pairs via query_count and query the
+       created_at GSI for pairs created in the last 10 days
+    2. Aggregate created_at dates into daily counts
     """
     user_email = current_user["pk"]
-    pairs = await pairs_db.query(pk=user_email)
 
-    dates = [datetime.fromisoformat(p["created_at"]).date().isoformat() for p in pairs]
+    # The count and the window query are independent round-trips; only the
+    # timestamp is read from each windowed item
+    today = datetime.now(timezone.utc).date()
+    sk_start, sk_end = _window_bounds(today)
+    total_pairs, recent_pairs = await asyncio.gather(
+        pairs_db.query_count(pk=user_email),
+        pairs_db.query_gsi_range(
+            index_name=PAIRS_CREATED_AT_INDEX,
+            pk_attr="pk",
+            pk_value=user_email,
+            sk_attr="created_at",
+            sk_start=sk_start,
+            sk_end=sk_end,
+            projection=["created_at"],
+        ),
+    )
+
+    dates = [parse_iso_datetime(p["created_at"]).date().isoformat() for p in recent_pairs]
 
     return StatsResponse(
-        total=len(pairs),
-        daily_counts=_build_daily_counts(dates),
+        total=total_pairs,
+        daily_counts=_build_daily_counts(dates, today),
     )
 
 
@@ -75,33 +107,34 @@ async def todos_stats(
 ) -> StatsResponse:
     """Get todos stats: total list count + 10-day rolling daily completions.
 
-    1. Count total lists via query_count with sk_prefix=LIST#
-    2. Query the completed_at GSI for items completed in the last 10 days
-    3. Aggregate completed_at dates into daily counts
+    1. Concurrently count total lists via query_count with sk_prefix=LIST#
+       and query the completed_at GSI for items completed in the last 10 days
+    2. Aggregate completed_at dates into daily counts
     """
     user_email = current_user["pk"]
 
-    total_lists = await todos_db.query_count(pk=user_email, sk_prefix="LIST#")
-
+    # The count and the window query are independent round-trips; only the
+    # timestamp is read from each windowed item
     today = datetime.now(timezone.utc).date()
-    start_date = today - timedelta(days=9)
-    sk_start = f"{start_date.isoformat()}T00:00:00+00:00"
-    sk_end = f"{today.isoformat()}T23:59:59+00:00"
-
-    completed_items = await todos_db.query_gsi_range(
-        index_name="pk_completed_at_index",
-        pk_attr="pk",
-        pk_value=user_email,
-        sk_attr="completed_at",
-        sk_start=sk_start,
-        sk_end=sk_end,
+    sk_start, sk_end = _window_bounds(today)
+    total_lists, completed_items = await asyncio.gather(
+        todos_db.query_count(pk=user_email, sk_prefix="LIST#"),
+        todos_db.query_gsi_range(
+            index_name=TODOS_COMPLETED_AT_INDEX,
+            pk_attr="pk",
+            pk_value=user_email,
+            sk_attr="completed_at",
+            sk_start=sk_start,
+            sk_end=sk_end,
+            projection=["completed_at"],
+        ),
     )
 
     dates = [
-        datetime.fromisoformat(item["completed_at"]).date().isoformat() for item in completed_items
+        parse_iso_datetime(item["completed_at"]).date().isoformat() for item in completed_items
     ]
 
     return StatsResponse(
         total=total_lists,
-        daily_counts=_build_daily_counts(dates),
+        daily_counts=_build_daily_counts(dates, today),
     )
@@ -1,16 +1,18 @@
 """Todo list and item management endpoints."""
 
+import asyncio
 import uuid
+from contextlib import suppress
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from deepthought.api.auth import get_current_user
 from deepthought.api.dependencies import get_todos_db_client
+from deepthought.core import ConditionFailedError, NotFoundError, parse_iso_datetime
 from deepthought.db import DynamoDBClient
-from collections import defaultdict
-
 from deepthought.models.todos import (
     TodoItemCreate,
     TodoItemResponse,
@@ -21,6 +23,9 @@ from deepthought.models.todos import (
 
 router = APIRouter()
 
+_by_created_at = attrgetter("created_at")
+_by_sort_order = attrgetter("sort_order")
+
 
 @router.post(
     "/lists",
@@ -37,20 +42,24 @@ async def create_list(
     """Create a new todo list.
 
     1. Generate a unique list_id
-    2. Store in DynamoDB with pk=user_email, sk=LIST#{list_id}
+    2. Store in DynamoDB with pk=user_email, sk=LIST#{list_id} and zeroed
+       item_count / completed_count counters
     3. Return the created list with zero item counts
     """
     user_email = current_user["pk"]
-    list_id = str(uuid.uuid4())
+    list_id = uuid.uuid4().hex
     now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
 
     item: dict[str, Any] = {
         "pk": user_email,
         "sk": f"LIST#{list_id}",
         "list_id": list_id,
         "title": request.title,
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
+        "item_count": 0,
+        "completed_count": 0,
+        "created_at": now_iso,
+        "updated_at": now_iso,
     }
 
     await todos_db.put_item(item)
@@ -80,37 +89,29 @@ async def list_lists(
 ) -> list[TodoListResponse]:
     """List all todo lists with item/completed counts.
 
-    1. Query all LIST# entries for the user
-    2. Query all ITEM# entries for the user
-    3. Aggregate item counts and completed counts per list_id
-    4. Return lists sorted by created_at ascending
+    1. Query the user's LIST# entries
+    2. Read the item_count / completed_count counters stored on each list
+    3. Return lists sorted by created_at ascending
     """
     user_email = current_user["pk"]
 
+    # Counters are maintained on the LIST# rows, so ITEM# rows are never read here
     lists = await todos_db.query(pk=user_email, sk_prefix="LIST#")
-    items = await todos_db.query(pk=user_email, sk_prefix="ITEM#")
-
-    item_counts: dict[str, int] = defaultdict(int)
-    completed_counts: dict[str, int] = defaultdict(int)
-    for item in items:
-        lid = item["list_id"]
-        item_counts[lid] += 1
-        if item.get("completed"):
-            completed_counts[lid] += 1
 
+    # Stored rows were validated when written, so skip revalidating them
     results = [
-        TodoListResponse(
+        TodoListResponse.model_construct(
             list_id=lst["list_id"],
             title=lst["title"],
-            item_count=item_counts.get(lst["list_id"], 0),
-            completed_count=completed_counts.get(lst["list_id"], 0),
-            created_at=datetime.fromisoformat(lst["created_at"]),
-            updated_at=datetime.fromisoformat(lst["updated_at"]),
+            item_count=int(lst.get("item_count", 0)),
+            completed_count=int(lst.get("completed_count", 0)),
+            created_at=parse_iso_datetime(lst["created_at"]),
+            updated_at=parse_iso_datetime(lst["updated_at"]),
         )
         for lst in lists
     ]
 
-    results.sort(key=lambda r: r.created_at)
+    results.sort(key=_by_created_at)
     return results
 
 
@@ -127,21 +128,15 @@ async def delete_list(
 ) -> None:
     """Delete a todo list and all its items.
 
-    1. Verify the list exists (404 if not)
-    2. Query all ITEM#{list_id}# entries for the list
+    1. Concurrently fetch the list and query its ITEM#{list_id}# entries
+    2. 404 if the list does not exist
     3. Batch delete the list entry + all item entries
     """
     user_email = current_user["pk"]
 
     list_sk = f"LIST#{list_id}"
-    existing = await todos_db.get_item(pk=user_email, sk=list_sk)
-    if existing is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo list not found",
-        )
-
-    items = await todos_db.query(pk=user_email, sk_prefix=f"ITEM#{list_id}#")
+    # Bypass the query cache so items added since it filled aren't orphaned
+    items = await _fetch_list_items(todos_db, user_email, list_id, use_cache=False)
 
     to_delete: list[tuple[str, str]] = [(user_email, list_sk)]
     to_delete.extend((user_email, item["sk"]) for item in items)
@@ -164,25 +159,28 @@ async def add_item(
 ) -> TodoItemResponse:
     """Add a new item to a todo list.
 
-    1. Verify the parent list exists (404 if not)
-    2. Count existing items to determine sort_order
+    1. Atomically bump the parent list's item_count (404 if the list is missing)
+    2. sort_order = item count before this insert
     3. Store with pk=user_email, sk=ITEM#{list_id}#{item_id}
     4. Return the created item
     """
     user_email = current_user["pk"]
 
-    existing = await todos_db.get_item(pk=user_email, sk=f"LIST#{list_id}")
-    if existing is None:
+    try:
+        item_count = await todos_db.increment_counter(
+            pk=user_email, sk=f"LIST#{list_id}", field="item_count"
+        )
+    except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo list not found",
-        )
+        ) from e
 
-    existing_items = await todos_db.query(pk=user_email, sk_prefix=f"ITEM#{list_id}#")
-    sort_order = len(existing_items)
+    sort_order = item_count - 1
 
-    item_id = str(uuid.uuid4())
+    item_id = uuid.uuid4().hex
     now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
 
     item: dict[str, Any] = {
         "pk": user_email,
@@ -192,8 +190,8 @@ async def add_item(
         "text": request.text,
         "completed": False,
         "sort_order": sort_order,
-        "created_at": now.isoformat(),
-        "updated_at": now.isoformat(),
+        "created_at": now_iso,
+        "updated_at": now_iso,
     }
 
     await todos_db.put_item(item)
@@ -210,18 +208,57 @@ async def add_item(
     )
 
 
+async def _fetch_list_items(
+    todos_db: DynamoDBClient, user_email: str, list_id: str, use_cache: bool = True
+) -> list[dict[str, Any]]:
+    """Fetch a list's ITEM# rows while checking, concurrently, that the list exists.
+
+    Runs both reads in a TaskGroup so a failure in one cancels the other.
+    Pass use_cache=False when the rows feed a write, so none are missed.
+
+    Raises:
+        HTTPException (404): If the list does not exist.
+    """
+    async with asyncio.TaskGroup() as tg:
+        list_task = tg.create_task(todos_db.get_item(pk=user_email, sk=f"LIST#{list_id}"))
+        items_task = tg.create_task(
+            todos_db.query(pk=user_email, sk_prefix=f"ITEM#{list_id}#", use_cache=use_cache)
+        )
+    if list_task.result() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Todo list not found",
+        )
+    return items_task.result()
+
+
+async def _adjust_list_counters(
+    todos_db: DynamoDBClient, user_email: str, list_id: str, amounts: dict[str, int]
+) -> None:
+    """Apply counter deltas to a LIST# row, ignoring a list deleted concurrently."""
+    with suppress(NotFoundError):
+        await todos_db.increment_counters(
+            pk=user_email, sk=f"LIST#{list_id}", amounts=amounts
+        )
+
+
 def _item_to_response(item: dict[str, Any]) -> TodoItemResponse:
-    """Map a raw DynamoDB item to a TodoItemResponse."""
+    """Map a raw DynamoDB item to a TodoItemResponse.
+
+    Items were validated when written, so the model is built without
+    revalidating; numbers come back from DynamoDB as Decimal and are
+    converted here instead.
+    """
     completed_at_raw = item.get("completed_at")
-    return TodoItemResponse(
+    return TodoItemResponse.model_construct(
         item_id=item["item_id"],
         list_id=item["list_id"],
         text=item["text"],
         completed=item.get("completed", False),
-        completed_at=datetime.fromisoformat(completed_at_raw) if completed_at_raw else None,
-        sort_order=item.get("sort_order", 0),
-        created_at=datetime.fromisoformat(item["created_at"]),
-        updated_at=datetime.fromisoformat(item["updated_at"]),
+        completed_at=parse_iso_datetime(completed_at_raw) if completed_at_raw else None,
+        sort_order=int(item.get("sort_order", 0)),
+        created_at=parse_iso_datetime(item["created_at"]),
+        updated_at=parse_iso_datetime(item["updated_at"]),
     )
 
 
@@ -239,22 +276,16 @@ async def list_items(
 ) -> list[TodoItemResponse]:
     """List all items for a todo list.
 
-    1. Verify the parent list exists (404 if not)
-    2. Query all ITEM#{list_id}# entries
+    1. Concurrently fetch the parent list and query its ITEM#{list_id}# entries
+    2. 404 if the list does not exist
     3. Return items sorted by sort_order ascending
     """
     user_email = current_user["pk"]
 
-    existing = await todos_db.get_item(pk=user_email, sk=f"LIST#{list_id}")
-    if existing is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo list not found",
-        )
+    items = await _fetch_list_items(todos_db, user_email, list_id)
 
-    items = await todos_db.query(pk=user_email, sk_prefix=f"ITEM#{list_id}#")
     results = [_item_to_response(item) for item in items]
-    results.sort(key=lambda r: r.sort_order)
+    results.sort(key=_by_sort_order)
     return results
 
 
@@ -278,60 +309,90 @@ async def update_item(
 ) -> TodoItemResponse:
     """Update a todo item.
 
-    1. Find the item by sk=ITEM#{list_id}#{item_id} (404 if not found)
-    2. Build update dict from non-None request fields
-    3. Handle completed toggle: set/clear completed_at accordingly
-    4. Apply partial update via update_item
+    Writes with a single conditional UpdateItem and builds the response from
+    the returned item, so there is no read beforehand:
+
+    1. Without a completed change, SET text/updated_at if the item exists
+    2. With one, additionally require completed to differ from the requested
+       value, and set completed_at (completing) or remove it (reopening);
+       the parent list's completed_count is then adjusted
+    3. If the item already has the requested completed value, fall back to
+       updating text/updated_at only, leaving completed_at untouched
+    4. 404 if the item does not exist
+
+    A request with no fields set writes nothing and returns the current item.
     """
     user_email = current_user["pk"]
     item_sk = f"ITEM#{list_id}#{item_id}"
 
-    existing = await todos_db.get_item(pk=user_email, sk=item_sk)
-    if existing is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo item not found",
-        )
+    if request.text is None and request.completed is None:
+        item = await todos_db.get_item(pk=user_email, sk=item_sk)
+        if not item:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Todo item not found",
+            )
+        return _item_to_response(item)
 
-    now = datetime.now(timezone.utc)
-    updates: dict[str, Any] = {"updated_at": now.isoformat()}
+    now_iso = datetime.now(timezone.utc).isoformat()
+    updates: dict[str, Any] = {"updated_at": now_iso}
 
     if request.text is not None:
         updates["text"] = request.text
 
-    if request.completed is not None:
-        updates["completed"] = request.completed
-        if request.completed and not existing.get("completed"):
-            updates["completed_at"] = now.isoformat()
-        elif not request.completed and existing.get("completed"):
-            updates["completed_at"] = None
-
-    await todos_db.update_item(pk=user_email, sk=item_sk, updates=updates)
-
-    return TodoItemResponse(
-        item_id=item_id,
-        list_id=list_id,
-        text=request.text if request.text is not None else existing["text"],
-        completed=request.completed
-        if request.completed is not None
-        else existing.get("completed", False),
-        completed_at=(
-            (
-                datetime.fromisoformat(updates["completed_at"])
-                if updates["completed_at"] is not None
-                else None
+    try:
+        if request.completed is None:
+            item = await todos_db.update_item(
+                pk=user_email, sk=item_sk, updates=updates, must_exist=True
             )
-            if "completed_at" in updates
-            else (
-                datetime.fromisoformat(existing["completed_at"])
-                if existing.get("completed_at")
-                else None
+        else:
+            item = await _toggle_completed(
+                todos_db, user_email, list_id, item_sk, updates, request.completed, now_iso
             )
-        ),
-        sort_order=existing.get("sort_order", 0),
-        created_at=datetime.fromisoformat(existing["created_at"]),
-        updated_at=now,
+    except NotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Todo item not found",
+        ) from e
+
+    return _item_to_response(item)
+
+
+async def _toggle_completed(
+    todos_db: DynamoDBClient,
+    user_email: str,
+    list_id: str,
+    item_sk: str,
+    updates: dict[str, Any],
+    completed: bool,
+    now_iso: str,
+) -> dict[str, Any]:
+    """Apply an update that sets completed, adjusting list counters on a real toggle.
+
+    Raises:
+        NotFoundError: If the item does not exist.
+    """
+    toggle = {**updates, "completed": completed}
+    if completed:
+        toggle["completed_at"] = now_iso
+    try:
+        item = await todos_db.update_item(
+            pk=user_email,
+            sk=item_sk,
+            updates=toggle,
+            remove=None if completed else ["completed_at"],
+            expect_different={"completed": completed},
+        )
+    except ConditionFailedError:
+        # Already in the requested state: keep its completed_at as is
+        return await todos_db.update_item(
+            pk=user_email, sk=item_sk, updates=updates, must_exist=True
+        )
+
+    await _adjust_list_counters(
+        todos_db, user_email, list_id, {"completed_count": 1 if completed else -1}
     )
+    return item
 
 
 @router.delete(
@@ -348,17 +409,23 @@ async def delete_item(
 ) -> None:
     """Delete a single todo item.
 
-    1. Verify the item exists (404 if not)
-    2. Delete by composite key (pk=user_email, sk=ITEM#{list_id}#{item_id})
+    Deletes by composite key (pk=user_email, sk=ITEM#{list_id}#{item_id})
+    conditioned on the item existing, so a missing item is a 404 without a
+    separate read, then decrements the parent list's counters using the
+    deleted item's attributes.
     """
     user_email = current_user["pk"]
     item_sk = f"ITEM#{list_id}#{item_id}"
 
-    existing = await todos_db.get_item(pk=user_email, sk=item_sk)
-    if existing is None:
+    try:
+        deleted = await todos_db.delete_item(pk=user_email, sk=item_sk, must_exist=True)
+    except NotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo item not found",
-        )
+        ) from e
 
-    await todos_db.delete_item(pk=user_email, sk=item_sk)
+    amounts = {"item_count": -1}
+    if deleted and deleted.get("completed"):
+        amounts["completed_count"] = -1
+    await _adjust_list_counters(todos_db, user_email, list_id, amounts)
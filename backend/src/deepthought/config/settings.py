@@ -27,6 +27,9 @@ class Settings(BaseSettings):
     # DynamoDB
     dynamodb_endpoint_url: str
     dc_dynamodb_endpoint: str
+    # Seconds query results stay in each process's cache (0 disables). Writes
+    # only evict the writing process's cache, so keep it off with multiple workers
+    dynamodb_query_cache_ttl: float = 0.0
 
     # LLM Configuration
     llm_model: str
@@ -4,12 +4,14 @@ from deepthought.core.exceptions import (
     AgentExecutionError,
     AuthenticationError,
     AuthorizationError,
+    ConditionFailedError,
     DatabaseError,
     DeepThoughtError,
     NotFoundError,
     ToolExecutionError,
     VerificationError,
 )
+from deepthought.core.timestamps import parse_iso_datetime
 
 __all__ = [
     "DeepThoughtError",
@@ -20,4 +22,6 @@ __all__ = [
     "AuthenticationError",
     "AuthorizationError",
     "NotFoundError",
+    "ConditionFailedError",
+    "parse_iso_datetime",
 ]
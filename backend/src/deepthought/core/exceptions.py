@@ -1,5 +1,7 @@
 """Custom exception classes for DeepThought."""
 
+from typing import Any
+
 
 class DeepThoughtError(Exception):
     """Base exception for DeepThought."""
@@ -54,3 +56,14 @@ class NotFoundError(DeepThoughtError):
         self.resource = resource
         self.identifier = identifier
         super().__init__(f"{resource} not found: {identifier}")
+
+
+class ConditionFailedError(DeepThoughtError):
+    """Raised when a conditional write is rejected because the item does not match.
+
+    Carries the item's current attributes so callers can react without re-reading it.
+    """
+
+    def __init__(self, item: dict[str, Any]) -> None:
+        self.item = item
+        super().__init__("Conditional write rejected: item does not match the condition")
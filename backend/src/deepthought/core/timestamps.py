@@ -0,0 +1,42 @@
+"""ISO 8601 timestamp parsing for stored DynamoDB attributes."""
+
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache
+
+_fast_parse: Callable[[str], datetime] | None
+try:
+    from ciso8601 import parse_datetime
+
+    _fast_parse = parse_datetime
+except ImportError:  # ciso8601 ships with the optional "speedups" extra
+    _fast_parse = None
+
+# Rows routinely share timestamps (created_at == updated_at, items created in
+# one burst, series instances), and datetimes are immutable, so parses are memoized
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp string.
+
+    Uses the ciso8601 C parser when it is installed, falling back to
+    datetime.fromisoformat when it is not or when it rejects the string.
+    Results are cached per string.
+
+    Args:
+        value: ISO 8601 timestamp, e.g. "2026-02-20T10:00:00+00:00".
+
+    Returns:
+        The parsed datetime.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 timestamp.
+    """
+    if _fast_parse is not None:
+        try:
+            return _fast_parse(value)
+        except ValueError:
+            pass
+    return datetime.fromisoformat(value)
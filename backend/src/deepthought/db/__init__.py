@@ -1,5 +1,10 @@
 """Database module for DeepThought."""
 
-from deepthought.db.client import DynamoDBClient
+from deepthought.db.client import (
+    DynamoDBClient,
+    close_table_clients,
+    get_session,
+    get_table_client,
+)
 
-__all__ = ["DynamoDBClient"]
+__all__ = ["DynamoDBClient", "close_table_clients", "get_session", "get_table_client"]
@@ -1,13 +1,181 @@
 """Async DynamoDB client wrapper."""
 
-from typing import Any
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, cast
 
 import aioboto3
+from aiobotocore.config import AioConfig
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from botocore.exceptions import ClientError
 
-from deepthought.core.exceptions import DatabaseError
+from deepthought.config import get_settings
+from deepthought.core.exceptions import ConditionFailedError, DatabaseError, NotFoundError
 from deepthought.models.database import ReturnValues
 
+# Shared (stateless) converters between Python values and DynamoDB's typed
+# attribute-value JSON, used in place of boto3's resource layer
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+# Keep pooled connections alive so requests sharing a client skip the TCP/TLS
+# handshake, with enough slots for the concurrent queries routes now issue.
+# Idle connections are kept for 30s (aiohttp's default is 12s), and bounded
+# connect/read timeouts stop a stalled endpoint from hanging a request.
+CLIENT_CONFIG = AioConfig(
+    connector_args={"keepalive_timeout": 30},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=5,
+    read_timeout=10,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+# BatchWriteItem accepts at most 25 requests per call, BatchGetItem 100 keys
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+
+# Backoff for resubmitting UnprocessedItems: base delay doubled per attempt
+BATCH_RETRY_BASE_DELAY = 0.05
+BATCH_MAX_RETRIES = 5
+
+# Chunks in flight at once per client, so large deletes don't burst past the
+# table's write capacity
+BATCH_MAX_CONCURRENCY = 8
+
+# Error codes for a throttled batch request, retried with the same backoff
+THROTTLING_ERROR_CODES = frozenset(
+    {"ProvisionedThroughputExceededException", "ThrottlingException"}
+)
+
+# Upper bound on partitions held by the in-process query cache; the oldest
+# partition is evicted first
+QUERY_CACHE_MAX_PARTITIONS = 10_000
+
+# Distinct update_item expression shapes (attribute names, not values) kept
+# compiled; routes only use a handful
+UPDATE_EXPRESSION_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=UPDATE_EXPRESSION_CACHE_SIZE)
+def _compile_update(
+    set_attrs: tuple[str, ...],
+    remove_attrs: tuple[str, ...],
+    cond_attrs: tuple[str, ...],
+    must_exist: bool,
+) -> tuple[str, str | None, dict[str, str], tuple[str, ...], tuple[str, ...]]:
+    """Build the expressions for an update_item call shape.
+
+    Only attribute names determine the expression strings, so the result is
+    cached and callers bind values to the returned placeholders.
+
+    Returns:
+        The UpdateExpression, the ConditionExpression (or None), the
+        ExpressionAttributeNames, and the value placeholders for set_attrs and
+        cond_attrs in order. The names dict is shared and must not be mutated.
+    """
+    names: dict[str, str] = {}
+    clauses: list[str] = []
+
+    set_keys = tuple(f":val{i}" for i in range(len(set_attrs)))
+    if set_attrs:
+        set_parts: list[str] = []
+        for i, attr in enumerate(set_attrs):
+            names[f"#attr{i}"] = attr
+            set_parts.append(f"#attr{i} = {set_keys[i]}")
+        clauses.append("SET " + ", ".join(set_parts))
+
+    if remove_attrs:
+        for i, attr in enumerate(remove_attrs):
+            names[f"#rm{i}"] = attr
+        clauses.append("REMOVE " + ", ".join(f"#rm{i}" for i in range(len(remove_attrs))))
+
+    cond_keys = tuple(f":cond{i}" for i in range(len(cond_attrs)))
+    conditions: list[str] = []
+    if must_exist or cond_attrs:
+        conditions.append("attribute_exists(pk)")
+    for i, attr in enumerate(cond_attrs):
+        names[f"#cond{i}"] = attr
+        conditions.append(f"#cond{i} <> {cond_keys[i]}")
+
+    condition = " AND ".join(conditions) if conditions else None
+    return " ".join(clauses), condition, names, set_keys, cond_keys
+
+
+# Key conditions for the base table's pk/sk keys. The low-level client takes
+# expression strings rather than boto3's Key() objects, so each shape is a
+# constant and only the bound values change per call
+KEY_PK = "pk = :pk"
+KEY_PK_SK_PREFIX = "pk = :pk AND begins_with(sk, :sk_prefix)"
+KEY_PK_SK_END = "pk = :pk AND sk <= :sk_end"
+
+
+def _key_condition_kwargs(
+    pk: str, sk_prefix: str | None = None, sk_end: str | None = None
+) -> dict[str, Any]:
+    """Build KeyConditionExpression kwargs; sk_prefix takes precedence over sk_end."""
+    if sk_prefix:
+        expression = KEY_PK_SK_PREFIX
+        values = {":pk": {"S": pk}, ":sk_prefix": {"S": sk_prefix}}
+    elif sk_end:
+        expression = KEY_PK_SK_END
+        values = {":pk": {"S": pk}, ":sk_end": {"S": sk_end}}
+    else:
+        expression = KEY_PK
+        values = {":pk": {"S": pk}}
+    return {
+        "KeyConditionExpression": expression,
+        "ExpressionAttributeValues": values,
+    }
+
+
+@lru_cache
+def get_session() -> aioboto3.Session:
+    """Get the process-wide aioboto3 session (singleton).
+
+    Building a session runs boto3's synchronous config and credential-provider
+    setup, so it is done once and shared by every DynamoDBClient.
+    """
+    return aioboto3.Session()
+
+
+def _projection_kwargs(attributes: list[str]) -> dict[str, Any]:
+    """Build ProjectionExpression kwargs, aliasing names to dodge reserved words."""
+    names = {f"#proj{i}": attr for i, attr in enumerate(attributes)}
+    return {
+        "ProjectionExpression": ", ".join(names),
+        "ExpressionAttributeNames": names,
+    }
+
+
+def _serialize(values: dict[str, Any]) -> dict[str, Any]:
+    """Convert a dict of Python values to DynamoDB attribute values."""
+    return {k: _serializer.serialize(v) for k, v in values.items()}
+
+
+def _key(pk: str, sk: str | None = None) -> dict[str, Any]:
+    """Build a typed primary key; pk and sk are always strings, so skip the serializer."""
+    if sk is None:
+        return {"pk": {"S": pk}}
+    return {"pk": {"S": pk}, "sk": {"S": sk}}
+
+
+def _deserialize(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a dict of DynamoDB attribute values to Python values.
+
+    String attributes (keys, ids, text, ISO timestamps) make up most of every
+    item, so they are unwrapped inline rather than through the deserializer.
+    """
+    return {k: v["S"] if "S" in v else _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def _deserialize_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Deserialize a page of raw items from a query response."""
+    return [_deserialize(item) for item in items]
+
 
 class DynamoDBClient:
     """Async wrapper for DynamoDB operations."""
@@ -17,11 +185,83 @@ class DynamoDBClient:
         table_name: str,
         region: str = "us-east-1",
         endpoint_url: str | None = None,
+        config: AioConfig = CLIENT_CONFIG,
+        query_cache_ttl: float = 0.0,
     ) -> None:
         self.table_name = table_name
         self.region = region
         self.endpoint_url = endpoint_url
-        self._session = aioboto3.Session()
+        self._config = config
+        self._session = get_session()
+        self._exit_stack: AsyncExitStack | None = None
+        self._cached_client: Any = None
+        self._connect_lock = asyncio.Lock()
+        self._batch_semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+        # query() results per partition: pk -> {query args: (expires_at, items)}.
+        # Disabled when the TTL is 0; writes through this client evict their pk.
+        self._query_cache_ttl = query_cache_ttl
+        self._query_cache: dict[str, dict[tuple[Any, ...], tuple[float, list[dict[str, Any]]]]] = {}
+        self._write_count = 0
+
+    async def connect(self) -> None:
+        """
+        Open a long-lived low-level DynamoDB client and cache it.
+
+        Until connect() is called (or after close()), each operation opens and
+        tears down its own client. Calling connect() on a connected client is
+        a no-op.
+        """
+        if self._exit_stack is not None:
+            return
+        async with self._connect_lock:
+            if self._exit_stack is not None:
+                return
+            stack = AsyncExitStack()
+            self._cached_client = await stack.enter_async_context(
+                self._session.client(
+                    "dynamodb",
+                    region_name=self.region,
+                    endpoint_url=self.endpoint_url,
+                    config=self._config,
+                )
+            )
+            self._exit_stack = stack
+
+    async def close(self) -> None:
+        """Close the client opened by connect(), if any."""
+        if self._exit_stack is None:
+            return
+        stack, self._exit_stack, self._cached_client = self._exit_stack, None, None
+        await stack.aclose()
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[Any]:
+        """Yield the cached client, or a per-call one if not connected."""
+        if self._cached_client is not None:
+            yield self._cached_client
+            return
+        async with self._session.client(
+            "dynamodb",
+            region_name=self.region,
+            endpoint_url=self.endpoint_url,
+            config=self._config,
+        ) as client:
+            yield client
+
+    @contextmanager
+    def _writes_to(self, *pks: str) -> Iterator[None]:
+        """Evict cached queries for the given partitions once a write finishes.
+
+        Eviction runs even if the write fails, since it may still have been
+        applied. Bumping the write count stops queries already in flight
+        from caching what they read before the write.
+        """
+        try:
+            yield
+        finally:
+            self._write_count += 1
+            for pk in pks:
+                self._query_cache.pop(pk, None)
 
     async def get_item(self, pk: str, sk: str | None = None) -> dict[str, Any] | None:
         """
@@ -38,17 +278,10 @@ class DynamoDBClient:
             DatabaseError: If the operation fails.
         """
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-                key: dict[str, str] = {"pk": pk}
-                if sk is not None:
-                    key["sk"] = sk
-                response = await table.get_item(Key=key)
-                return response.get("Item")
+            async with self._client() as client:
+                response = await client.get_item(TableName=self.table_name, Key=_key(pk, sk))
+                item = response.get("Item")
+                return _deserialize(item) if item is not None else None
         except ClientError as e:
             raise DatabaseError(f"Failed to get item: {e}") from e
 
@@ -63,13 +296,9 @@ class DynamoDBClient:
             DatabaseError: If the operation fails.
         """
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-                await table.put_item(Item=item)
+            with self._writes_to(item["pk"]):
+                async with self._client() as client:
+                    await client.put_item(TableName=self.table_name, Item=_serialize(item))
         except ClientError as e:
             raise DatabaseError(f"Failed to put item: {e}") from e
 
@@ -78,45 +307,90 @@ class DynamoDBClient:
         pk: str,
         sk_prefix: str | None = None,
         limit: int | None = None,
+        sk_end: str | None = None,
+        projection: list[str] | None = None,
+        use_cache: bool = True,
     ) -> list[dict[str, Any]]:
         """
-        Query items by partition key with optional sort key prefix.
+        Query items by partition key with optional sort key prefix or upper bound.
+
+        When the client has a query cache TTL, results are served from memory
+        until they expire or a write through this client touches the partition.
+        Reads that feed a write should pass use_cache=False.
 
         Args:
             pk: Partition key value
             sk_prefix: Optional sort key prefix for begins_with condition
-            limit: Maximum number of items to return
+            limit: Maximum number of items to return (a single page); without
+                one, every page is fetched
+            sk_end: Optional inclusive upper bound on the sort key
+            projection: Optional attribute names to return instead of whole items
+            use_cache: Whether this query may be served from the query cache
 
         Returns:
             List of matching items.
 
         Raises:
+            ValueError: If both sk_prefix and sk_end are given.
             DatabaseError: If the operation fails.
         """
+        if sk_prefix and sk_end:
+            raise ValueError("sk_prefix and sk_end cannot be combined")
+
+        if self._query_cache_ttl <= 0 or not use_cache:
+            return await self._query(pk, sk_prefix, limit, sk_end, projection)
+
+        cache_key = (sk_prefix, limit, sk_end, tuple(projection) if projection else None)
+        partition = self._query_cache.get(pk)
+        cached = partition.get(cache_key) if partition else None
+        if cached is not None and cached[0] > time.monotonic():
+            return [dict(item) for item in cached[1]]
+
+        write_count = self._write_count
+        items = await self._query(pk, sk_prefix, limit, sk_end, projection)
+        if self._write_count == write_count:
+            self._cache_query(pk, cache_key, items)
+        return [dict(item) for item in items]
+
+    def _cache_query(
+        self, pk: str, cache_key: tuple[Any, ...], items: list[dict[str, Any]]
+    ) -> None:
+        """Store query results for a partition, evicting the oldest partition if full."""
+        partition = self._query_cache.get(pk)
+        if partition is None:
+            if len(self._query_cache) >= QUERY_CACHE_MAX_PARTITIONS:
+                del self._query_cache[next(iter(self._query_cache))]
+            partition = self._query_cache[pk] = {}
+        partition[cache_key] = (time.monotonic() + self._query_cache_ttl, items)
+
+    async def _query(
+        self,
+        pk: str,
+        sk_prefix: str | None,
+        limit: int | None,
+        sk_end: str | None,
+        projection: list[str] | None,
+    ) -> list[dict[str, Any]]:
+        """Run a query against DynamoDB, bypassing the query cache."""
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-
-                key_condition = "pk = :pk"
-                expression_values: dict[str, Any] = {":pk": pk}
-
-                if sk_prefix:
-                    key_condition += " AND begins_with(sk, :sk_prefix)"
-                    expression_values[":sk_prefix"] = sk_prefix
-
+            async with self._client() as client:
                 kwargs: dict[str, Any] = {
-                    "KeyConditionExpression": key_condition,
-                    "ExpressionAttributeValues": expression_values,
+                    "TableName": self.table_name,
+                    **_key_condition_kwargs(pk, sk_prefix, sk_end),
                 }
                 if limit:
                     kwargs["Limit"] = limit
-
-                response = await table.query(**kwargs)
-                return response.get("Items", [])
+                if projection:
+                    kwargs.update(_projection_kwargs(projection))
+
+                response = await client.query(**kwargs)
+                items = _deserialize_items(response.get("Items", []))
+                # Unlimited queries follow pagination so partitions over 1 MB come back whole
+                while not limit and "LastEvaluatedKey" in response:
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                    response = await client.query(**kwargs)
+                    items.extend(_deserialize_items(response.get("Items", [])))
+                return items
         except ClientError as e:
             raise DatabaseError(f"Failed to query items: {e}") from e
 
@@ -126,79 +400,222 @@ class DynamoDBClient:
         sk: str,
         updates: dict[str, Any],
         return_values: ReturnValues = ReturnValues.ALL_NEW,
+        remove: list[str] | None = None,
+        must_exist: bool = False,
+        expect_different: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
-        Partial attribute update via UpdateExpression with SET clauses.
+        Partial attribute update via UpdateExpression with SET and REMOVE clauses.
 
         Args:
             pk: Partition key value.
             sk: Sort key value.
             updates: Dictionary of attribute names to new values.
             return_values: What to return after the update (default ALL_NEW).
+            remove: Attribute names to delete from the item.
+            must_exist: Make the update conditional on the item existing, so it
+                never creates a partial item.
+            expect_different: Only apply the update if each attribute currently
+                differs from the given value (implies must_exist).
 
         Returns:
             The returned item attributes (depends on return_values).
 
         Raises:
+            NotFoundError: If a condition was requested and the item does not exist.
+            ConditionFailedError: If an expect_different attribute already holds
+                the given value; carries the item's current attributes.
             DatabaseError: If the operation fails.
         """
+        expect_different = expect_different or {}
+        expression, condition, names, set_keys, cond_keys = _compile_update(
+            tuple(updates), tuple(remove or ()), tuple(expect_different), must_exist
+        )
+        expression_values = dict(zip(set_keys, updates.values(), strict=True))
+        expression_values.update(zip(cond_keys, expect_different.values(), strict=True))
+
+        kwargs: dict[str, Any] = {
+            "TableName": self.table_name,
+            "Key": _key(pk, sk),
+            "UpdateExpression": expression,
+            "ExpressionAttributeNames": dict(names),
+            "ReturnValues": return_values,
+        }
+        if condition:
+            kwargs["ConditionExpression"] = condition
+        if expect_different:
+            # Lets a failed check report the current item instead of needing a read
+            kwargs["ReturnValuesOnConditionCheckFailure"] = ReturnValues.ALL_OLD
+        if expression_values:
+            kwargs["ExpressionAttributeValues"] = _serialize(expression_values)
+
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-
-                set_parts: list[str] = []
-                expression_names: dict[str, str] = {}
-                expression_values: dict[str, Any] = {}
-
-                for i, (attr, value) in enumerate(updates.items()):
-                    placeholder_name = f"#attr{i}"
-                    placeholder_value = f":val{i}"
-                    set_parts.append(f"{placeholder_name} = {placeholder_value}")
-                    expression_names[placeholder_name] = attr
-                    expression_values[placeholder_value] = value
-
-                response = await table.update_item(
-                    Key={"pk": pk, "sk": sk},
-                    UpdateExpression="SET " + ", ".join(set_parts),
-                    ExpressionAttributeNames=expression_names,
-                    ExpressionAttributeValues=expression_values,
-                    ReturnValues=return_values,
-                )
-                return response.get("Attributes", {})
+            with self._writes_to(pk):
+                async with self._client() as client:
+                    response = await client.update_item(**kwargs)
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                current = cast(dict[str, Any] | None, e.response.get("Item"))
+                if current:
+                    raise ConditionFailedError(_deserialize(current)) from e
+                raise NotFoundError("Item", f"{pk}/{sk}") from e
             raise DatabaseError(f"Failed to update item: {e}") from e
+        return _deserialize(response.get("Attributes", {}))
+
+    async def increment_counter(self, pk: str, sk: str, field: str, amount: int = 1) -> int:
+        """
+        Atomically add to a numeric attribute of an existing item.
+
+        Args:
+            pk: Partition key value.
+            sk: Sort key value.
+            field: Name of the numeric attribute to adjust.
+            amount: Value to add (negative to decrement).
+
+        Returns:
+            The counter value after the update.
+
+        Raises:
+            NotFoundError: If the item does not exist.
+            DatabaseError: If the operation fails.
+        """
+        counters = await self.increment_counters(pk=pk, sk=sk, amounts={field: amount})
+        return counters[field]
+
+    async def increment_counters(
+        self, pk: str, sk: str, amounts: dict[str, int]
+    ) -> dict[str, int]:
+        """
+        Atomically add to several numeric attributes of an existing item.
 
-    async def delete_item(self, pk: str, sk: str) -> None:
+        Uses a single ADD update so the counters change server-side without a
+        read, and a missing attribute starts from zero.
+
+        Args:
+            pk: Partition key value.
+            sk: Sort key value.
+            amounts: Mapping of attribute names to the value to add to each.
+
+        Returns:
+            The updated counter values, keyed by attribute name.
+
+        Raises:
+            NotFoundError: If the item does not exist.
+            DatabaseError: If the operation fails.
+        """
+        add_parts: list[str] = []
+        expression_names: dict[str, str] = {}
+        expression_values: dict[str, Any] = {}
+
+        for i, (field, amount) in enumerate(amounts.items()):
+            add_parts.append(f"#f{i} :amount{i}")
+            expression_names[f"#f{i}"] = field
+            expression_values[f":amount{i}"] = amount
+
+        try:
+            with self._writes_to(pk):
+                async with self._client() as client:
+                    response = await client.update_item(
+                        TableName=self.table_name,
+                        Key=_key(pk, sk),
+                        UpdateExpression="ADD " + ", ".join(add_parts),
+                        ConditionExpression="attribute_exists(pk)",
+                        ExpressionAttributeNames=expression_names,
+                        ExpressionAttributeValues=_serialize(expression_values),
+                        ReturnValues=ReturnValues.UPDATED_NEW,
+                    )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise NotFoundError("Item", f"{pk}/{sk}") from e
+            raise DatabaseError(f"Failed to increment counters: {e}") from e
+        attributes = _deserialize(response["Attributes"])
+        return {field: int(attributes[field]) for field in amounts}
+
+    async def delete_item(
+        self, pk: str, sk: str, must_exist: bool = False
+    ) -> dict[str, Any] | None:
         """
         Delete an item by composite key.
 
         Args:
             pk: Partition key value.
             sk: Sort key value.
+            must_exist: Make the delete conditional on the item existing, so
+                callers can skip a separate existence check.
+
+        Returns:
+            The deleted item's attributes, or None if nothing was deleted.
 
         Raises:
+            NotFoundError: If must_exist is set and the item does not exist.
             DatabaseError: If the operation fails.
         """
+        kwargs: dict[str, Any] = {
+            "TableName": self.table_name,
+            "Key": _key(pk, sk),
+            "ReturnValues": ReturnValues.ALL_OLD,
+        }
+        if must_exist:
+            kwargs["ConditionExpression"] = "attribute_exists(pk)"
+
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-                await table.delete_item(Key={"pk": pk, "sk": sk})
+            with self._writes_to(pk):
+                async with self._client() as client:
+                    response = await client.delete_item(**kwargs)
         except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                raise NotFoundError("Item", f"{pk}/{sk}") from e
             raise DatabaseError(f"Failed to delete item: {e}") from e
+        old = response.get("Attributes")
+        return _deserialize(old) if old else None
+
+    async def replace_item(self, pk: str, old_sk: str, item: dict[str, Any]) -> None:
+        """
+        Atomically delete an item and put its replacement under a new key.
+
+        Used when a sort key component changes, since DynamoDB keys are
+        immutable. Both writes go in one TransactWriteItems call, so readers
+        never see the item missing or duplicated.
+
+        Args:
+            pk: Partition key value of the item being replaced.
+            old_sk: Sort key value of the item being replaced.
+            item: The replacement item (must include pk and sk).
+
+        Raises:
+            DatabaseError: If the transaction fails.
+        """
+        try:
+            with self._writes_to(pk, item["pk"]):
+                async with self._client() as client:
+                    await client.transact_write_items(
+                        TransactItems=[
+                            {
+                                "Delete": {
+                                    "TableName": self.table_name,
+                                    "Key": _key(pk, old_sk),
+                                }
+                            },
+                            {
+                                "Put": {
+                                    "TableName": self.table_name,
+                                    "Item": _serialize(item),
+                                }
+                            },
+                        ]
+                    )
+        except ClientError as e:
+            raise DatabaseError(f"Failed to replace item: {e}") from e
 
     async def batch_delete(self, items: list[tuple[str, str]]) -> None:
         """
         Batch delete items by primary key (pk + sk).
 
-        Handles DynamoDB's 25-item batch limit internally by chunking.
+        Splits the keys into BatchWriteItem chunks of 25 and sends up to
+        BATCH_MAX_CONCURRENCY chunks concurrently. Deletes DynamoDB reports as
+        unprocessed, and throttled chunks, are resubmitted with exponential
+        backoff.
+        A single key is sent as a plain DeleteItem instead.
         Useful for deleting a todo list and all its items in one call.
 
         Args:
@@ -209,24 +626,131 @@ class DynamoDBClient:
         """
         if not items:
             return
+        if len(items) == 1:
+            pk, sk = items[0]
+            try:
+                with self._writes_to(pk):
+                    async with self._client() as client:
+                        await client.delete_item(
+                            TableName=self.table_name, Key=_key(pk, sk)
+                        )
+            except ClientError as e:
+                raise DatabaseError(f"Failed to batch delete items: {e}") from e
+            return
+
+        chunks = [
+            {
+                self.table_name: [
+                    {"DeleteRequest": {"Key": _key(pk, sk)}}
+                    for pk, sk in items[i : i + BATCH_WRITE_LIMIT]
+                ]
+            }
+            for i in range(0, len(items), BATCH_WRITE_LIMIT)
+        ]
 
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-
-                # DynamoDB BatchWriteItem supports max 25 operations per call
-                for i in range(0, len(items), 25):
-                    chunk = items[i : i + 25]
-                    async with table.batch_writer() as batch:
-                        for pk, sk in chunk:
-                            await batch.delete_item(Key={"pk": pk, "sk": sk})
+            with self._writes_to(*{pk for pk, _ in items}):
+                async with self._client() as client:
+                    await asyncio.gather(
+                        *(self._batch_write_chunk(client, chunk) for chunk in chunks)
+                    )
         except ClientError as e:
             raise DatabaseError(f"Failed to batch delete items: {e}") from e
 
+    async def _batch_write_chunk(self, client: Any, request_items: dict[str, Any]) -> None:
+        """Send one BatchWriteItem chunk, resubmitting unprocessed requests with backoff."""
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            try:
+                async with self._batch_semaphore:
+                    response = await client.batch_write_item(RequestItems=request_items)
+            except ClientError as e:
+                if (
+                    e.response["Error"]["Code"] not in THROTTLING_ERROR_CODES
+                    or attempt == BATCH_MAX_RETRIES
+                ):
+                    raise
+            else:
+                request_items = response.get("UnprocessedItems") or {}
+                if not request_items:
+                    return
+            if attempt < BATCH_MAX_RETRIES:
+                await asyncio.sleep(BATCH_RETRY_BASE_DELAY * 2**attempt)
+        raise DatabaseError(
+            f"Failed to batch delete items: requests still unprocessed after "
+            f"{BATCH_MAX_RETRIES} retries"
+        )
+
+    async def batch_get(self, keys: list[tuple[str, str]]) -> list[dict[str, Any]]:
+        """
+        Fetch items by primary key (pk + sk) with BatchGetItem.
+
+        Duplicate keys are requested once. Keys are split into chunks of 100
+        sent concurrently, and keys DynamoDB reports as unprocessed are
+        resubmitted with exponential backoff.
+
+        Args:
+            keys: List of (pk, sk) tuples to fetch.
+
+        Returns:
+            The items found, in no particular order; missing keys are omitted.
+
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return []
+
+        chunks = [
+            {
+                self.table_name: {
+                    "Keys": [
+                        _key(pk, sk)
+                        for pk, sk in unique_keys[i : i + BATCH_GET_LIMIT]
+                    ]
+                }
+            }
+            for i in range(0, len(unique_keys), BATCH_GET_LIMIT)
+        ]
+
+        try:
+            async with self._client() as client:
+                pages = await asyncio.gather(
+                    *(self._batch_get_chunk(client, chunk) for chunk in chunks)
+                )
+        except ClientError as e:
+            raise DatabaseError(f"Failed to batch get items: {e}") from e
+        return [item for page in pages for item in page]
+
+    async def _batch_get_chunk(
+        self, client: Any, request_items: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Send one BatchGetItem chunk, resubmitting unprocessed or throttled keys with backoff."""
+        items: list[dict[str, Any]] = []
+        for attempt in range(BATCH_MAX_RETRIES + 1):
+            try:
+                async with self._batch_semaphore:
+                    response = await client.batch_get_item(RequestItems=request_items)
+            except ClientError as e:
+                if (
+                    e.response["Error"]["Code"] not in THROTTLING_ERROR_CODES
+                    or attempt == BATCH_MAX_RETRIES
+                ):
+                    raise
+            else:
+                items.extend(
+                    _deserialize_items(response.get("Responses", {}).get(self.table_name, []))
+                )
+                request_items = response.get("UnprocessedKeys") or {}
+                if not request_items:
+                    return items
+            if attempt < BATCH_MAX_RETRIES:
+                await asyncio.sleep(BATCH_RETRY_BASE_DELAY * 2**attempt)
+        raise DatabaseError(
+            f"Failed to batch get items: keys still unprocessed after "
+            f"{BATCH_MAX_RETRIES} retries"
+        )
+
     async def query_between(
         self,
         pk: str,
@@ -236,6 +760,8 @@ class DynamoDBClient:
         """
         Range query with sk BETWEEN for date-range lookups.
 
+        Follows LastEvaluatedKey so ranges over 1 MB come back whole.
+
         Args:
             pk: Partition key value.
             sk_start: Start of sort key range (inclusive).
@@ -248,21 +774,25 @@ class DynamoDBClient:
             DatabaseError: If the operation fails.
         """
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-                response = await table.query(
-                    KeyConditionExpression="pk = :pk AND sk BETWEEN :start AND :end",
-                    ExpressionAttributeValues={
-                        ":pk": pk,
-                        ":start": sk_start,
-                        ":end": sk_end,
-                    },
-                )
-                return response.get("Items", [])
+            async with self._client() as client:
+                kwargs: dict[str, Any] = {
+                    "TableName": self.table_name,
+                    "KeyConditionExpression": "pk = :pk AND sk BETWEEN :start AND :end",
+                    "ExpressionAttributeValues": _serialize(
+                        {
+                            ":pk": pk,
+                            ":start": sk_start,
+                            ":end": sk_end,
+                        }
+                    ),
+                }
+                response = await client.query(**kwargs)
+                items = _deserialize_items(response.get("Items", []))
+                while "LastEvaluatedKey" in response:
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                    response = await client.query(**kwargs)
+                    items.extend(_deserialize_items(response.get("Items", [])))
+                return items
         except ClientError as e:
             raise DatabaseError(f"Failed to query between: {e}") from e
 
@@ -270,7 +800,8 @@ class DynamoDBClient:
         """
         Count items by partition key with optional sort key prefix.
 
-        Uses Select='COUNT' to avoid transferring item data.
+        Uses Select='COUNT' to avoid transferring item data, and sums the
+        counts of every page so partitions over 1 MB are counted in full.
 
         Args:
             pk: Partition key value.
@@ -283,26 +814,19 @@ class DynamoDBClient:
             DatabaseError: If the operation fails.
         """
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-
-                key_condition = "pk = :pk"
-                expression_values: dict[str, Any] = {":pk": pk}
-
-                if sk_prefix:
-                    key_condition += " AND begins_with(sk, :sk_prefix)"
-                    expression_values[":sk_prefix"] = sk_prefix
-
-                response = await table.query(
-                    KeyConditionExpression=key_condition,
-                    ExpressionAttributeValues=expression_values,
-                    Select="COUNT",
-                )
-                return response.get("Count", 0)
+            async with self._client() as client:
+                kwargs: dict[str, Any] = {
+                    "TableName": self.table_name,
+                    "Select": "COUNT",
+                    **_key_condition_kwargs(pk, sk_prefix),
+                }
+                response = await client.query(**kwargs)
+                count: int = response.get("Count", 0)
+                while "LastEvaluatedKey" in response:
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                    response = await client.query(**kwargs)
+                    count += response.get("Count", 0)
+                return count
         except ClientError as e:
             raise DatabaseError(f"Failed to query count: {e}") from e
 
@@ -314,10 +838,13 @@ class DynamoDBClient:
         sk_attr: str,
         sk_start: str,
         sk_end: str,
+        projection: list[str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Query a Global Secondary Index with a range condition on the GSI sort key.
 
+        Follows LastEvaluatedKey so ranges over 1 MB come back whole.
+
         Args:
             index_name: Name of the GSI to query.
             pk_attr: GSI partition key attribute name.
@@ -325,6 +852,7 @@ class DynamoDBClient:
             sk_attr: GSI sort key attribute name.
             sk_start: Start of sort key range (inclusive).
             sk_end: End of sort key range (inclusive).
+            projection: Optional attribute names to return instead of whole items.
 
         Returns:
             List of matching items.
@@ -333,25 +861,119 @@ class DynamoDBClient:
             DatabaseError: If the operation fails.
         """
         try:
-            async with self._session.resource(
-                "dynamodb",
-                region_name=self.region,
-                endpoint_url=self.endpoint_url,
-            ) as dynamodb:
-                table = await dynamodb.Table(self.table_name)
-                response = await table.query(
-                    IndexName=index_name,
-                    KeyConditionExpression="#pk = :pk AND #sk BETWEEN :start AND :end",
-                    ExpressionAttributeNames={
+            async with self._client() as client:
+                kwargs: dict[str, Any] = {
+                    "TableName": self.table_name,
+                    "IndexName": index_name,
+                    "KeyConditionExpression": "#pk = :pk AND #sk BETWEEN :start AND :end",
+                    "ExpressionAttributeNames": {
                         "#pk": pk_attr,
                         "#sk": sk_attr,
                     },
-                    ExpressionAttributeValues={
-                        ":pk": pk_value,
-                        ":start": sk_start,
-                        ":end": sk_end,
+                    "ExpressionAttributeValues": _serialize(
+                        {
+                            ":pk": pk_value,
+                            ":start": sk_start,
+                            ":end": sk_end,
+                        }
+                    ),
+                }
+                if projection:
+                    projected = _projection_kwargs(projection)
+                    kwargs["ProjectionExpression"] = projected["ProjectionExpression"]
+                    kwargs["ExpressionAttributeNames"].update(
+                        projected["ExpressionAttributeNames"]
+                    )
+
+                response = await client.query(**kwargs)
+                items = _deserialize_items(response.get("Items", []))
+                while "LastEvaluatedKey" in response:
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                    response = await client.query(**kwargs)
+                    items.extend(_deserialize_items(response.get("Items", [])))
+                return items
+        except ClientError as e:
+            raise DatabaseError(f"Failed to query GSI: {e}") from e
+
+    async def query_gsi(
+        self,
+        index_name: str,
+        pk_attr: str,
+        pk_value: str,
+        sk_attr: str,
+        sk_value: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Query a Global Secondary Index for an exact GSI key match.
+
+        Follows LastEvaluatedKey so matches over 1 MB come back whole.
+
+        Args:
+            index_name: Name of the GSI to query.
+            pk_attr: GSI partition key attribute name.
+            pk_value: GSI partition key value.
+            sk_attr: GSI sort key attribute name.
+            sk_value: GSI sort key value.
+
+        Returns:
+            List of matching items.
+
+        Raises:
+            DatabaseError: If the operation fails.
+        """
+        try:
+            async with self._client() as client:
+                kwargs: dict[str, Any] = {
+                    "TableName": self.table_name,
+                    "IndexName": index_name,
+                    "KeyConditionExpression": "#pk = :pk AND #sk = :sk",
+                    "ExpressionAttributeNames": {
+                        "#pk": pk_attr,
+                        "#sk": sk_attr,
                     },
-                )
-                return response.get("Items", [])
+                    "ExpressionAttributeValues": _serialize(
+                        {
+                            ":pk": pk_value,
+                            ":sk": sk_value,
+                        }
+                    ),
+                }
+                response = await client.query(**kwargs)
+                items = _deserialize_items(response.get("Items", []))
+                while "LastEvaluatedKey" in response:
+                    kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                    response = await client.query(**kwargs)
+                    items.extend(_deserialize_items(response.get("Items", [])))
+                return items
         except ClientError as e:
             raise DatabaseError(f"Failed to query GSI: {e}") from e
+
+
+# Every client handed out by get_table_client, so shutdown can close them
+_table_clients: list[DynamoDBClient] = []
+
+
+@lru_cache
+def get_table_client(table_name: str) -> DynamoDBClient:
+    """Get the shared DynamoDB client for a table (one per table name).
+
+    API routes and agent tools resolve tables through here, so every caller
+    of a table shares one client and, once connected, one connection pool.
+    Reusing the client also lets its query cache serve repeated reads of
+    the same partition.
+    """
+    settings = get_settings()
+    client = DynamoDBClient(
+        table_name=table_name,
+        region=settings.aws_region,
+        endpoint_url=settings.dynamodb_endpoint_url,
+        query_cache_ttl=settings.dynamodb_query_cache_ttl,
+    )
+    _table_clients.append(client)
+    return client
+
+
+async def close_table_clients() -> None:
+    """Close the long-lived connections of every shared table client."""
+    for client in _table_clients:
+        await client.close()
@@ -4,7 +4,13 @@
 from deepthought.tools.database import query_dynamodb
 
 # Math operation tools
-from deepthought.tools.math_ops import add_values, divide_values, multiply_values, subtract_values
+from deepthought.tools.math_ops import (
+    TOOL_TO_OP,
+    add_values,
+    divide_values,
+    multiply_values,
+    subtract_values,
+)
 
 # Verification tools
 from deepthought.tools.verification import (
@@ -25,6 +31,7 @@ __all__ = [
     "subtract_values",
     "multiply_values",
     "divide_values",
+    "TOOL_TO_OP",
     # Verification
     "verify_addition",
     "verify_subtraction",
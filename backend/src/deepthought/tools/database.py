@@ -1,12 +1,14 @@
 """Database tools for agents."""
 
+import asyncio
+from functools import lru_cache
 from typing import Any
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
 from deepthought.config import get_settings
-from deepthought.db import DynamoDBClient
+from deepthought.db import DynamoDBClient, get_table_client
 
 
 class QueryDynamoDBInput(BaseModel):
@@ -16,6 +18,64 @@ class QueryDynamoDBInput(BaseModel):
     sk: str = Field(..., description="Sort key value")
 
 
+class _GetItemCoalescer:
+    """Merge concurrent get_item lookups into BatchGetItem calls.
+
+    Keys requested before the pending flush task first runs (i.e. within the
+    same event-loop iteration) are fetched together with one batch_get, so
+    concurrent agent runs share a round trip instead of adding latency.
+    """
+
+    def __init__(self, client: DynamoDBClient) -> None:
+        self._client = client
+        self._pending: dict[tuple[str, str], list[asyncio.Future[dict[str, Any] | None]]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def get(self, pk: str, sk: str) -> dict[str, Any] | None:
+        """Get an item by primary key, batched with other pending lookups."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+        if not self._pending:
+            self._flush_task = loop.create_task(self._flush())
+        self._pending.setdefault((pk, sk), []).append(future)
+        return await future
+
+    async def _flush(self) -> None:
+        """Fetch every pending key and resolve its waiters."""
+        pending, self._pending = self._pending, {}
+        try:
+            await self._client.connect()
+            items = await self._client.batch_get(list(pending))
+        except asyncio.CancelledError:
+            for futures in pending.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        found = {(item["pk"], item["sk"]): item for item in items}
+        for key, futures in pending.items():
+            item = found.get(key)
+            for future in futures:
+                if not future.done():
+                    future.set_result(dict(item) if item is not None else None)
+
+
+@lru_cache
+def _pairs_coalescer() -> _GetItemCoalescer:
+    """Get the shared lookup coalescer for the pairs table (singleton).
+
+    Uses the same table client as the API routes, so lookups reuse its pooled
+    connections.
+    """
+    return _GetItemCoalescer(get_table_client(get_settings().dynamodb_pairs_table))
+
+
 @tool(args_schema=QueryDynamoDBInput)
 async def query_dynamodb(pk: str, sk: str) -> dict[str, Any] | None:
     """
@@ -28,12 +88,4 @@ async def query_dynamodb(pk: str, sk: str) -> dict[str, Any] | None:
     Returns:
         The item if found, None otherwise.
     """
-    settings = get_settings()
-    client = DynamoDBClient(
-        table_name=settings.dynamodb_pairs_table,
-        region=settings.aws_region,
-        endpoint_url=settings.dynamodb_endpoint_url,
-    )
-
-    item = await client.get_item(pk=pk, sk=sk)
-    return item
+    return await _pairs_coalescer().get(pk=pk, sk=sk)
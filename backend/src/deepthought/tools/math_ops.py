@@ -92,3 +92,12 @@ def subtract_values(val1: int | float, val2: int | float) -> int | float:
         The difference of val1 - val2.
     """
     return val1 - val2
+
+
+# Map calculation tool names to the operation they perform
+TOOL_TO_OP = {
+    add_values.name: "add",
+    subtract_values.name: "subtract",
+    multiply_values.name: "multiply",
+    divide_values.name: "divide",
+}
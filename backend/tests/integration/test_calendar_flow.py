@@ -60,8 +60,10 @@ def mock_calendar_db():
     mock.get_item = AsyncMock(return_value=None)
     mock.put_item = AsyncMock(return_value=None)
     mock.query = AsyncMock(return_value=[])
+    mock.query_gsi = AsyncMock(return_value=[])
     mock.update_item = AsyncMock(return_value={})
     mock.delete_item = AsyncMock(return_value=None)
+    mock.replace_item = AsyncMock(return_value=None)
     return mock
 
 
@@ -178,6 +180,38 @@ class TestListEventsFlow:
         assert len(body) == 1
         assert body[0]["title"] == "Team standup"
 
+    def test_list_events_respects_limit(self, client, mock_calendar_db):
+        mock_calendar_db.query = AsyncMock(
+            return_value=[_make_db_event(rrule="FREQ=DAILY")]
+        )
+
+        resp = client.get(
+            "/api/v1/calendar/",
+            params={
+                "start": "2026-02-01T00:00:00+00:00",
+                "end": "2026-02-28T23:59:59+00:00",
+                "limit": 3,
+            },
+            headers=make_auth_header(),
+        )
+
+        assert resp.status_code == 200
+        assert [e["start_time"][:10] for e in resp.json()] == [
+            "2026-02-20", "2026-02-21", "2026-02-22",
+        ]
+
+    def test_list_events_rejects_non_positive_limit(self, client):
+        resp = client.get(
+            "/api/v1/calendar/",
+            params={
+                "start": "2026-02-01T00:00:00+00:00",
+                "end": "2026-02-28T23:59:59+00:00",
+                "limit": 0,
+            },
+            headers=make_auth_header(),
+        )
+        assert resp.status_code == 422
+
     def test_list_events_without_auth_returns_401(self, client):
         resp = client.get(
             "/api/v1/calendar/",
@@ -195,7 +229,7 @@ class TestGetEventFlow:
     """Tests for GET /api/v1/calendar/{event_id}."""
 
     def test_get_event_success(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[_make_db_event("evt-42")])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[_make_db_event("evt-42")])
 
         resp = client.get(
             "/api/v1/calendar/evt-42",
@@ -206,7 +240,7 @@ class TestGetEventFlow:
         assert resp.json()["event_id"] == "evt-42"
 
     def test_get_event_not_found_returns_404(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[])
 
         resp = client.get(
             "/api/v1/calendar/nonexistent",
@@ -225,7 +259,7 @@ class TestUpdateEventFlow:
     """Tests for PATCH /api/v1/calendar/{event_id}."""
 
     def test_update_event_title(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[_make_db_event("evt-1")])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[_make_db_event("evt-1")])
 
         resp = client.patch(
             "/api/v1/calendar/evt-1",
@@ -238,7 +272,7 @@ class TestUpdateEventFlow:
         mock_calendar_db.update_item.assert_called_once()
 
     def test_update_event_start_time_recreates(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[_make_db_event("evt-1")])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[_make_db_event("evt-1")])
 
         resp = client.patch(
             "/api/v1/calendar/evt-1",
@@ -247,11 +281,12 @@ class TestUpdateEventFlow:
         )
 
         assert resp.status_code == 200
-        mock_calendar_db.delete_item.assert_called_once()
-        assert mock_calendar_db.put_item.call_count == 1
+        mock_calendar_db.replace_item.assert_called_once()
+        mock_calendar_db.delete_item.assert_not_called()
+        mock_calendar_db.put_item.assert_not_called()
 
     def test_update_nonexistent_returns_404(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[])
 
         resp = client.patch(
             "/api/v1/calendar/missing",
@@ -271,7 +306,7 @@ class TestDeleteEventFlow:
     """Tests for DELETE /api/v1/calendar/{event_id}."""
 
     def test_delete_event_success(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[_make_db_event("evt-1")])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[_make_db_event("evt-1")])
 
         resp = client.delete(
             "/api/v1/calendar/evt-1",
@@ -282,7 +317,7 @@ class TestDeleteEventFlow:
         mock_calendar_db.delete_item.assert_called_once()
 
     def test_delete_nonexistent_returns_404(self, client, mock_calendar_db):
-        mock_calendar_db.query = AsyncMock(return_value=[])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[])
 
         resp = client.delete(
             "/api/v1/calendar/missing",
@@ -316,7 +351,7 @@ class TestCalendarEndToEndFlow:
 
         # 2. Get
         event_item = _make_db_event(event_id, title="Sprint planning")
-        mock_calendar_db.query = AsyncMock(return_value=[event_item])
+        mock_calendar_db.query_gsi = AsyncMock(return_value=[event_item])
 
         get_resp = client.get(
             f"/api/v1/calendar/{event_id}",
@@ -15,6 +15,7 @@ from deepthought.api.dependencies import (
     get_todos_db_client,
     get_users_db_client,
 )
+from deepthought.core import NotFoundError
 
 
 MOCK_USER_ITEM = {
@@ -26,12 +27,19 @@ MOCK_USER_ITEM = {
 CREATED_ISO = "2026-02-15T08:00:00+00:00"
 
 
-def _make_db_list(list_id: str = "list-1", title: str = "Groceries") -> dict:
+def _make_db_list(
+    list_id: str = "list-1",
+    title: str = "Groceries",
+    item_count: int = 0,
+    completed_count: int = 0,
+) -> dict:
     return {
         "pk": "user@example.com",
         "sk": f"LIST#{list_id}",
         "list_id": list_id,
         "title": title,
+        "item_count": item_count,
+        "completed_count": completed_count,
         "created_at": CREATED_ISO,
         "updated_at": CREATED_ISO,
     }
@@ -72,6 +80,8 @@ def mock_todos_db():
     mock.put_item = AsyncMock(return_value=None)
     mock.query = AsyncMock(return_value=[])
     mock.update_item = AsyncMock(return_value={})
+    mock.increment_counter = AsyncMock(return_value=1)
+    mock.increment_counters = AsyncMock(return_value={})
     mock.delete_item = AsyncMock(return_value=None)
     mock.batch_delete = AsyncMock(return_value=None)
     return mock
@@ -150,13 +160,7 @@ class TestListListsFlow:
 
     def test_list_lists_with_counts(self, client, mock_todos_db):
         mock_todos_db.query = AsyncMock(
-            side_effect=[
-                [_make_db_list("list-1")],
-                [
-                    _make_db_item("list-1", "i1", completed=False),
-                    _make_db_item("list-1", "i2", completed=True),
-                ],
-            ]
+            return_value=[_make_db_list("list-1", item_count=2, completed_count=1)]
         )
 
         resp = client.get("/api/v1/todos/lists", headers=make_auth_header())
@@ -216,8 +220,7 @@ class TestAddItemFlow:
     """Tests for POST /api/v1/todos/lists/{list_id}/items."""
 
     def test_add_item_success(self, client, mock_todos_db):
-        mock_todos_db.get_item = AsyncMock(return_value=_make_db_list("list-1"))
-        mock_todos_db.query = AsyncMock(return_value=[])
+        mock_todos_db.increment_counter = AsyncMock(return_value=1)
 
         resp = client.post(
             "/api/v1/todos/lists/list-1/items",
@@ -233,7 +236,9 @@ class TestAddItemFlow:
         assert body["sort_order"] == 0
 
     def test_add_item_to_nonexistent_list_returns_404(self, client, mock_todos_db):
-        mock_todos_db.get_item = AsyncMock(return_value=None)
+        mock_todos_db.increment_counter = AsyncMock(
+            side_effect=NotFoundError("Item", "user@example.com/LIST#missing")
+        )
 
         resp = client.post(
             "/api/v1/todos/lists/missing/items",
@@ -299,7 +304,9 @@ class TestUpdateItemFlow:
     """Tests for PATCH /api/v1/todos/lists/{list_id}/items/{item_id}."""
 
     def test_update_item_text(self, client, mock_todos_db):
-        mock_todos_db.get_item = AsyncMock(return_value=_make_db_item())
+        mock_todos_db.update_item = AsyncMock(
+            return_value=_make_db_item(text="Buy almond milk")
+        )
 
         resp = client.patch(
             "/api/v1/todos/lists/list-1/items/item-1",
@@ -311,7 +318,9 @@ class TestUpdateItemFlow:
         assert resp.json()["text"] == "Buy almond milk"
 
     def test_complete_item(self, client, mock_todos_db):
-        mock_todos_db.get_item = AsyncMock(return_value=_make_db_item())
+        mock_todos_db.update_item = AsyncMock(
+            return_value={**_make_db_item(completed=True), "completed_at": CREATED_ISO}
+        )
 
         resp = client.patch(
             "/api/v1/todos/lists/list-1/items/item-1",
@@ -325,7 +334,9 @@ class TestUpdateItemFlow:
         assert body["completed_at"] is not None
 
     def test_update_nonexistent_item_returns_404(self, client, mock_todos_db):
-        mock_todos_db.get_item = AsyncMock(return_value=None)
+        mock_todos_db.update_item = AsyncMock(
+            side_effect=NotFoundError("Item", "user@example.com/ITEM#list-1#missing")
+        )
 
         resp = client.patch(
             "/api/v1/todos/lists/list-1/items/missing",
@@ -356,7 +367,9 @@ class TestDeleteItemFlow:
         mock_todos_db.delete_item.assert_called_once()
 
     def test_delete_nonexistent_item_returns_404(self, client, mock_todos_db):
-        mock_todos_db.get_item = AsyncMock(return_value=None)
+        mock_todos_db.delete_item = AsyncMock(
+            side_effect=NotFoundError("Item", "user@example.com/ITEM#list-1#missing")
+        )
 
         resp = client.delete(
             "/api/v1/todos/lists/list-1/items/missing",
@@ -389,8 +402,7 @@ class TestTodosEndToEndFlow:
         list_id = create_resp.json()["list_id"]
 
         # 2. Add item
-        mock_todos_db.get_item = AsyncMock(return_value=_make_db_list(list_id, "Shopping"))
-        mock_todos_db.query = AsyncMock(return_value=[])
+        mock_todos_db.increment_counter = AsyncMock(return_value=1)
 
         item_resp = client.post(
             f"/api/v1/todos/lists/{list_id}/items",
@@ -401,8 +413,11 @@ class TestTodosEndToEndFlow:
         item_id = item_resp.json()["item_id"]
 
         # 3. Complete item
-        mock_todos_db.get_item = AsyncMock(
-            return_value=_make_db_item(list_id, item_id, "Bread")
+        mock_todos_db.update_item = AsyncMock(
+            return_value={
+                **_make_db_item(list_id, item_id, "Bread", completed=True),
+                "completed_at": CREATED_ISO,
+            }
         )
 
         complete_resp = client.patch(
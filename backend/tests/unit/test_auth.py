@@ -224,3 +224,21 @@ class TestGetCurrentUser:
         with pytest.raises(HTTPException) as exc_info:
             await get_current_user(token=token, users_db=mock_db)
         assert exc_info.value.status_code == 401
+
+    @patch("deepthought.api.auth.get_settings")
+    async def test_user_is_read_on_every_call(self, mock_settings):
+        """Test that a user deleted after a successful call is rejected next time."""
+        mock_settings.return_value = MagicMock(
+            jwt_secret_key="test-secret",
+            jwt_algorithm="HS256",
+            jwt_expiration_minutes=60,
+        )
+        token = create_access_token({"sub": "user@example.com"})
+
+        mock_db = MagicMock()
+        mock_db.get_item = AsyncMock(side_effect=[{"pk": "user@example.com"}, None])
+
+        await get_current_user(token=token, users_db=mock_db)
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user(token=token, users_db=mock_db)
+        assert exc_info.value.status_code == 401
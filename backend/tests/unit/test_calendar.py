@@ -1,18 +1,33 @@
 """Unit tests for calendar endpoints."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
+from dateutil.rrule import rrulestr
+from fastapi import HTTPException
 
 from deepthought.api.routes.calendar import (
+    _advance_rrule,
+    _compile_rrule,
+    _expand_rrule,
+    _item_to_response,
+    _parse_simple_rrule,
+    _rrule_until,
+    _sk_upper_bound,
     create_event,
     delete_event,
     get_event,
     list_events,
     update_event,
 )
-from deepthought.models.calendar import CalendarEventCreate, CalendarEventUpdate
+from deepthought.core import NotFoundError, parse_iso_datetime
+from deepthought.models.calendar import (
+    CalendarEventCreate,
+    CalendarEventResponse,
+    CalendarEventUpdate,
+)
 
 
 MOCK_USER = {"pk": "test@example.com", "first_name": "Test", "last_name": "User"}
@@ -106,6 +121,38 @@ class TestCreateEvent:
         stored = mock_db.put_item.call_args[0][0]
         assert stored["description"] == "Weekly sync"
         assert stored["rrule"] == "FREQ=WEEKLY;BYDAY=MO"
+        assert "rrule_until" not in stored
+
+    async def test_stores_rrule_until(self):
+        mock_db = MagicMock()
+        mock_db.put_item = AsyncMock(return_value=None)
+
+        request = CalendarEventCreate(
+            title="Recurring",
+            start_time=datetime.fromisoformat(NOW_ISO),
+            end_time=datetime.fromisoformat(END_ISO),
+            rrule="FREQ=WEEKLY;UNTIL=20260401T000000Z",
+        )
+        await create_event(request=request, current_user=MOCK_USER, calendar_db=mock_db)
+
+        stored = mock_db.put_item.call_args[0][0]
+        assert stored["rrule_until"] == "2026-04-01T00:00:00+00:00"
+
+    async def test_rejects_invalid_rrule(self):
+        mock_db = MagicMock()
+        mock_db.put_item = AsyncMock(return_value=None)
+
+        request = CalendarEventCreate(
+            title="Recurring",
+            start_time=datetime.fromisoformat(NOW_ISO),
+            end_time=datetime.fromisoformat(END_ISO),
+            rrule="FREQ=FORTNIGHTLY",
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            await create_event(request=request, current_user=MOCK_USER, calendar_db=mock_db)
+
+        assert exc_info.value.status_code == 400
+        mock_db.put_item.assert_not_called()
 
 
 class TestListEvents:
@@ -168,6 +215,76 @@ class TestListEvents:
         )
         assert len(result) == 5
 
+    async def test_recurring_instances_get_their_own_times(self):
+        mock_db = MagicMock()
+        mock_db.query = AsyncMock(
+            return_value=[
+                _make_db_event(
+                    start="2026-02-02T09:00:00+00:00",
+                    end="2026-02-02T10:30:00+00:00",
+                    rrule="FREQ=DAILY;COUNT=3",
+                )
+            ]
+        )
+
+        result = await list_events(
+            start=datetime.fromisoformat("2026-02-01T00:00:00+00:00"),
+            end=datetime.fromisoformat("2026-02-28T23:59:59+00:00"),
+            current_user=MOCK_USER,
+            calendar_db=mock_db,
+        )
+
+        assert [e.start_time.day for e in result] == [2, 3, 4]
+        assert all(e.end_time - e.start_time == timedelta(minutes=90) for e in result)
+        assert len({id(e) for e in result}) == 3
+
+    async def test_recurring_event_timestamps_parsed_once(self):
+        mock_db = MagicMock()
+        mock_db.query = AsyncMock(
+            return_value=[
+                _make_db_event(
+                    start="2026-02-02T09:00:00+00:00",
+                    end="2026-02-02T10:00:00+00:00",
+                    rrule="FREQ=WEEKLY;INTERVAL=1",
+                )
+            ]
+        )
+
+        with patch(
+            "deepthought.api.routes.calendar.parse_iso_datetime", wraps=parse_iso_datetime
+        ) as parse:
+            result = await list_events(
+                start=datetime.fromisoformat("2026-02-01T00:00:00+00:00"),
+                end=datetime.fromisoformat("2026-12-31T23:59:59+00:00"),
+                current_user=MOCK_USER,
+                calendar_db=mock_db,
+            )
+
+        assert len(result) == 48
+        # start_time, end_time, created_at and updated_at, regardless of instances
+        assert parse.call_count == 4
+
+    async def test_skips_expired_series_without_expanding(self):
+        item = _make_db_event(
+            start="2025-01-06T09:00:00+00:00",
+            end="2025-01-06T10:00:00+00:00",
+            rrule="FREQ=WEEKLY;UNTIL=20250301T000000Z",
+        )
+        item["rrule_until"] = "2025-03-01T00:00:00+00:00"
+        mock_db = MagicMock()
+        mock_db.query = AsyncMock(return_value=[item])
+
+        with patch("deepthought.api.routes.calendar._expand_rrule") as expand:
+            result = await list_events(
+                start=datetime.fromisoformat("2026-02-01T00:00:00+00:00"),
+                end=datetime.fromisoformat("2026-02-28T23:59:59+00:00"),
+                current_user=MOCK_USER,
+                calendar_db=mock_db,
+            )
+
+        assert result == []
+        expand.assert_not_called()
+
     async def test_results_sorted_by_start_time(self):
         mock_db = MagicMock()
         mock_db.query = AsyncMock(
@@ -189,22 +306,249 @@ class TestListEvents:
         assert result[1].event_id == "late"
 
 
+    async def test_merges_series_and_one_offs_up_to_limit(self):
+        mock_db = MagicMock()
+        mock_db.query = AsyncMock(
+            return_value=[
+                _make_db_event(event_id="daily", start="2026-02-02T09:00:00+00:00",
+                               end="2026-02-02T10:00:00+00:00", rrule="FREQ=DAILY"),
+                _make_db_event(event_id="once", start="2026-02-03T08:00:00+00:00",
+                               end="2026-02-03T08:30:00+00:00"),
+                _make_db_event(event_id="hourly", start="2026-02-02T09:30:00+00:00",
+                               end="2026-02-02T09:45:00+00:00", rrule="FREQ=HOURLY"),
+            ]
+        )
+
+        result = await list_events(
+            start=datetime.fromisoformat("2026-02-01T00:00:00+00:00"),
+            end=datetime.fromisoformat("2026-02-28T23:59:59+00:00"),
+            limit=4,
+            current_user=MOCK_USER,
+            calendar_db=mock_db,
+        )
+
+        assert [(e.event_id, e.start_time.hour) for e in result] == [
+            ("daily", 9), ("hourly", 9), ("hourly", 10), ("hourly", 11),
+        ]
+
+    async def test_pushes_range_end_into_sort_key_condition(self):
+        mock_db = MagicMock()
+        mock_db.query = AsyncMock(return_value=[])
+        end = datetime.fromisoformat("2026-02-28T23:59:59+00:00")
+
+        await list_events(
+            start=datetime.fromisoformat("2026-02-01T00:00:00+00:00"),
+            end=end,
+            current_user=MOCK_USER,
+            calendar_db=mock_db,
+        )
+
+        mock_db.query.assert_called_once_with(pk=MOCK_USER["pk"], sk_end=_sk_upper_bound(end))
+
+
+class TestSkUpperBound:
+    """Tests for the calendar sort key upper bound."""
+
+    @pytest.mark.parametrize("offset_hours", [-12, -5, 0, 5.5, 14])
+    def test_includes_events_starting_at_end_in_any_offset(self, offset_hours):
+        end = datetime(2026, 2, 28, 12, 0, tzinfo=timezone.utc)
+        tz = timezone(timedelta(hours=offset_hours))
+        sk = f"{end.astimezone(tz).isoformat()}#evt-1"
+
+        assert sk <= _sk_upper_bound(end)
+
+    def test_includes_fractional_seconds(self):
+        end = datetime(2026, 2, 28, 12, 0, 0, 500000, tzinfo=timezone.utc)
+        tz = timezone(timedelta(hours=14))
+        sk = f"{end.astimezone(tz).isoformat()}#evt-1"
+
+        assert sk <= _sk_upper_bound(end)
+
+    def test_excludes_events_starting_after_latest_offset(self):
+        end = datetime(2026, 2, 28, 12, 0, tzinfo=timezone.utc)
+        sk = f"{(end + timedelta(hours=15)).isoformat()}#evt-1"
+
+        assert sk > _sk_upper_bound(end)
+
+
+class TestRruleUntil:
+    """Tests for extracting a rule's UNTIL bound at write time."""
+
+    @pytest.mark.parametrize(
+        "rrule_str",
+        [
+            "FREQ=WEEKLY;BYDAY=MO;UNTIL=20260401T000000Z",
+            "RRULE:FREQ=WEEKLY;UNTIL=20260401T000000Z",
+        ],
+    )
+    def test_reads_until_as_utc_iso(self, rrule_str):
+        assert _rrule_until(rrule_str, NOW_ISO) == "2026-04-01T00:00:00+00:00"
+
+    def test_no_until_returns_none(self):
+        assert _rrule_until("FREQ=DAILY;COUNT=3", NOW_ISO) is None
+
+    def test_multi_line_rule_returns_none(self):
+        rrule_str = "DTSTART:20260220T100000Z\nRRULE:FREQ=DAILY;UNTIL=20260401T000000Z"
+        assert _rrule_until(rrule_str, NOW_ISO) is None
+
+    def test_naive_start_returns_none(self):
+        assert _rrule_until("FREQ=DAILY;UNTIL=20260401T000000", "2026-02-20T10:00:00") is None
+
+
+class TestExpandRrule:
+    """Tests for the fixed-step RRULE fast path."""
+
+    @pytest.mark.parametrize(
+        "rrule_str",
+        [
+            "FREQ=DAILY",
+            "FREQ=DAILY;COUNT=5",
+            "FREQ=DAILY;INTERVAL=3;UNTIL=20260320T000000Z",
+            "RRULE:FREQ=WEEKLY;INTERVAL=2",
+            "freq=hourly;interval=7;count=200",
+        ],
+    )
+    def test_matches_dateutil(self, rrule_str):
+        dtstart = datetime(2026, 2, 2, 9, 30, 15, 500, tzinfo=timezone.utc)
+        start = datetime(2026, 2, 10, 9, 30, 15, tzinfo=timezone.utc)
+        end = datetime(2026, 3, 31, tzinfo=timezone.utc)
+
+        expected = rrulestr(rrule_str, dtstart=dtstart).between(start, end, inc=True)
+        assert _expand_rrule(rrule_str, dtstart.isoformat(), dtstart, start, end) == expected
+
+    def test_matches_dateutil_across_dst(self):
+        tz = ZoneInfo("America/New_York")
+        dtstart = datetime(2026, 1, 5, 9, 0, tzinfo=tz)
+        start = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=30)
+
+        expected = rrulestr("FREQ=DAILY", dtstart=dtstart).between(start, end, inc=True)
+        result = _expand_rrule("FREQ=DAILY", dtstart.isoformat(), dtstart, start, end)
+
+        assert result == expected
+        assert [r.utcoffset() for r in result] == [e.utcoffset() for e in expected]
+
+    def test_window_before_dtstart(self):
+        dtstart = datetime(2026, 2, 2, 9, 0, tzinfo=timezone.utc)
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 2, 4, 9, 0, tzinfo=timezone.utc)
+
+        result = _expand_rrule("FREQ=DAILY", dtstart.isoformat(), dtstart, start, end)
+        assert result == [dtstart + timedelta(days=i) for i in range(3)]
+
+    @pytest.mark.parametrize(
+        "rrule_str",
+        [
+            "FREQ=WEEKLY;BYDAY=MO,WE",
+            "FREQ=MONTHLY;COUNT=3",
+            "FREQ=DAILY;UNTIL=20260320",
+            "FREQ=DAILY;INTERVAL=0",
+        ],
+    )
+    def test_complex_rules_not_simple(self, rrule_str):
+        assert _parse_simple_rrule(rrule_str) is None
+
+    def test_complex_rule_falls_back_to_dateutil(self):
+        dtstart = datetime(2026, 2, 2, 9, 0, tzinfo=timezone.utc)
+        start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 2, 28, tzinfo=timezone.utc)
+        rrule_str = "FREQ=WEEKLY;BYDAY=MO,WE"
+
+        expected = rrulestr(rrule_str, dtstart=dtstart).between(start, end, inc=True)
+        assert _expand_rrule(rrule_str, dtstart.isoformat(), dtstart, start, end) == expected
+
+    def test_old_complex_rule_matches_dateutil(self):
+        dtstart = datetime(2020, 1, 6, 9, 0, tzinfo=timezone.utc)
+        start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        end = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        rrule_str = "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH"
+
+        expected = rrulestr(rrule_str, dtstart=dtstart).between(start, end, inc=True)
+        assert _expand_rrule(rrule_str, dtstart.isoformat(), dtstart, start, end) == expected
+
+    def test_advance_moves_dtstart_by_whole_periods(self):
+        rrule_str = "FREQ=WEEKLY;INTERVAL=2;BYDAY=MO,TH"
+        dtstart = datetime(2020, 1, 6, 9, 0, tzinfo=timezone.utc)
+        rule = _compile_rrule(rrule_str, dtstart.isoformat())
+        start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+        advanced = _advance_rrule(rule, rrule_str, dtstart, start)
+
+        first = advanced[0]
+        assert first < start
+        assert first - dtstart > timedelta(weeks=2)
+        assert first in rule.between(dtstart, start, inc=True)
+        assert advanced.between(start, start + timedelta(weeks=8), inc=True) == rule.between(
+            start, start + timedelta(weeks=8), inc=True
+        )
+
+    @pytest.mark.parametrize(
+        "rrule_str",
+        ["FREQ=WEEKLY;BYDAY=MO;COUNT=500", "FREQ=MONTHLY;BYDAY=1MO", "FREQ=DAILY;BYSETPOS=1"],
+    )
+    def test_advance_leaves_position_dependent_rules(self, rrule_str):
+        dtstart = datetime(2020, 1, 6, 9, 0, tzinfo=timezone.utc)
+        rule = _compile_rrule(rrule_str, dtstart.isoformat())
+        start = datetime(2026, 2, 1, tzinfo=timezone.utc)
+        assert _advance_rrule(rule, rrule_str, dtstart, start) is rule
+
+    def test_rule_ended_before_range_yields_nothing(self):
+        dtstart = datetime(2020, 1, 6, 9, 0, tzinfo=timezone.utc)
+        rrule_str = "FREQ=WEEKLY;BYDAY=MO,TH;UNTIL=20210101T000000Z"
+
+        result = _expand_rrule(
+            rrule_str,
+            dtstart.isoformat(),
+            dtstart,
+            datetime(2026, 2, 1, tzinfo=timezone.utc),
+            datetime(2026, 3, 1, tzinfo=timezone.utc),
+        )
+        assert result == []
+
+    def test_compiled_rules_are_reused(self):
+        first = _compile_rrule("FREQ=WEEKLY;BYDAY=TU", "2026-02-03T09:00:00+00:00")
+        second = _compile_rrule("FREQ=WEEKLY;BYDAY=TU", "2026-02-03T09:00:00+00:00")
+        assert first is second
+
+
+class TestItemToResponse:
+    """Tests for mapping stored items to responses."""
+
+    def test_matches_validated_model(self):
+        item = _make_db_event(rrule="FREQ=DAILY", description="Standup")
+
+        result = _item_to_response(item)
+
+        expected = CalendarEventResponse.model_validate(
+            {k: v for k, v in item.items() if k not in ("pk", "sk")}
+        )
+        assert result == expected
+        assert result.model_dump() == expected.model_dump()
+
+
 class TestGetEvent:
     """Tests for GET /calendar/{event_id} endpoint."""
 
     async def test_returns_event_by_id(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[_make_db_event(event_id="evt-42")])
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-42")])
 
         result = await get_event(
             event_id="evt-42", current_user=MOCK_USER, calendar_db=mock_db
         )
         assert result.event_id == "evt-42"
         assert result.title == "Team standup"
+        mock_db.query_gsi.assert_called_once_with(
+            "pk_event_id_index",
+            pk_attr="pk",
+            pk_value="test@example.com",
+            sk_attr="event_id",
+            sk_value="evt-42",
+        )
 
     async def test_raises_404_when_not_found(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[])
+        mock_db.query_gsi = AsyncMock(return_value=[])
 
         with pytest.raises(Exception) as exc_info:
             await get_event(
@@ -218,7 +562,7 @@ class TestUpdateEvent:
 
     async def test_updates_title_without_start_change(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
         mock_db.update_item = AsyncMock(return_value={})
 
         request = CalendarEventUpdate(title="Renamed standup")
@@ -229,13 +573,79 @@ class TestUpdateEvent:
 
         assert result.title == "Renamed standup"
         mock_db.update_item.assert_called_once()
+        assert mock_db.update_item.call_args[1]["must_exist"] is True
         mock_db.delete_item.assert_not_called()
 
+    async def test_raises_404_when_sk_is_stale(self):
+        mock_db = MagicMock()
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
+        mock_db.update_item = AsyncMock(side_effect=NotFoundError("Item", "evt-1"))
+
+        request = CalendarEventUpdate(title="Renamed standup")
+        with pytest.raises(HTTPException) as exc_info:
+            await update_event(
+                event_id="evt-1", request=request,
+                current_user=MOCK_USER, calendar_db=mock_db,
+            )
+        assert exc_info.value.status_code == 404
+
+    async def test_unbounded_rrule_removes_stored_until(self):
+        item = _make_db_event(event_id="evt-1")
+        item["rrule"] = "FREQ=DAILY;UNTIL=20260301T000000Z"
+        item["rrule_until"] = "2026-03-01T00:00:00+00:00"
+        mock_db = MagicMock()
+        mock_db.query_gsi = AsyncMock(return_value=[item])
+        mock_db.update_item = AsyncMock(return_value={})
+
+        request = CalendarEventUpdate(rrule="FREQ=WEEKLY")
+        await update_event(
+            event_id="evt-1", request=request,
+            current_user=MOCK_USER, calendar_db=mock_db,
+        )
+
+        kwargs = mock_db.update_item.call_args[1]
+        assert kwargs["updates"]["rrule"] == "FREQ=WEEKLY"
+        assert "rrule_until" not in kwargs["updates"]
+        assert kwargs["remove"] == ["rrule_until"]
+
+    async def test_bounded_rrule_sets_until(self):
+        mock_db = MagicMock()
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
+        mock_db.update_item = AsyncMock(return_value={})
+
+        request = CalendarEventUpdate(rrule="FREQ=DAILY;UNTIL=20260301T000000Z")
+        await update_event(
+            event_id="evt-1", request=request,
+            current_user=MOCK_USER, calendar_db=mock_db,
+        )
+
+        kwargs = mock_db.update_item.call_args[1]
+        assert kwargs["updates"]["rrule_until"] == "2026-03-01T00:00:00+00:00"
+        assert kwargs["remove"] is None
+
+    async def test_skips_parsing_times_supplied_by_request(self):
+        mock_db = MagicMock()
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
+        mock_db.update_item = AsyncMock(return_value={})
+        new_end = datetime.fromisoformat("2026-02-20T12:00:00+00:00")
+
+        request = CalendarEventUpdate(end_time=new_end)
+        with patch(
+            "deepthought.api.routes.calendar.parse_iso_datetime", wraps=parse_iso_datetime
+        ) as parse:
+            result = await update_event(
+                event_id="evt-1", request=request,
+                current_user=MOCK_USER, calendar_db=mock_db,
+            )
+
+        assert result.end_time == new_end
+        assert [c.args[0] for c in parse.call_args_list] == [NOW_ISO, CREATED_ISO]
+        assert mock_db.update_item.call_args[1]["updates"]["end_time"] == new_end.isoformat()
+
     async def test_recreates_item_when_start_time_changes(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
-        mock_db.delete_item = AsyncMock(return_value=None)
-        mock_db.put_item = AsyncMock(return_value=None)
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
+        mock_db.replace_item = AsyncMock(return_value=None)
 
         new_start = datetime.fromisoformat("2026-02-21T14:00:00+00:00")
         request = CalendarEventUpdate(start_time=new_start)
@@ -245,14 +655,15 @@ class TestUpdateEvent:
         )
 
         assert result.start_time == new_start
-        mock_db.delete_item.assert_called_once()
-        mock_db.put_item.assert_called_once()
-        new_item = mock_db.put_item.call_args[0][0]
-        assert new_item["sk"].startswith("2026-02-21")
+        mock_db.replace_item.assert_called_once()
+        call_kwargs = mock_db.replace_item.call_args[1]
+        assert call_kwargs["pk"] == MOCK_USER["pk"]
+        assert call_kwargs["old_sk"] == f"{NOW_ISO}#evt-1"
+        assert call_kwargs["item"]["sk"].startswith("2026-02-21")
 
     async def test_raises_404_when_event_not_found(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[])
+        mock_db.query_gsi = AsyncMock(return_value=[])
 
         request = CalendarEventUpdate(title="New title")
         with pytest.raises(Exception) as exc_info:
@@ -269,7 +680,7 @@ class TestDeleteEvent:
     async def test_deletes_event_successfully(self):
         event = _make_db_event(event_id="evt-1")
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[event])
+        mock_db.query_gsi = AsyncMock(return_value=[event])
         mock_db.delete_item = AsyncMock(return_value=None)
 
         await delete_event(
@@ -277,12 +688,23 @@ class TestDeleteEvent:
         )
 
         mock_db.delete_item.assert_called_once_with(
-            pk="test@example.com", sk=event["sk"]
+            pk="test@example.com", sk=event["sk"], must_exist=True
         )
 
+    async def test_raises_404_when_sk_is_stale(self):
+        mock_db = MagicMock()
+        mock_db.query_gsi = AsyncMock(return_value=[_make_db_event(event_id="evt-1")])
+        mock_db.delete_item = AsyncMock(side_effect=NotFoundError("Item", "evt-1"))
+
+        with pytest.raises(HTTPException) as exc_info:
+            await delete_event(
+                event_id="evt-1", current_user=MOCK_USER, calendar_db=mock_db
+            )
+        assert exc_info.value.status_code == 404
+
     async def test_raises_404_when_event_not_found(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[])
+        mock_db.query_gsi = AsyncMock(return_value=[])
 
         with pytest.raises(Exception) as exc_info:
             await delete_event(
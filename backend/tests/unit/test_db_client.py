@@ -0,0 +1,763 @@
+"""Unit tests for the DynamoDB client wrapper."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from deepthought.core import ConditionFailedError, DatabaseError, NotFoundError
+from deepthought.db import DynamoDBClient
+from deepthought.db.client import BATCH_MAX_CONCURRENCY, _compile_update
+
+
+def _client_cm(client: MagicMock) -> MagicMock:
+    """Build a mock aiobotocore client context manager serving the given client."""
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=client)
+    cm.__aexit__ = AsyncMock(return_value=None)
+    return cm
+
+
+def _make_db(low_level: MagicMock, per_call: bool = False) -> DynamoDBClient:
+    """Build a DynamoDBClient whose session hands out the given low-level client."""
+    db = DynamoDBClient(table_name="t")
+    db._session = MagicMock()
+    if per_call:
+        db._session.client.side_effect = lambda *a, **kw: _client_cm(low_level)
+    else:
+        db._session.client.return_value = _client_cm(low_level)
+    return db
+
+
+class TestConnection:
+    """Tests for the long-lived client opened by connect()."""
+
+    async def test_connected_client_reuses_one_client(self):
+        low_level = MagicMock()
+        low_level.get_item = AsyncMock(return_value={})
+        db = _make_db(low_level)
+        cm = db._session.client.return_value
+
+        await db.connect()
+        await db.connect()
+        await db.get_item(pk="a")
+        await db.get_item(pk="b")
+
+        db._session.client.assert_called_once()
+        assert low_level.get_item.await_count == 2
+        cm.__aexit__.assert_not_called()
+
+        await db.close()
+        cm.__aexit__.assert_called_once()
+
+    async def test_unconnected_client_opens_client_per_call(self):
+        low_level = MagicMock()
+        low_level.get_item = AsyncMock(return_value={})
+        db = _make_db(low_level, per_call=True)
+
+        await db.get_item(pk="a")
+        await db.get_item(pk="b")
+
+        assert db._session.client.call_count == 2
+
+    def test_clients_share_one_session(self):
+        first = DynamoDBClient(table_name="a")
+        second = DynamoDBClient(table_name="b")
+
+        assert first._session is second._session
+
+
+class TestSerialization:
+    """Tests for converting between Python values and attribute values."""
+
+    async def test_get_item_serializes_key_and_deserializes_item(self):
+        low_level = MagicMock()
+        low_level.get_item = AsyncMock(
+            return_value={"Item": {"pk": {"S": "a"}, "sk": {"S": "b"}, "n": {"N": "3"}}}
+        )
+        db = _make_db(low_level)
+
+        item = await db.get_item(pk="a", sk="b")
+
+        assert item == {"pk": "a", "sk": "b", "n": 3}
+        low_level.get_item.assert_awaited_once_with(
+            TableName="t", Key={"pk": {"S": "a"}, "sk": {"S": "b"}}
+        )
+
+    async def test_get_item_returns_none_when_missing(self):
+        low_level = MagicMock()
+        low_level.get_item = AsyncMock(return_value={})
+        db = _make_db(low_level)
+
+        assert await db.get_item(pk="a") is None
+        low_level.get_item.assert_awaited_once_with(TableName="t", Key={"pk": {"S": "a"}})
+
+    async def test_deserializes_nested_and_null_values(self):
+        low_level = MagicMock()
+        low_level.get_item = AsyncMock(
+            return_value={
+                "Item": {
+                    "pk": {"S": "a"},
+                    "tags": {"L": [{"S": "x"}, {"N": "1"}]},
+                    "meta": {"M": {"k": {"S": "v"}}},
+                    "gone": {"NULL": True},
+                }
+            }
+        )
+        db = _make_db(low_level)
+
+        item = await db.get_item(pk="a", sk="b")
+
+        assert item == {"pk": "a", "tags": ["x", 1], "meta": {"k": "v"}, "gone": None}
+
+    async def test_query_deserializes_items(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(
+            return_value={"Items": [{"pk": {"S": "a"}, "done": {"BOOL": True}}]}
+        )
+        db = _make_db(low_level)
+
+        items = await db.query(pk="a", sk_prefix="LIST#")
+
+        assert items == [{"pk": "a", "done": True}]
+        kwargs = low_level.query.call_args[1]
+        assert kwargs["ExpressionAttributeValues"] == {
+            ":pk": {"S": "a"},
+            ":sk_prefix": {"S": "LIST#"},
+        }
+
+
+class TestQueryPagination:
+    """Tests for following LastEvaluatedKey in query."""
+
+    async def test_fetches_every_page_without_limit(self):
+        low_level = MagicMock()
+        last_key = {"pk": {"S": "a"}, "sk": {"S": "1"}}
+        low_level.query = AsyncMock(
+            side_effect=[
+                {"Items": [{"sk": {"S": "1"}}], "LastEvaluatedKey": last_key},
+                {"Items": [{"sk": {"S": "2"}}]},
+            ]
+        )
+        db = _make_db(low_level)
+
+        items = await db.query(pk="a")
+
+        assert items == [{"sk": "1"}, {"sk": "2"}]
+        assert low_level.query.call_args_list[1][1]["ExclusiveStartKey"] == last_key
+
+    async def test_limit_returns_single_page(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(
+            return_value={"Items": [{"sk": {"S": "1"}}], "LastEvaluatedKey": {"sk": {"S": "1"}}}
+        )
+        db = _make_db(low_level)
+
+        items = await db.query(pk="a", limit=1)
+
+        assert items == [{"sk": "1"}]
+        low_level.query.assert_awaited_once()
+
+    async def test_count_sums_every_page(self):
+        low_level = MagicMock()
+        last_key = {"pk": {"S": "a"}, "sk": {"S": "9"}}
+        low_level.query = AsyncMock(
+            side_effect=[{"Count": 10, "LastEvaluatedKey": last_key}, {"Count": 4}]
+        )
+        db = _make_db(low_level)
+
+        assert await db.query_count(pk="a") == 14
+        second = low_level.query.call_args_list[1][1]
+        assert second["ExclusiveStartKey"] == last_key
+        assert second["Select"] == "COUNT"
+
+    @pytest.mark.parametrize(
+        ("method", "kwargs"),
+        [
+            ("query_between", {"pk": "a", "sk_start": "1", "sk_end": "9"}),
+            (
+                "query_gsi_range",
+                {
+                    "index_name": "by-date",
+                    "pk_attr": "gpk",
+                    "pk_value": "a",
+                    "sk_attr": "gsk",
+                    "sk_start": "1",
+                    "sk_end": "9",
+                },
+            ),
+            (
+                "query_gsi",
+                {
+                    "index_name": "by-id",
+                    "pk_attr": "gpk",
+                    "pk_value": "a",
+                    "sk_attr": "gsk",
+                    "sk_value": "1",
+                },
+            ),
+        ],
+    )
+    async def test_range_and_gsi_queries_fetch_every_page(self, method, kwargs):
+        low_level = MagicMock()
+        last_key = {"pk": {"S": "a"}, "sk": {"S": "1"}}
+        low_level.query = AsyncMock(
+            side_effect=[
+                {"Items": [{"sk": {"S": "1"}}], "LastEvaluatedKey": last_key},
+                {"Items": [{"sk": {"S": "2"}}]},
+            ]
+        )
+        db = _make_db(low_level)
+
+        items = await getattr(db, method)(**kwargs)
+
+        assert items == [{"sk": "1"}, {"sk": "2"}]
+        assert low_level.query.call_args_list[1][1]["ExclusiveStartKey"] == last_key
+
+
+class TestKeyConditions:
+    """Tests for the key condition shapes sent by query and query_count."""
+
+    async def test_sk_prefix_uses_begins_with(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = _make_db(low_level)
+
+        await db.query(pk="a", sk_prefix="LIST#")
+
+        kwargs = low_level.query.call_args[1]
+        assert kwargs["KeyConditionExpression"] == "pk = :pk AND begins_with(sk, :sk_prefix)"
+        assert kwargs["ExpressionAttributeValues"] == {
+            ":pk": {"S": "a"}, ":sk_prefix": {"S": "LIST#"},
+        }
+
+    async def test_sk_end_bounds_sort_key(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = _make_db(low_level)
+
+        await db.query(pk="a", sk_end="OP#2026")
+
+        kwargs = low_level.query.call_args[1]
+        assert kwargs["KeyConditionExpression"] == "pk = :pk AND sk <= :sk_end"
+        assert kwargs["ExpressionAttributeValues"][":sk_end"] == {"S": "OP#2026"}
+
+    async def test_count_with_partition_only(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Count": 3})
+        db = _make_db(low_level)
+
+        assert await db.query_count(pk="a") == 3
+
+        kwargs = low_level.query.call_args[1]
+        assert kwargs["KeyConditionExpression"] == "pk = :pk"
+        assert kwargs["ExpressionAttributeValues"] == {":pk": {"S": "a"}}
+        assert kwargs["Select"] == "COUNT"
+
+
+class TestQueryCache:
+    """Tests for the in-process query result cache."""
+
+    def _cached_db(self, low_level: MagicMock, ttl: float = 5.0) -> DynamoDBClient:
+        db = _make_db(low_level)
+        db._query_cache_ttl = ttl
+        return db
+
+    async def test_disabled_by_default(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = _make_db(low_level)
+
+        await db.query(pk="a", sk_prefix="LIST#")
+        await db.query(pk="a", sk_prefix="LIST#")
+
+        assert low_level.query.await_count == 2
+
+    async def test_repeated_query_served_from_cache(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": [{"sk": {"S": "LIST#1"}}]})
+        db = self._cached_db(low_level)
+
+        first = await db.query(pk="a", sk_prefix="LIST#")
+        first[0]["sk"] = "mutated"
+        second = await db.query(pk="a", sk_prefix="LIST#")
+
+        assert second == [{"sk": "LIST#1"}]
+        low_level.query.assert_awaited_once()
+
+    async def test_use_cache_false_bypasses_cache(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = self._cached_db(low_level)
+
+        await db.query(pk="a", sk_prefix="ITEM#")
+        await db.query(pk="a", sk_prefix="ITEM#", use_cache=False)
+
+        assert low_level.query.await_count == 2
+
+    async def test_different_arguments_are_cached_separately(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = self._cached_db(low_level)
+
+        await db.query(pk="a", sk_prefix="LIST#")
+        await db.query(pk="a", sk_prefix="ITEM#")
+        await db.query(pk="b", sk_prefix="LIST#")
+
+        assert low_level.query.await_count == 3
+
+    async def test_expired_entries_are_refetched(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = self._cached_db(low_level, ttl=1.0)
+
+        clock = [100.0, 100.5, 102.0, 102.0]
+        with patch("deepthought.db.client.time.monotonic", side_effect=clock):
+            await db.query(pk="a")
+            await db.query(pk="a")
+            await db.query(pk="a")
+
+        assert low_level.query.await_count == 2
+
+    async def test_write_evicts_partition(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        low_level.put_item = AsyncMock(return_value={})
+        low_level.delete_item = AsyncMock(return_value={})
+        db = self._cached_db(low_level)
+
+        await db.query(pk="a")
+        await db.query(pk="b")
+        await db.put_item({"pk": "a", "sk": "LIST#2"})
+        await db.query(pk="a")
+        await db.query(pk="b")
+        await db.delete_item(pk="b", sk="LIST#1")
+        await db.query(pk="b")
+
+        assert low_level.query.await_count == 4
+
+    async def test_failed_write_still_evicts(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        low_level.put_item = AsyncMock(
+            side_effect=ClientError({"Error": {"Code": "InternalError", "Message": ""}}, "PutItem")
+        )
+        db = self._cached_db(low_level)
+
+        await db.query(pk="a")
+        with pytest.raises(DatabaseError):
+            await db.put_item({"pk": "a", "sk": "LIST#2"})
+        await db.query(pk="a")
+
+        assert low_level.query.await_count == 2
+
+    async def test_query_overlapping_a_write_is_not_cached(self):
+        low_level = MagicMock()
+        db = self._cached_db(low_level)
+        low_level.put_item = AsyncMock(return_value={})
+
+        async def _query_racing_write(**kwargs):
+            await db.put_item({"pk": "a", "sk": "LIST#2"})
+            return {"Items": []}
+
+        low_level.query = AsyncMock(side_effect=_query_racing_write)
+
+        await db.query(pk="a")
+
+        assert db._query_cache == {}
+
+    async def test_evicts_oldest_partition_when_full(self):
+        low_level = MagicMock()
+        low_level.query = AsyncMock(return_value={"Items": []})
+        db = self._cached_db(low_level)
+
+        with patch("deepthought.db.client.QUERY_CACHE_MAX_PARTITIONS", 2):
+            await db.query(pk="a")
+            await db.query(pk="b")
+            await db.query(pk="c")
+
+        assert list(db._query_cache) == ["b", "c"]
+
+
+class TestBatchDelete:
+    """Tests for batch_delete."""
+
+    @patch("deepthought.db.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_chunks_and_retries_unprocessed(self, mock_sleep):
+        low_level = MagicMock()
+        unprocessed = {"t": [{"DeleteRequest": {"Key": {"pk": {"S": "a"}, "sk": {"S": "0"}}}}]}
+        low_level.batch_write_item = AsyncMock(
+            side_effect=[{"UnprocessedItems": unprocessed}, {}, {}]
+        )
+        db = _make_db(low_level)
+
+        await db.batch_delete([("a", str(i)) for i in range(30)])
+
+        calls = low_level.batch_write_item.call_args_list
+        assert sorted(len(c[1]["RequestItems"]["t"]) for c in calls) == [1, 5, 25]
+        assert unprocessed in [c[1]["RequestItems"] for c in calls]
+        mock_sleep.assert_awaited_once_with(0.05)
+
+    async def test_sends_chunks_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def _write(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        low_level = MagicMock()
+        low_level.batch_write_item = AsyncMock(side_effect=_write)
+        db = _make_db(low_level)
+
+        await db.batch_delete([("a", str(i)) for i in range(100)])
+
+        assert low_level.batch_write_item.await_count == 4
+        assert peak == 4
+
+    @patch("deepthought.db.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_raises_when_items_stay_unprocessed(self, mock_sleep):
+        low_level = MagicMock()
+        unprocessed = {"t": [{"DeleteRequest": {"Key": {"pk": {"S": "a"}, "sk": {"S": "0"}}}}]}
+        low_level.batch_write_item = AsyncMock(return_value={"UnprocessedItems": unprocessed})
+        db = _make_db(low_level)
+
+        with pytest.raises(DatabaseError):
+            await db.batch_delete([("a", "0"), ("a", "1")])
+
+        assert [c[0][0] for c in mock_sleep.await_args_list] == [0.05, 0.1, 0.2, 0.4, 0.8]
+
+    async def test_caps_chunks_in_flight(self):
+        in_flight = 0
+        peak = 0
+
+        async def _write(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {}
+
+        low_level = MagicMock()
+        low_level.batch_write_item = AsyncMock(side_effect=_write)
+        db = _make_db(low_level)
+
+        await db.batch_delete([("a", str(i)) for i in range(25 * 12)])
+
+        assert low_level.batch_write_item.await_count == 12
+        assert peak == BATCH_MAX_CONCURRENCY
+
+    @patch("deepthought.db.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_throttled_chunk(self, mock_sleep):
+        throttled = ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "slow"}},
+            "BatchWriteItem",
+        )
+        low_level = MagicMock()
+        low_level.batch_write_item = AsyncMock(side_effect=[throttled, {}])
+        db = _make_db(low_level)
+
+        await db.batch_delete([("a", "0"), ("a", "1")])
+
+        assert low_level.batch_write_item.await_count == 2
+        mock_sleep.assert_awaited_once_with(0.05)
+
+    async def test_other_client_errors_are_not_retried(self):
+        low_level = MagicMock()
+        low_level.batch_write_item = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "ValidationException", "Message": "bad"}}, "BatchWriteItem"
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(DatabaseError):
+            await db.batch_delete([("a", "0"), ("a", "1")])
+
+        low_level.batch_write_item.assert_awaited_once()
+
+    async def test_single_key_uses_delete_item(self):
+        low_level = MagicMock()
+        low_level.delete_item = AsyncMock(return_value={})
+        low_level.batch_write_item = AsyncMock()
+        db = _make_db(low_level)
+
+        await db.batch_delete([("a", "0")])
+
+        low_level.delete_item.assert_awaited_once_with(
+            TableName="t", Key={"pk": {"S": "a"}, "sk": {"S": "0"}}
+        )
+        low_level.batch_write_item.assert_not_called()
+
+
+class TestBatchGet:
+    """Tests for batch_get."""
+
+    async def test_dedupes_and_chunks_keys(self):
+        low_level = MagicMock()
+        low_level.batch_get_item = AsyncMock(
+            side_effect=lambda **kwargs: {
+                "Responses": {"t": kwargs["RequestItems"]["t"]["Keys"][:1]}
+            }
+        )
+        db = _make_db(low_level)
+
+        keys = [("a", str(i)) for i in range(150)]
+        items = await db.batch_get(keys + keys[:10])
+
+        calls = low_level.batch_get_item.call_args_list
+        assert sorted(len(c[1]["RequestItems"]["t"]["Keys"]) for c in calls) == [50, 100]
+        assert sorted(items, key=lambda i: int(i["sk"])) == [
+            {"pk": "a", "sk": "0"}, {"pk": "a", "sk": "100"},
+        ]
+
+    @patch("deepthought.db.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_unprocessed_keys(self, mock_sleep):
+        low_level = MagicMock()
+        unprocessed = {"t": {"Keys": [{"pk": {"S": "a"}, "sk": {"S": "2"}}]}}
+        low_level.batch_get_item = AsyncMock(
+            side_effect=[
+                {
+                    "Responses": {"t": [{"pk": {"S": "a"}, "sk": {"S": "1"}}]},
+                    "UnprocessedKeys": unprocessed,
+                },
+                {"Responses": {"t": [{"pk": {"S": "a"}, "sk": {"S": "2"}}]}},
+            ]
+        )
+        db = _make_db(low_level)
+
+        items = await db.batch_get([("a", "1"), ("a", "2")])
+
+        assert items == [{"pk": "a", "sk": "1"}, {"pk": "a", "sk": "2"}]
+        assert low_level.batch_get_item.call_args_list[1][1]["RequestItems"] == unprocessed
+        mock_sleep.assert_awaited_once_with(0.05)
+
+    @patch("deepthought.db.client.asyncio.sleep", new_callable=AsyncMock)
+    async def test_retries_throttled_chunk(self, mock_sleep):
+        throttled = ClientError(
+            {"Error": {"Code": "ThrottlingException", "Message": "slow"}}, "BatchGetItem"
+        )
+        low_level = MagicMock()
+        low_level.batch_get_item = AsyncMock(
+            side_effect=[throttled, {"Responses": {"t": [{"pk": {"S": "a"}, "sk": {"S": "1"}}]}}]
+        )
+        db = _make_db(low_level)
+
+        items = await db.batch_get([("a", "1")])
+
+        assert items == [{"pk": "a", "sk": "1"}]
+        mock_sleep.assert_awaited_once_with(0.05)
+
+    async def test_empty_keys_skip_request(self):
+        low_level = MagicMock()
+        low_level.batch_get_item = AsyncMock()
+        db = _make_db(low_level)
+
+        assert await db.batch_get([]) == []
+        low_level.batch_get_item.assert_not_called()
+
+    async def test_client_error_raises_database_error(self):
+        low_level = MagicMock()
+        low_level.batch_get_item = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "ValidationException", "Message": "bad"}}, "BatchGetItem"
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(DatabaseError):
+            await db.batch_get([("a", "1")])
+
+
+class TestUpdateItem:
+    """Tests for SET/REMOVE updates and their conditions."""
+
+    async def test_unconditional_set(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(return_value={"Attributes": {"n": {"S": "x"}}})
+        db = _make_db(low_level)
+
+        result = await db.update_item(pk="a", sk="b", updates={"n": "x"})
+
+        assert result == {"n": "x"}
+        kwargs = low_level.update_item.call_args[1]
+        assert kwargs["UpdateExpression"] == "SET #attr0 = :val0"
+        assert "ConditionExpression" not in kwargs
+
+    async def test_set_and_remove_with_conditions(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(return_value={"Attributes": {}})
+        db = _make_db(low_level)
+
+        await db.update_item(
+            pk="a", sk="b", updates={"done": False}, remove=["done_at"],
+            expect_different={"done": False},
+        )
+
+        kwargs = low_level.update_item.call_args[1]
+        assert kwargs["UpdateExpression"] == "SET #attr0 = :val0 REMOVE #rm0"
+        assert kwargs["ConditionExpression"] == "attribute_exists(pk) AND #cond0 <> :cond0"
+        assert kwargs["ExpressionAttributeNames"] == {
+            "#attr0": "done", "#rm0": "done_at", "#cond0": "done",
+        }
+        assert kwargs["ExpressionAttributeValues"] == {
+            ":val0": {"BOOL": False}, ":cond0": {"BOOL": False},
+        }
+        assert kwargs["ReturnValuesOnConditionCheckFailure"] == "ALL_OLD"
+
+    async def test_repeated_shape_reuses_compiled_expression(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(return_value={"Attributes": {}})
+        db = _make_db(low_level)
+        _compile_update.cache_clear()
+
+        await db.update_item(pk="a", sk="b", updates={"n": "x", "m": 1}, must_exist=True)
+        await db.update_item(pk="a", sk="c", updates={"n": "y", "m": 2}, must_exist=True)
+
+        assert _compile_update.cache_info().hits == 1
+        first, second = (c[1] for c in low_level.update_item.call_args_list)
+        assert first["UpdateExpression"] == second["UpdateExpression"]
+        assert second["ExpressionAttributeValues"] == {":val0": {"S": "y"}, ":val1": {"N": "2"}}
+        # Each call gets its own names dict, not the cached one
+        assert first["ExpressionAttributeNames"] is not second["ExpressionAttributeNames"]
+
+    async def test_failed_condition_on_existing_item_carries_current_item(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(
+            side_effect=ClientError(
+                {
+                    "Error": {"Code": "ConditionalCheckFailedException", "Message": ""},
+                    "Item": {"pk": {"S": "a"}, "done": {"BOOL": True}},
+                },
+                "UpdateItem",
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(ConditionFailedError) as exc_info:
+            await db.update_item(
+                pk="a", sk="b", updates={"done": True}, expect_different={"done": True}
+            )
+
+        assert exc_info.value.item == {"pk": "a", "done": True}
+
+    async def test_failed_condition_on_missing_item_raises_not_found(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+                "UpdateItem",
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(NotFoundError):
+            await db.update_item(pk="a", sk="b", updates={"n": 1}, must_exist=True)
+
+
+class TestDeleteItem:
+    """Tests for unconditional and existence-conditioned deletes."""
+
+    async def test_unconditional_delete_has_no_condition(self):
+        low_level = MagicMock()
+        low_level.delete_item = AsyncMock(return_value={})
+        db = _make_db(low_level)
+
+        result = await db.delete_item(pk="a", sk="b")
+
+        assert result is None
+        assert "ConditionExpression" not in low_level.delete_item.call_args[1]
+
+    async def test_returns_deleted_attributes(self):
+        low_level = MagicMock()
+        low_level.delete_item = AsyncMock(
+            return_value={"Attributes": {"pk": {"S": "a"}, "completed": {"BOOL": True}}}
+        )
+        db = _make_db(low_level)
+
+        result = await db.delete_item(pk="a", sk="b", must_exist=True)
+
+        assert result == {"pk": "a", "completed": True}
+        assert low_level.delete_item.call_args[1]["ReturnValues"] == "ALL_OLD"
+
+    async def test_must_exist_raises_not_found_on_failed_condition(self):
+        low_level = MagicMock()
+        low_level.delete_item = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+                "DeleteItem",
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(NotFoundError):
+            await db.delete_item(pk="a", sk="b", must_exist=True)
+
+        kwargs = low_level.delete_item.call_args[1]
+        assert kwargs["ConditionExpression"] == "attribute_exists(pk)"
+
+    async def test_other_errors_raise_database_error(self):
+        low_level = MagicMock()
+        low_level.delete_item = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": ""}},
+                "DeleteItem",
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(DatabaseError):
+            await db.delete_item(pk="a", sk="b", must_exist=True)
+
+
+class TestIncrementCounter:
+    """Tests for atomic server-side counters."""
+
+    async def test_adds_amount_and_returns_new_value(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(return_value={"Attributes": {"n": {"N": "3"}}})
+        db = _make_db(low_level)
+
+        result = await db.increment_counter(pk="a", sk="b", field="n")
+
+        assert result == 3
+        kwargs = low_level.update_item.call_args[1]
+        assert kwargs["UpdateExpression"] == "ADD #f0 :amount0"
+        assert kwargs["ConditionExpression"] == "attribute_exists(pk)"
+        assert kwargs["ExpressionAttributeNames"] == {"#f0": "n"}
+        assert kwargs["ExpressionAttributeValues"] == {":amount0": {"N": "1"}}
+
+    async def test_adjusts_several_counters_in_one_update(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(
+            return_value={"Attributes": {"a": {"N": "4"}, "b": {"N": "0"}}}
+        )
+        db = _make_db(low_level)
+
+        result = await db.increment_counters(pk="p", sk="s", amounts={"a": -1, "b": -1})
+
+        assert result == {"a": 4, "b": 0}
+        low_level.update_item.assert_awaited_once()
+        assert (
+            low_level.update_item.call_args[1]["UpdateExpression"]
+            == "ADD #f0 :amount0, #f1 :amount1"
+        )
+
+    async def test_raises_not_found_for_missing_item(self):
+        low_level = MagicMock()
+        low_level.update_item = AsyncMock(
+            side_effect=ClientError(
+                {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+                "UpdateItem",
+            )
+        )
+        db = _make_db(low_level)
+
+        with pytest.raises(NotFoundError):
+            await db.increment_counter(pk="a", sk="b", field="n", amount=-1)
@@ -0,0 +1,74 @@
+"""Unit tests for FastAPI dependency providers."""
+
+from unittest.mock import patch
+
+import pytest
+
+from deepthought.api.dependencies import get_calendar_db_client, get_todos_db_client
+from deepthought.config import get_settings
+from deepthought.db import close_table_clients
+
+
+@pytest.fixture(autouse=True)
+async def close_clients():
+    """Close any resources the dependencies opened during a test."""
+    yield
+    await close_table_clients()
+
+
+class TestDbClientDependencies:
+    """Tests for the per-table DynamoDB client dependencies."""
+
+    async def test_client_reused_across_requests(self):
+        """Test the same client is yielded on every resolution."""
+        first = await anext(get_calendar_db_client())
+        second = await anext(get_calendar_db_client())
+
+        assert first is second
+
+    async def test_settings_read_only_on_first_resolution(self):
+        """Test later resolutions reuse the client without consulting settings."""
+        first = await anext(get_calendar_db_client())
+
+        with patch("deepthought.api.dependencies.get_settings") as mock_settings:
+            second = await anext(get_calendar_db_client())
+
+        assert second is first
+        mock_settings.assert_not_called()
+
+    async def test_client_per_table(self):
+        """Test each table gets its own client."""
+        calendar = await anext(get_calendar_db_client())
+        todos = await anext(get_todos_db_client())
+
+        settings = get_settings()
+        assert calendar is not todos
+        assert calendar.table_name == settings.dynamodb_calendar_table
+        assert todos.table_name == settings.dynamodb_todos_table
+
+    async def test_client_keeps_connections_alive(self):
+        """Test shared clients are configured for pooled keep-alive connections."""
+        client = await anext(get_calendar_db_client())
+
+        assert client._config.tcp_keepalive is True
+        assert client._config.max_pool_connections == 50
+        assert client._config.connector_args["keepalive_timeout"] == 30
+        assert client._config.connect_timeout == 5
+        assert client._config.read_timeout == 10
+
+    async def test_client_caches_queries_for_configured_ttl(self):
+        """Test shared clients get the query cache TTL from settings."""
+        client = await anext(get_todos_db_client())
+
+        assert client._query_cache_ttl == get_settings().dynamodb_query_cache_ttl
+
+    async def test_client_connected_until_shutdown(self):
+        """Test the dependency opens one client and shutdown closes it."""
+        client = await anext(get_calendar_db_client())
+        low_level = client._cached_client
+
+        assert low_level is not None
+        assert (await anext(get_calendar_db_client()))._cached_client is low_level
+
+        await close_table_clients()
+        assert client._cached_client is None
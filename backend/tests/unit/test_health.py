@@ -0,0 +1,22 @@
+"""Unit tests for the health check endpoint."""
+
+from datetime import datetime
+
+from deepthought import __version__
+from deepthought.api.routes.health import health_check
+
+
+class TestHealthCheck:
+    """Tests for GET /health endpoint."""
+
+    async def test_reports_healthy_with_version(self):
+        result = await health_check()
+
+        assert result.status == "healthy"
+        assert result.version == __version__
+        assert datetime.fromisoformat(result.timestamp).tzinfo is not None
+
+    async def test_serializes_all_fields(self):
+        result = await health_check()
+
+        assert set(result.model_dump()) == {"status", "version", "timestamp"}
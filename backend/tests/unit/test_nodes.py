@@ -1,13 +1,23 @@
 """Unit tests for agent nodes."""
 
+import logging
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from deepthought.agents.nodes.orchestrator import orchestrator_node
+from deepthought.agents.nodes.orchestrator import (
+    _create_fallback_plan,
+    _parse_llm_plan,
+    _prefetch_item,
+    orchestrator_node,
+)
 from deepthought.agents.nodes.execution import execution_node
-from deepthought.agents.nodes.verification import verification_node
+from deepthought.agents.nodes.verification import (
+    _cached_verify,
+    _check_type_consistency,
+    verification_node,
+)
 from deepthought.agents.nodes.response import response_node
 from deepthought.agents.state import AgentState
 from deepthought.models.agents import (
@@ -29,6 +39,7 @@ def create_base_state(**overrides) -> AgentState:
         "task_description": "Calculate sum of values",
         "input_params": {"partition_key": "CALC#test", "sort_key": "ITEM#001"},
         "plan": None,
+        "prefetched_item": None,
         "execution_result": None,
         "verification_result": None,
         "formatted_response": None,
@@ -98,8 +109,9 @@ class TestOrchestratorNode:
         assert result["current_step"] == "orchestrator_complete"
 
     @pytest.mark.asyncio
-    async def test_adds_message(self):
-        """Test orchestrator adds a message."""
+    async def test_adds_message(self, caplog):
+        """Test orchestrator adds a message when debug logging is enabled."""
+        caplog.set_level(logging.DEBUG, logger="deepthought.agents.nodes.orchestrator")
         state = create_base_state()
 
         result = await orchestrator_node(state)
@@ -107,6 +119,16 @@ class TestOrchestratorNode:
         assert "messages" in result
         assert len(result["messages"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_omits_message_without_debug(self, caplog):
+        """Test orchestrator skips the message history outside debug logging."""
+        caplog.set_level(logging.INFO, logger="deepthought.agents.nodes.orchestrator")
+        state = create_base_state()
+
+        result = await orchestrator_node(state)
+
+        assert "messages" not in result
+
     @pytest.mark.asyncio
     async def test_plan_id_matches_request_id(self):
         """Test plan_id is set to request_id."""
@@ -116,6 +138,122 @@ class TestOrchestratorNode:
 
         assert result["plan"].plan_id == "unique-request-456"
 
+    @pytest.mark.asyncio
+    @patch("deepthought.agents.nodes.orchestrator.query_dynamodb")
+    async def test_prefetch_returns_item(self, mock_query):
+        """Test the prefetch queries the item named by the input params."""
+        item = {"pk": "CALC#test", "sk": "ITEM#001", "val1": 1, "val2": 2}
+        mock_query.ainvoke = AsyncMock(return_value=item)
+
+        result = await _prefetch_item({"partition_key": "CALC#test", "sort_key": "ITEM#001"})
+
+        assert result == item
+        mock_query.ainvoke.assert_awaited_once_with({"pk": "CALC#test", "sk": "ITEM#001"})
+
+    @pytest.mark.asyncio
+    @patch("deepthought.agents.nodes.orchestrator.query_dynamodb")
+    async def test_prefetch_skipped_for_direct_values(self, mock_query):
+        """Test no query is made when val1 and val2 are passed directly."""
+        mock_query.ainvoke = AsyncMock()
+
+        result = await _prefetch_item(
+            {"partition_key": "PAIR#1", "sort_key": "DIRECT", "val1": 1, "val2": 2}
+        )
+
+        assert result is None
+        mock_query.ainvoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("deepthought.agents.nodes.orchestrator.query_dynamodb")
+    async def test_prefetch_failure_returns_none(self, mock_query):
+        """Test a failed prefetch is swallowed."""
+        mock_query.ainvoke = AsyncMock(side_effect=Exception("Database error"))
+
+        result = await _prefetch_item({"partition_key": "CALC#test", "sort_key": "ITEM#001"})
+
+        assert result is None
+
+
+class TestParseLlmPlan:
+    """Tests for _parse_llm_plan JSON extraction."""
+
+    PLAN_JSON = (
+        '{"operation": "multiply", "steps": [{"step_number": 1, '
+        '"action": "execute_operation", "description": "Multiply"}]}'
+    )
+
+    def test_parses_json_fence(self):
+        """Test JSON inside a ```json fence is extracted."""
+        text = f"Here is the plan:\n```json\n{self.PLAN_JSON}\n```\nDone."
+
+        plan = _parse_llm_plan(text, create_base_state())
+
+        assert len(plan.steps) == 1
+        assert plan.steps[0].parameters["function"] == "multiply_values"
+
+    def test_parses_bare_fence(self):
+        """Test JSON inside an unlabelled ``` fence is extracted."""
+        text = f"```\n{self.PLAN_JSON}\n```"
+
+        plan = _parse_llm_plan(text, create_base_state())
+
+        assert plan.steps[0].parameters["operation"] == "multiply"
+
+    def test_parses_unfenced_object(self):
+        """Test a bare JSON object surrounded by prose is extracted."""
+        text = f"Plan follows {self.PLAN_JSON} as requested"
+
+        plan = _parse_llm_plan(text, create_base_state())
+
+        assert plan.steps[0].step_type == PlanStepType.EXECUTE_FUNCTION
+
+    def test_raises_without_json(self):
+        """Test a response without any JSON object raises ValueError."""
+        with pytest.raises(ValueError):
+            _parse_llm_plan("I cannot help with that.", create_base_state())
+
+    def test_raises_on_invalid_json(self):
+        """Test malformed JSON raises ValueError."""
+        with pytest.raises(ValueError):
+            _parse_llm_plan("```json\n{not valid}\n```", create_base_state())
+
+
+class TestCreateFallbackPlan:
+    """Tests for _create_fallback_plan."""
+
+    def test_builds_steps_for_operation(self):
+        """Test fallback steps target the requested operation."""
+        state = create_base_state(
+            input_params={"partition_key": "CALC#1", "sort_key": "A", "operation": "divide"}
+        )
+
+        plan = _create_fallback_plan(state)
+
+        assert [s.step_number for s in plan.steps] == [1, 2, 3, 4]
+        assert plan.steps[0].parameters == {"pk": "CALC#1", "sk": "A"}
+        assert plan.steps[1].parameters == {"function": "divide_values", "operation": "divide"}
+
+    def test_steps_are_not_shared_between_plans(self):
+        """Test each plan gets its own copy of the precomputed steps."""
+        state = create_base_state()
+
+        first = _create_fallback_plan(state)
+        second = _create_fallback_plan(state)
+
+        assert first.steps[1] == second.steps[1]
+        assert first.steps[1] is not second.steps[1]
+        assert first.steps[1].parameters is not second.steps[1].parameters
+
+    def test_unknown_operation_defaults_to_add_function(self):
+        """Test an unrecognised operation still produces a usable plan."""
+        state = create_base_state(
+            input_params={"partition_key": "CALC#1", "sort_key": "A", "operation": "modulo"}
+        )
+
+        plan = _create_fallback_plan(state)
+
+        assert plan.steps[1].parameters == {"function": "add_values", "operation": "modulo"}
+
 
 class TestExecutionNode:
     """Tests for execution_node."""
@@ -199,6 +337,44 @@ class TestExecutionNode:
         assert result["execution_result"] is not None
         assert result["execution_result"].success is False
 
+    @pytest.mark.asyncio
+    @patch("deepthought.agents.nodes.execution.query_dynamodb")
+    async def test_uses_prefetched_item(self, mock_query):
+        """Test execution reuses the item prefetched by the orchestrator."""
+        mock_query.ainvoke = AsyncMock()
+
+        plan = Plan(
+            plan_id="test-123",
+            created_at=datetime.now(timezone.utc),
+            task_description="Test",
+            steps=[
+                PlanStep(
+                    step_number=1,
+                    step_type=PlanStepType.QUERY_DATABASE,
+                    description="Query",
+                    parameters={"pk": "CALC#test", "sk": "ITEM#001"},
+                ),
+                PlanStep(
+                    step_number=2,
+                    step_type=PlanStepType.EXECUTE_FUNCTION,
+                    description="Add",
+                    parameters={"function": "add_values"},
+                    depends_on=[1],
+                ),
+            ],
+            expected_outcome="Sum",
+        )
+        state = create_base_state(
+            plan=plan,
+            prefetched_item={"pk": "CALC#test", "sk": "ITEM#001", "val1": 40, "val2": 2},
+        )
+
+        result = await execution_node(state)
+
+        mock_query.ainvoke.assert_not_called()
+        assert result["execution_result"].success is True
+        assert result["execution_result"].final_value == 42
+        assert result["execution_result"].tool_results[0].tool_name == "query_dynamodb"
 
     @pytest.mark.asyncio
     @patch("deepthought.agents.nodes.execution.query_dynamodb")
@@ -557,6 +733,83 @@ class TestVerificationNode:
 
         assert result["verification_result"].overall_status == VerificationStatus.FAILED
 
+    def test_verification_results_are_memoized(self):
+        """Test repeated verifications of the same inputs hit the cache."""
+        _cached_verify.cache_clear()
+
+        first = _cached_verify("multiply", 6, 7, 42)
+        second = _cached_verify("multiply", 6, 7, 42)
+
+        assert first == second == (True, 42, first[2])
+        assert _cached_verify.cache_info().hits == 1
+
+    def test_verification_cache_keeps_int_and_float_apart(self):
+        """Test int and float inputs are cached separately."""
+        _cached_verify.cache_clear()
+
+        _cached_verify("add", 1, 2, 3)
+        _cached_verify("add", 1.0, 2.0, 3.0)
+
+        assert _cached_verify.cache_info().misses == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_operation_takes_precedence_over_plan(self):
+        """Test the executed tool decides the operation when the plan disagrees."""
+        plan = Plan(
+            plan_id="test-123",
+            created_at=datetime.now(timezone.utc),
+            task_description="Test",
+            steps=[
+                PlanStep(
+                    step_number=1,
+                    step_type=PlanStepType.VERIFY_RESULT,
+                    description="Verify",
+                    parameters={"operation": "add"},
+                )
+            ],
+            expected_outcome="Product",
+        )
+        execution_result = ExecutionResult(
+            plan_id="test-123",
+            executed_steps=[1],
+            tool_results=[
+                ToolCallResult(
+                    tool_name="multiply_values",
+                    input_params={"val1": 6, "val2": 7},
+                    output=42,
+                    success=True,
+                    execution_time_ms=1.0,
+                ),
+            ],
+            final_value=42,
+            success=True,
+        )
+        state = create_base_state(
+            plan=plan,
+            execution_result=execution_result,
+            input_params={
+                "partition_key": "CALC#test",
+                "sort_key": "ITEM#001",
+                "val1": 6,
+                "val2": 7,
+            },
+        )
+
+        result = await verification_node(state)
+
+        assert result["verification_result"].overall_status == VerificationStatus.PASSED
+        assert result["verification_result"].checks[0].check_name == "multiply_correctness"
+
+    def test_type_check_reports_result_type(self):
+        """Test the type check names the result type and reuses common ones."""
+        int_check = _check_type_consistency(100)
+        float_check = _check_type_consistency(2.5)
+
+        assert int_check.actual_value == "int"
+        assert float_check.actual_value == "float"
+        assert int_check.status == VerificationStatus.PASSED
+        assert _check_type_consistency(7) is int_check
+
 
 class TestResponseNode:
     """Tests for response_node."""
@@ -932,3 +1185,53 @@ class TestResponseNode:
 
         assert result["formatted_response"].success is False
         assert "verification failures" in result["formatted_response"].message.lower()
+
+    @pytest.mark.asyncio
+    async def test_operation_falls_back_to_plan(self):
+        """Test operation comes from the plan when no calculation tool succeeded."""
+        plan = Plan(
+            plan_id="test-123",
+            created_at=datetime.now(timezone.utc),
+            task_description="Test",
+            steps=[
+                PlanStep(
+                    step_number=1,
+                    step_type=PlanStepType.EXECUTE_FUNCTION,
+                    description="Divide",
+                    parameters={"function": "divide_values", "operation": "divide"},
+                )
+            ],
+            expected_outcome="Quotient",
+        )
+        execution_result = ExecutionResult(
+            plan_id="test-123",
+            executed_steps=[1],
+            tool_results=[
+                ToolCallResult(
+                    tool_name="divide_values",
+                    input_params={"val1": 1, "val2": 0},
+                    output=None,
+                    success=False,
+                    error="Cannot divide by zero",
+                    execution_time_ms=1.0,
+                ),
+            ],
+            final_value=None,
+            success=False,
+        )
+        verification_result = VerificationResult(
+            plan_id="test-123",
+            checks=[],
+            overall_status=VerificationStatus.FAILED,
+            confidence_score=0.0,
+            reasoning="Execution failed",
+        )
+        state = create_base_state(
+            plan=plan,
+            execution_result=execution_result,
+            verification_result=verification_result,
+        )
+
+        result = await response_node(state)
+
+        assert result["formatted_response"].data["operation"] == "divide"
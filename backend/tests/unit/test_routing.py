@@ -0,0 +1,120 @@
+"""Unit tests for conditional edge routing."""
+
+from datetime import datetime, timezone
+
+from deepthought.agents.edges.routing import (
+    route_after_execution,
+    route_after_orchestrator,
+    route_after_verification,
+)
+from deepthought.models.agents import (
+    ExecutionResult,
+    Plan,
+    VerificationResult,
+    VerificationStatus,
+)
+
+
+def _plan() -> Plan:
+    """Create a minimal plan."""
+    return Plan(
+        plan_id="test-123",
+        created_at=datetime.now(timezone.utc),
+        task_description="Test",
+        steps=[],
+        expected_outcome="Sum",
+    )
+
+
+def _execution(success: bool) -> ExecutionResult:
+    """Create an execution result with the given outcome."""
+    return ExecutionResult(
+        plan_id="test-123",
+        executed_steps=[],
+        tool_results=[],
+        final_value=None,
+        success=success,
+    )
+
+
+def _verification(status: VerificationStatus) -> VerificationResult:
+    """Create a verification result with the given status."""
+    return VerificationResult(
+        plan_id="test-123",
+        checks=[],
+        overall_status=status,
+        confidence_score=1.0,
+        reasoning="",
+    )
+
+
+class TestRouteAfterOrchestrator:
+    """Tests for route_after_orchestrator."""
+
+    def test_routes_to_execution_with_plan(self):
+        """Test a plan without errors proceeds to execution."""
+        assert route_after_orchestrator({"plan": _plan(), "error": None}) == "execution"
+
+    def test_routes_to_error_without_plan(self):
+        """Test a missing plan routes to error."""
+        assert route_after_orchestrator({"plan": None, "error": None}) == "error"
+
+    def test_routes_to_error_on_error(self):
+        """Test an error routes to error even with a plan."""
+        assert route_after_orchestrator({"plan": _plan(), "error": "boom"}) == "error"
+
+
+class TestRouteAfterExecution:
+    """Tests for route_after_execution."""
+
+    def test_routes_to_verification_on_success(self):
+        """Test successful execution proceeds to verification."""
+        assert route_after_execution({"execution_result": _execution(True)}) == "verification"
+
+    def test_retries_failed_execution(self):
+        """Test failed execution retries while under the limit."""
+        state = {"execution_result": _execution(False), "retry_count": 2}
+        assert route_after_execution(state) == "retry"
+
+    def test_errors_after_max_retries(self):
+        """Test failed execution routes to error once retries are exhausted."""
+        state = {"execution_result": _execution(False), "retry_count": 3}
+        assert route_after_execution(state) == "error"
+
+    def test_routes_to_error_without_result(self):
+        """Test a missing execution result routes to error."""
+        assert route_after_execution({"execution_result": None}) == "error"
+
+
+class TestRouteAfterVerification:
+    """Tests for route_after_verification."""
+
+    def test_routes_to_response_on_pass(self):
+        """Test passed verification proceeds to response."""
+        state = {"verification_result": _verification(VerificationStatus.PASSED)}
+        assert route_after_verification(state) == "response"
+
+    def test_routes_to_response_on_skip(self):
+        """Test skipped verification proceeds to response."""
+        state = {"verification_result": _verification(VerificationStatus.SKIPPED)}
+        assert route_after_verification(state) == "response"
+
+    def test_retries_failed_verification(self):
+        """Test failed verification re-runs execution while under the limit."""
+        state = {
+            "verification_result": _verification(VerificationStatus.FAILED),
+            "retry_count": 1,
+        }
+        assert route_after_verification(state) == "retry_execution"
+
+    def test_errors_after_max_retries(self):
+        """Test failed verification routes to error once retries are exhausted."""
+        state = {
+            "verification_result": _verification(VerificationStatus.FAILED),
+            "retry_count": 2,
+        }
+        assert route_after_verification(state) == "error"
+
+    def test_routes_to_error_without_result(self):
+        """Test a missing verification result routes to error."""
+        assert route_after_verification({"verification_result": None}) == "error"
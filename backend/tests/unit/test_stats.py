@@ -1,6 +1,6 @@
 """Unit tests for stats endpoints and computation logic."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from deepthought.api.routes.stats import _build_daily_counts, pairs_stats, todos_stats
@@ -8,26 +8,23 @@ from deepthought.api.routes.stats import _build_daily_counts, pairs_stats, todos
 
 MOCK_USER = {"pk": "test@example.com", "first_name": "Test", "last_name": "User"}
 
+TODAY = date(2026, 2, 26)
+
 
 class TestBuildDailyCounts:
     """Tests for the _build_daily_counts helper."""
 
     def test_returns_correct_number_of_days(self):
-        result = _build_daily_counts([], last_n_days=10)
+        result = _build_daily_counts([], TODAY, last_n_days=10)
         assert len(result) == 10
 
     def test_zero_fills_empty_days(self):
-        result = _build_daily_counts([], last_n_days=5)
+        result = _build_daily_counts([], TODAY, last_n_days=5)
         assert all(dc.count == 0 for dc in result)
 
-    @patch("deepthought.api.routes.stats.datetime")
-    def test_counts_dates_correctly(self, mock_dt):
-        today = datetime(2026, 2, 26, tzinfo=timezone.utc).date()
-        mock_dt.now.return_value = datetime(2026, 2, 26, tzinfo=timezone.utc)
-        mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
-
+    def test_counts_dates_correctly(self):
         dates = ["2026-02-26", "2026-02-26", "2026-02-25"]
-        result = _build_daily_counts(dates, last_n_days=3)
+        result = _build_daily_counts(dates, TODAY, last_n_days=3)
 
         assert result[0].date == "2026-02-24"
         assert result[0].count == 0
@@ -37,14 +34,13 @@ class TestBuildDailyCounts:
         assert result[2].count == 2
 
     def test_ordered_oldest_to_newest(self):
-        result = _build_daily_counts([], last_n_days=3)
+        result = _build_daily_counts([], TODAY, last_n_days=3)
         dates = [dc.date for dc in result]
         assert dates == sorted(dates)
 
     def test_ignores_dates_outside_window(self):
-        today = datetime.now(timezone.utc).date()
-        old_date = str(today - timedelta(days=30))
-        result = _build_daily_counts([old_date], last_n_days=10)
+        old_date = str(TODAY - timedelta(days=30))
+        result = _build_daily_counts([old_date], TODAY, last_n_days=10)
         assert all(dc.count == 0 for dc in result)
 
 
@@ -54,7 +50,8 @@ class TestPairsStats:
     async def test_returns_total_and_daily_counts(self):
         today = datetime.now(timezone.utc)
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(
+        mock_db.query_count = AsyncMock(return_value=25)
+        mock_db.query_gsi_range = AsyncMock(
             return_value=[
                 {"created_at": today.isoformat()},
                 {"created_at": today.isoformat()},
@@ -64,13 +61,48 @@ class TestPairsStats:
 
         result = await pairs_stats(current_user=MOCK_USER, pairs_db=mock_db)
 
-        assert result.total == 3
+        assert result.total == 25
         assert len(result.daily_counts) == 10
-        mock_db.query.assert_called_once_with(pk="test@example.com")
+        assert result.daily_counts[-1].count == 2
+        assert result.daily_counts[-2].count == 1
+        mock_db.query_count.assert_called_once_with(pk="test@example.com")
+
+    async def test_uses_created_at_gsi_window(self):
+        mock_db = MagicMock()
+        mock_db.query_count = AsyncMock(return_value=0)
+        mock_db.query_gsi_range = AsyncMock(return_value=[])
+
+        await pairs_stats(current_user=MOCK_USER, pairs_db=mock_db)
+
+        call_kwargs = mock_db.query_gsi_range.call_args[1]
+        today = datetime.now(timezone.utc).date()
+        assert call_kwargs["index_name"] == "pk_created_at_index"
+        assert call_kwargs["pk_value"] == "test@example.com"
+        assert call_kwargs["sk_attr"] == "created_at"
+        assert call_kwargs["projection"] == ["created_at"]
+        window_start = today - timedelta(days=9)
+        assert call_kwargs["sk_start"] == f"{window_start.isoformat()}T00:00:00+00:00"
+        # Timestamps with fractional seconds at the end of today must sort inside the range
+        late_today = datetime.combine(today, datetime.max.time(), tzinfo=timezone.utc).isoformat()
+        assert late_today <= call_kwargs["sk_end"]
+
+    @patch("deepthought.api.routes.stats.datetime")
+    async def test_window_and_counts_share_one_today(self, mock_dt):
+        mock_dt.now.return_value = datetime(2026, 2, 26, 23, 59, tzinfo=timezone.utc)
+        mock_db = MagicMock()
+        mock_db.query_count = AsyncMock(return_value=0)
+        mock_db.query_gsi_range = AsyncMock(return_value=[])
+
+        result = await pairs_stats(current_user=MOCK_USER, pairs_db=mock_db)
+
+        mock_dt.now.assert_called_once()
+        assert mock_db.query_gsi_range.call_args[1]["sk_end"].startswith("2026-02-26")
+        assert result.daily_counts[-1].date == "2026-02-26"
 
     async def test_returns_zero_total_with_no_pairs(self):
         mock_db = MagicMock()
-        mock_db.query = AsyncMock(return_value=[])
+        mock_db.query_count = AsyncMock(return_value=0)
+        mock_db.query_gsi_range = AsyncMock(return_value=[])
 
         result = await pairs_stats(current_user=MOCK_USER, pairs_db=mock_db)
 
@@ -113,6 +145,7 @@ class TestTodosStats:
         assert call_kwargs["pk_attr"] == "pk"
         assert call_kwargs["pk_value"] == "test@example.com"
         assert call_kwargs["sk_attr"] == "completed_at"
+        assert call_kwargs["projection"] == ["completed_at"]
 
     async def test_returns_zero_with_no_lists_or_completions(self):
         mock_db = MagicMock()
@@ -0,0 +1,57 @@
+"""Unit tests for ISO 8601 timestamp parsing."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from deepthought.core import parse_iso_datetime
+
+
+class TestParseIsoDatetime:
+    """Tests for parse_iso_datetime."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2026-02-20T10:00:00+00:00",
+            "2026-02-20T10:00:00.123456-05:00",
+            "2026-02-20T10:00:00+05:30",
+            "2026-02-20T10:00:00",
+        ],
+    )
+    def test_matches_fromisoformat(self, value):
+        """Test results match the stdlib parser for stored timestamp formats."""
+        parsed = parse_iso_datetime(value)
+
+        expected = datetime.fromisoformat(value)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
+
+    def test_falls_back_when_fast_parser_rejects(self):
+        """Test the stdlib parser is used when the fast parser raises."""
+
+        def reject(value: str) -> datetime:
+            raise ValueError(value)
+
+        parse_iso_datetime.cache_clear()
+        with patch("deepthought.core.timestamps._fast_parse", reject):
+            parsed = parse_iso_datetime("2026-02-20T10:00:00+01:00")
+
+        assert parsed == datetime(2026, 2, 20, 9, 0, tzinfo=timezone.utc)
+        assert parsed.utcoffset() == timedelta(hours=1)
+
+    def test_invalid_string_raises(self):
+        """Test an unparseable string raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_iso_datetime("not a timestamp")
+
+    def test_repeated_strings_are_parsed_once(self):
+        """Test a repeated timestamp is served from the cache."""
+        parse_iso_datetime.cache_clear()
+
+        first = parse_iso_datetime("2026-02-20T10:00:00+00:00")
+        second = parse_iso_datetime("2026-02-20T10:00:00+00:00")
+
+        assert first is second
+        assert parse_iso_datetime.cache_info().hits == 1
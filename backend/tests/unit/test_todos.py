@@ -1,11 +1,14 @@
 """Unit tests for todo endpoints."""
 
+import asyncio
 from datetime import datetime, timezone
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from deepthought.api.routes.todos import (
+    _item_to_response,
     add_item,
     create_list,
     delete_item,
@@ -14,7 +17,13 @@ from deepthought.api.routes.todos import (
     list_lists,
     update_item,
 )
-from deepthought.models.todos import TodoItemCreate, TodoItemUpdate, TodoListCreate
+from deepthought.core import ConditionFailedError, DatabaseError, NotFoundError
+from deepthought.models.todos import (
+    TodoItemCreate,
+    TodoItemResponse,
+    TodoItemUpdate,
+    TodoListCreate,
+)
 
 
 MOCK_USER = {"pk": "test@example.com", "first_name": "Test", "last_name": "User"}
@@ -22,12 +31,19 @@ MOCK_USER = {"pk": "test@example.com", "first_name": "Test", "last_name": "User"
 CREATED_ISO = "2026-02-15T08:00:00+00:00"
 
 
-def _make_db_list(list_id: str = "list-1", title: str = "Groceries") -> dict:
+def _make_db_list(
+    list_id: str = "list-1",
+    title: str = "Groceries",
+    item_count: int = 0,
+    completed_count: int = 0,
+) -> dict:
     return {
         "pk": "test@example.com",
         "sk": f"LIST#{list_id}",
         "list_id": list_id,
         "title": title,
+        "item_count": item_count,
+        "completed_count": completed_count,
         "created_at": CREATED_ISO,
         "updated_at": CREATED_ISO,
     }
@@ -87,6 +103,19 @@ class TestCreateList:
         stored = mock_db.put_item.call_args[0][0]
         assert stored["sk"] == f"LIST#{result.list_id}"
         assert stored["pk"] == "test@example.com"
+        assert stored["item_count"] == 0
+        assert stored["completed_count"] == 0
+
+    async def test_list_id_is_undashed_hex(self):
+        mock_db = MagicMock()
+        mock_db.put_item = AsyncMock(return_value=None)
+
+        result = await create_list(
+            request=TodoListCreate(title="Work"), current_user=MOCK_USER, todos_db=mock_db
+        )
+
+        assert len(result.list_id) == 32
+        int(result.list_id, 16)
 
 
 class TestListLists:
@@ -102,18 +131,12 @@ class TestListLists:
     async def test_returns_lists_with_counts(self):
         mock_db = MagicMock()
         mock_db.query = AsyncMock(
-            side_effect=[
-                [_make_db_list("list-1", "Groceries")],
-                [
-                    _make_db_item("list-1", "i1", completed=False),
-                    _make_db_item("list-1", "i2", completed=True, completed_at=CREATED_ISO),
-                    _make_db_item("list-1", "i3", completed=False),
-                ],
-            ]
+            return_value=[_make_db_list("list-1", "Groceries", item_count=3, completed_count=1)]
         )
 
         result = await list_lists(current_user=MOCK_USER, todos_db=mock_db)
 
+        mock_db.query.assert_called_once_with(pk="test@example.com", sk_prefix="LIST#")
         assert len(result) == 1
         assert result[0].title == "Groceries"
         assert result[0].item_count == 3
@@ -122,13 +145,9 @@ class TestListLists:
     async def test_multiple_lists_have_independent_counts(self):
         mock_db = MagicMock()
         mock_db.query = AsyncMock(
-            side_effect=[
-                [_make_db_list("a"), _make_db_list("b", "Work")],
-                [
-                    _make_db_item("a", "i1", completed=True, completed_at=CREATED_ISO),
-                    _make_db_item("b", "i2", completed=False),
-                    _make_db_item("b", "i3", completed=True, completed_at=CREATED_ISO),
-                ],
+            return_value=[
+                _make_db_list("a", item_count=1, completed_count=1),
+                _make_db_list("b", "Work", item_count=2, completed_count=1),
             ]
         )
 
@@ -161,6 +180,7 @@ class TestDeleteList:
         call_args = mock_db.batch_delete.call_args[0][0]
         assert len(call_args) == 3  # 1 list + 2 items
         assert ("test@example.com", "LIST#list-1") in call_args
+        assert mock_db.query.call_args[1]["use_cache"] is False
 
     async def test_deletes_list_with_no_items(self):
         mock_db = MagicMock()
@@ -173,9 +193,55 @@ class TestDeleteList:
         call_args = mock_db.batch_delete.call_args[0][0]
         assert len(call_args) == 1
 
+    async def test_fetches_list_and_items_concurrently(self):
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def _get_item(**kwargs):
+            started.append("get_item")
+            await release.wait()
+            return _make_db_list("list-1")
+
+        async def _query(**kwargs):
+            started.append("query")
+            release.set()
+            return []
+
+        mock_db = MagicMock()
+        mock_db.get_item = AsyncMock(side_effect=_get_item)
+        mock_db.query = AsyncMock(side_effect=_query)
+        mock_db.batch_delete = AsyncMock(return_value=None)
+
+        await delete_list(list_id="list-1", current_user=MOCK_USER, todos_db=mock_db)
+
+        assert started == ["get_item", "query"]
+        mock_db.batch_delete.assert_called_once()
+
+    async def test_failed_lookup_cancels_item_query(self):
+        cancelled = asyncio.Event()
+
+        async def _query(**kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_db = MagicMock()
+        mock_db.get_item = AsyncMock(side_effect=DatabaseError("boom"))
+        mock_db.query = AsyncMock(side_effect=_query)
+        mock_db.batch_delete = AsyncMock(return_value=None)
+
+        with pytest.raises(ExceptionGroup):
+            await delete_list(list_id="list-1", current_user=MOCK_USER, todos_db=mock_db)
+
+        assert cancelled.is_set()
+        mock_db.batch_delete.assert_not_called()
+
     async def test_raises_404_when_list_not_found(self):
         mock_db = MagicMock()
         mock_db.get_item = AsyncMock(return_value=None)
+        mock_db.query = AsyncMock(return_value=[])
 
         with pytest.raises(Exception) as exc_info:
             await delete_list(
@@ -189,8 +255,7 @@ class TestAddItem:
 
     async def test_adds_item_successfully(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=_make_db_list("list-1"))
-        mock_db.query = AsyncMock(return_value=[_make_db_item()])
+        mock_db.increment_counter = AsyncMock(return_value=2)
         mock_db.put_item = AsyncMock(return_value=None)
 
         request = TodoItemCreate(text="Buy eggs")
@@ -203,11 +268,13 @@ class TestAddItem:
         assert result.list_id == "list-1"
         assert result.completed is False
         assert result.sort_order == 1  # one existing item
+        assert mock_db.put_item.call_args[0][0]["sort_order"] == 1
+        assert len(result.item_id) == 32
+        assert "-" not in result.item_id
 
-    async def test_first_item_gets_sort_order_zero(self):
+    async def test_allocates_sort_order_with_server_side_counter(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=_make_db_list("list-1"))
-        mock_db.query = AsyncMock(return_value=[])
+        mock_db.increment_counter = AsyncMock(return_value=1)
         mock_db.put_item = AsyncMock(return_value=None)
 
         request = TodoItemCreate(text="First task")
@@ -217,10 +284,18 @@ class TestAddItem:
         )
 
         assert result.sort_order == 0
+        mock_db.increment_counter.assert_called_once_with(
+            pk="test@example.com", sk="LIST#list-1", field="item_count"
+        )
+        mock_db.get_item.assert_not_called()
+        mock_db.query.assert_not_called()
 
     async def test_raises_404_when_list_not_found(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=None)
+        mock_db.increment_counter = AsyncMock(
+            side_effect=NotFoundError("Item", "test@example.com/LIST#missing")
+        )
+        mock_db.put_item = AsyncMock(return_value=None)
 
         request = TodoItemCreate(text="Orphan item")
         with pytest.raises(Exception) as exc_info:
@@ -229,6 +304,7 @@ class TestAddItem:
                 current_user=MOCK_USER, todos_db=mock_db,
             )
         assert exc_info.value.status_code == 404
+        mock_db.put_item.assert_not_called()
 
 
 class TestListItems:
@@ -265,6 +341,7 @@ class TestListItems:
     async def test_raises_404_when_list_not_found(self):
         mock_db = MagicMock()
         mock_db.get_item = AsyncMock(return_value=None)
+        mock_db.query = AsyncMock(return_value=[])
 
         with pytest.raises(Exception) as exc_info:
             await list_items(
@@ -273,13 +350,29 @@ class TestListItems:
         assert exc_info.value.status_code == 404
 
 
+class TestItemToResponse:
+    """Tests for mapping stored items to responses."""
+
+    def test_matches_validated_model(self):
+        item = _make_db_item(completed=True, completed_at=CREATED_ISO, sort_order=3)
+        item["sort_order"] = Decimal(3)
+
+        result = _item_to_response(item)
+
+        expected = TodoItemResponse.model_validate(
+            {k: v for k, v in item.items() if k not in ("pk", "sk")}
+        )
+        assert result == expected
+        assert type(result.sort_order) is int
+        assert result.model_dump_json() == expected.model_dump_json()
+
+
 class TestUpdateItem:
     """Tests for PATCH /todos/lists/{list_id}/items/{item_id} endpoint."""
 
     async def test_updates_text(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=_make_db_item())
-        mock_db.update_item = AsyncMock(return_value={})
+        mock_db.update_item = AsyncMock(return_value=_make_db_item(text="Buy almond milk"))
 
         request = TodoItemUpdate(text="Buy almond milk")
         result = await update_item(
@@ -289,11 +382,18 @@ class TestUpdateItem:
 
         assert result.text == "Buy almond milk"
         assert result.completed is False
+        mock_db.get_item.assert_not_called()
+        kwargs = mock_db.update_item.call_args[1]
+        assert kwargs["updates"]["text"] == "Buy almond milk"
+        assert kwargs["must_exist"] is True
+        assert "expect_different" not in kwargs
 
     async def test_marks_item_completed_sets_completed_at(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=_make_db_item(completed=False))
-        mock_db.update_item = AsyncMock(return_value={})
+        mock_db.update_item = AsyncMock(
+            return_value=_make_db_item(completed=True, completed_at=CREATED_ISO)
+        )
+        mock_db.increment_counters = AsyncMock(return_value={"completed_count": 1})
 
         request = TodoItemUpdate(completed=True)
         result = await update_item(
@@ -303,16 +403,19 @@ class TestUpdateItem:
 
         assert result.completed is True
         assert result.completed_at is not None
-        updates = mock_db.update_item.call_args[1]["updates"]
-        assert updates["completed"] is True
-        assert updates["completed_at"] is not None
+        kwargs = mock_db.update_item.call_args[1]
+        assert kwargs["updates"]["completed"] is True
+        assert kwargs["updates"]["completed_at"] == kwargs["updates"]["updated_at"]
+        assert kwargs["expect_different"] == {"completed": True}
+        assert kwargs["remove"] is None
+        mock_db.increment_counters.assert_called_once_with(
+            pk="test@example.com", sk="LIST#list-1", amounts={"completed_count": 1}
+        )
 
     async def test_uncompleting_item_clears_completed_at(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(
-            return_value=_make_db_item(completed=True, completed_at=CREATED_ISO)
-        )
-        mock_db.update_item = AsyncMock(return_value={})
+        mock_db.update_item = AsyncMock(return_value=_make_db_item(completed=False))
+        mock_db.increment_counters = AsyncMock(return_value={"completed_count": 0})
 
         request = TodoItemUpdate(completed=False)
         result = await update_item(
@@ -322,12 +425,40 @@ class TestUpdateItem:
 
         assert result.completed is False
         assert result.completed_at is None
-        updates = mock_db.update_item.call_args[1]["updates"]
-        assert updates["completed_at"] is None
+        kwargs = mock_db.update_item.call_args[1]
+        assert kwargs["updates"]["completed"] is False
+        assert "completed_at" not in kwargs["updates"]
+        assert kwargs["remove"] == ["completed_at"]
+        assert kwargs["expect_different"] == {"completed": False}
+        mock_db.increment_counters.assert_called_once_with(
+            pk="test@example.com", sk="LIST#list-1", amounts={"completed_count": -1}
+        )
+
+    async def test_leaves_counters_alone_when_completion_unchanged(self):
+        already_done = _make_db_item(completed=True, completed_at=CREATED_ISO)
+        mock_db = MagicMock()
+        mock_db.update_item = AsyncMock(
+            side_effect=[ConditionFailedError(already_done), already_done]
+        )
+        mock_db.increment_counters = AsyncMock(return_value={})
+
+        request = TodoItemUpdate(text="Still done", completed=True)
+        result = await update_item(
+            list_id="list-1", item_id="item-1", request=request,
+            current_user=MOCK_USER, todos_db=mock_db,
+        )
+
+        assert result.completed_at == datetime.fromisoformat(CREATED_ISO)
+        retry = mock_db.update_item.call_args_list[1][1]
+        assert set(retry["updates"]) == {"updated_at", "text"}
+        assert retry["must_exist"] is True
+        mock_db.increment_counters.assert_not_called()
 
     async def test_raises_404_when_item_not_found(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=None)
+        mock_db.update_item = AsyncMock(
+            side_effect=NotFoundError("Item", "test@example.com/ITEM#list-1#missing")
+        )
 
         request = TodoItemUpdate(text="Updated")
         with pytest.raises(Exception) as exc_info:
@@ -337,28 +468,122 @@ class TestUpdateItem:
             )
         assert exc_info.value.status_code == 404
 
+    async def test_raises_404_when_toggling_missing_item(self):
+        mock_db = MagicMock()
+        mock_db.update_item = AsyncMock(
+            side_effect=NotFoundError("Item", "test@example.com/ITEM#list-1#missing")
+        )
+        mock_db.increment_counters = AsyncMock(return_value={})
+
+        request = TodoItemUpdate(completed=True)
+        with pytest.raises(Exception) as exc_info:
+            await update_item(
+                list_id="list-1", item_id="missing", request=request,
+                current_user=MOCK_USER, todos_db=mock_db,
+            )
+        assert exc_info.value.status_code == 404
+        mock_db.increment_counters.assert_not_called()
+
+    async def test_empty_patch_returns_current_item_without_writing(self):
+        mock_db = MagicMock()
+        mock_db.get_item = AsyncMock(return_value=_make_db_item(text="Buy milk"))
+        mock_db.update_item = AsyncMock()
+
+        result = await update_item(
+            list_id="list-1", item_id="item-1", request=TodoItemUpdate(),
+            current_user=MOCK_USER, todos_db=mock_db,
+        )
+
+        assert result.text == "Buy milk"
+        mock_db.get_item.assert_called_once_with(
+            pk="test@example.com", sk="ITEM#list-1#item-1"
+        )
+        mock_db.update_item.assert_not_called()
+
+    async def test_empty_patch_raises_404_when_item_not_found(self):
+        mock_db = MagicMock()
+        mock_db.get_item = AsyncMock(return_value=None)
+        mock_db.update_item = AsyncMock()
+
+        with pytest.raises(Exception) as exc_info:
+            await update_item(
+                list_id="list-1", item_id="missing", request=TodoItemUpdate(),
+                current_user=MOCK_USER, todos_db=mock_db,
+            )
+        assert exc_info.value.status_code == 404
+        mock_db.update_item.assert_not_called()
+
 
 class TestDeleteItem:
     """Tests for DELETE /todos/lists/{list_id}/items/{item_id} endpoint."""
 
     async def test_deletes_item_successfully(self):
-        item = _make_db_item()
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=item)
-        mock_db.delete_item = AsyncMock(return_value=None)
+        mock_db.delete_item = AsyncMock(return_value=_make_db_item())
+        mock_db.increment_counters = AsyncMock(return_value={})
 
         await delete_item(
             list_id="list-1", item_id="item-1",
             current_user=MOCK_USER, todos_db=mock_db,
         )
 
+        mock_db.get_item.assert_not_called()
         mock_db.delete_item.assert_called_once_with(
-            pk="test@example.com", sk="ITEM#list-1#item-1"
+            pk="test@example.com", sk="ITEM#list-1#item-1", must_exist=True
+        )
+
+    async def test_decrements_list_item_count(self):
+        mock_db = MagicMock()
+        mock_db.delete_item = AsyncMock(return_value=_make_db_item(completed=False))
+        mock_db.increment_counters = AsyncMock(return_value={})
+
+        await delete_item(
+            list_id="list-1", item_id="item-1",
+            current_user=MOCK_USER, todos_db=mock_db,
+        )
+
+        mock_db.increment_counters.assert_called_once_with(
+            pk="test@example.com", sk="LIST#list-1", amounts={"item_count": -1}
+        )
+
+    async def test_decrements_completed_count_for_completed_item(self):
+        mock_db = MagicMock()
+        mock_db.delete_item = AsyncMock(
+            return_value=_make_db_item(completed=True, completed_at=CREATED_ISO)
+        )
+        mock_db.increment_counters = AsyncMock(return_value={})
+
+        await delete_item(
+            list_id="list-1", item_id="item-1",
+            current_user=MOCK_USER, todos_db=mock_db,
+        )
+
+        mock_db.increment_counters.assert_called_once_with(
+            pk="test@example.com",
+            sk="LIST#list-1",
+            amounts={"item_count": -1, "completed_count": -1},
         )
 
+    async def test_ignores_missing_list_when_decrementing(self):
+        mock_db = MagicMock()
+        mock_db.delete_item = AsyncMock(return_value=_make_db_item())
+        mock_db.increment_counters = AsyncMock(
+            side_effect=NotFoundError("Item", "test@example.com/LIST#list-1")
+        )
+
+        await delete_item(
+            list_id="list-1", item_id="item-1",
+            current_user=MOCK_USER, todos_db=mock_db,
+        )
+
+        mock_db.delete_item.assert_called_once()
+
     async def test_raises_404_when_item_not_found(self):
         mock_db = MagicMock()
-        mock_db.get_item = AsyncMock(return_value=None)
+        mock_db.delete_item = AsyncMock(
+            side_effect=NotFoundError("Item", "test@example.com/ITEM#list-1#missing")
+        )
+        mock_db.increment_counters = AsyncMock(return_value={})
 
         with pytest.raises(Exception) as exc_info:
             await delete_item(
@@ -366,3 +591,4 @@ class TestDeleteItem:
                 current_user=MOCK_USER, todos_db=mock_db,
             )
         assert exc_info.value.status_code == 404
+        mock_db.increment_counters.assert_not_called()
@@ -1,5 +1,8 @@
 """Unit tests for all tools."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 
 from deepthought.tools.math_ops import (
@@ -17,6 +20,9 @@ from deepthought.tools.verification import (
     verify_division,
 )
 from deepthought.tools.formatting import format_json
+from deepthought.config import get_settings
+from deepthought.db import get_table_client
+from deepthought.tools.database import _GetItemCoalescer, _pairs_coalescer, query_dynamodb
 
 
 class TestMultiplyValuesTool:
@@ -338,3 +344,69 @@ class TestFormatJsonTool:
         assert result["success"] is False
         assert result["verification"]["passed"] is False
         assert result["verification"]["status"] == "failed"
+
+
+class TestQueryDynamoDBTool:
+    """Tests for query_dynamodb and its lookup coalescer."""
+
+    async def test_concurrent_lookups_share_one_batch_get(self):
+        mock_db = MagicMock()
+        mock_db.connect = AsyncMock()
+        mock_db.batch_get = AsyncMock(
+            return_value=[
+                {"pk": "a", "sk": "1", "val1": 1},
+                {"pk": "b", "sk": "2", "val1": 2},
+            ]
+        )
+        coalescer = _GetItemCoalescer(mock_db)
+
+        results = await asyncio.gather(
+            coalescer.get("a", "1"), coalescer.get("b", "2"),
+            coalescer.get("a", "1"), coalescer.get("c", "3"),
+        )
+
+        mock_db.connect.assert_awaited_once()
+        mock_db.batch_get.assert_awaited_once_with([("a", "1"), ("b", "2"), ("c", "3")])
+        assert results[0] == results[2] == {"pk": "a", "sk": "1", "val1": 1}
+        assert results[0] is not results[2]
+        assert results[1]["val1"] == 2
+        assert results[3] is None
+
+    async def test_sequential_lookups_flush_separately(self):
+        mock_db = MagicMock()
+        mock_db.connect = AsyncMock()
+        mock_db.batch_get = AsyncMock(return_value=[])
+        coalescer = _GetItemCoalescer(mock_db)
+
+        assert await coalescer.get("a", "1") is None
+        assert await coalescer.get("a", "2") is None
+
+        assert mock_db.batch_get.await_count == 2
+
+    async def test_batch_failure_reaches_every_waiter(self):
+        mock_db = MagicMock()
+        mock_db.connect = AsyncMock()
+        mock_db.batch_get = AsyncMock(side_effect=RuntimeError("boom"))
+        coalescer = _GetItemCoalescer(mock_db)
+
+        results = await asyncio.gather(
+            coalescer.get("a", "1"), coalescer.get("b", "2"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_coalescer_shares_the_pairs_table_client(self):
+        _pairs_coalescer.cache_clear()
+
+        coalescer = _pairs_coalescer()
+
+        assert coalescer._client is get_table_client(get_settings().dynamodb_pairs_table)
+
+    @patch("deepthought.tools.database._pairs_coalescer")
+    async def test_tool_uses_shared_coalescer(self, mock_coalescer):
+        mock_coalescer.return_value.get = AsyncMock(return_value={"pk": "a", "sk": "1"})
+
+        result = await query_dynamodb.ainvoke({"pk": "a", "sk": "1"})
+
+        assert result == {"pk": "a", "sk": "1"}
+        mock_coalescer.return_value.get.assert_awaited_once_with(pk="a", sk="1")